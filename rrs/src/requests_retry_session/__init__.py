@@ -35,6 +35,61 @@ Created on Nov 2, 2020
 @maintainer: Mitch Harding
 """
 
+from .adapter_registry import (
+    shared_adapter_registry,
+    AdapterRegistry,
+    SharedAdapter,
+)
+from .adaptive_timeout import (
+    AdaptiveTimeout,
+    LatencyEstimate,
+)
+from .backoff import BackoffStrategyType
+from .bulkhead import (
+    Bulkhead,
+    BulkheadFull,
+    BulkheadStats,
+    HostConcurrency,
+)
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpen,
+    CircuitStateType,
+    CircuitStatus,
+)
+from .connection_lifetime import (
+    ConnectionLifetimePolicy,
+    ConnectionPoolStats,
+)
+from .deadline import (
+    DeadlineExceeded,
+    TotalTimeout,
+)
+from .downloads import (
+    resumable_download,
+    DownloadNotResumable,
+    DownloadOutcome,
+)
+from .fan_out import (
+    map_requests,
+    RequestOutcome,
+    RequestSpec,
+)
+from .hedging import HedgingPolicy
+from .metrics import (
+    EndpointMetrics,
+    LatencyHistogram,
+    RetryMetrics,
+)
+from .prewarm import (
+    prewarm_session,
+    PrewarmOutcome,
+)
+from .rate_limiter import (
+    RateLimited,
+    RateLimiter,
+    RateLimiterStats,
+)
 from .requests_retry_session import (
     requests_retry_adapter,
     requests_retry_session,
@@ -44,20 +99,117 @@ from .requests_retry_session import (
     RequestsRetryAdapterArgs,
     StatusForcelistType,
 )
+from .response_cache import (
+    CacheStats,
+    ResponseCache,
+)
+from .retry_after_pause import (
+    RetryAfterPause,
+    RetryAfterPauseStats,
+)
+from .retry_budget import (
+    RetryBudget,
+    RetryBudgetStats,
+)
+from .retry_events import (
+    RetryEvent,
+    RetryEventHook,
+    RetryEventKindType,
+)
+from .retry_log_aggregator import RetryLogAggregator
+from .retry_scheduler import (
+    RetryScheduler,
+    RetrySchedulerStats,
+)
 from .retry_session_manager import (
     retry_session_manager,
     RetrySessionManager,
 )
+from .retry_with_logs import log_retry_event
+from .single_flight import (
+    SingleFlight,
+    SingleFlightStats,
+)
+from .stale_connections import (
+    StaleConnectionPolicy,
+    StaleConnectionStats,
+)
+from .thread_safe_retry_session_manager import (
+    SessionModeType,
+    ThreadSafeRetrySessionManager,
+)
+from .tls_sessions import (
+    create_ssl_context,
+    shared_ssl_context,
+    ResumingSSLContext,
+    TlsSessionStats,
+)
 
 # Explicit exports
 __all__ = [
+    "create_ssl_context",
+    "log_retry_event",
+    "map_requests",
+    "prewarm_session",
+    "resumable_download",
+    "shared_adapter_registry",
+    "shared_ssl_context",
     "requests_retry_adapter",
     "requests_retry_session",
     "requests_session",
     "retry_session_manager",
+    "AdapterRegistry",
+    "AdaptiveTimeout",
     "AllowedMethodsType",
+    "CacheStats",
+    "BackoffStrategyType",
+    "Bulkhead",
+    "BulkheadFull",
+    "BulkheadStats",
+    "CircuitBreaker",
+    "CircuitOpen",
+    "CircuitStateType",
+    "CircuitStatus",
+    "ConnectionLifetimePolicy",
+    "ConnectionPoolStats",
+    "DeadlineExceeded",
+    "DownloadNotResumable",
+    "DownloadOutcome",
+    "EndpointMetrics",
+    "HedgingPolicy",
+    "HostConcurrency",
+    "LatencyEstimate",
+    "LatencyHistogram",
+    "PrewarmOutcome",
     "ProtocolType",
+    "RateLimited",
+    "RateLimiter",
+    "RateLimiterStats",
+    "RequestOutcome",
+    "RequestSpec",
     "RequestsRetryAdapterArgs",
+    "ResponseCache",
+    "ResumingSSLContext",
+    "RetryAfterPause",
+    "RetryAfterPauseStats",
+    "RetryBudget",
+    "RetryBudgetStats",
+    "RetryEvent",
+    "RetryEventHook",
+    "RetryEventKindType",
+    "RetryLogAggregator",
+    "RetryMetrics",
+    "RetryScheduler",
+    "RetrySchedulerStats",
     "RetrySessionManager",
+    "SessionModeType",
+    "SharedAdapter",
+    "SingleFlight",
+    "SingleFlightStats",
+    "StaleConnectionPolicy",
+    "StaleConnectionStats",
     "StatusForcelistType",
+    "ThreadSafeRetrySessionManager",
+    "TlsSessionStats",
+    "TotalTimeout",
 ]
@@ -0,0 +1,296 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+AdapterRegistry class, for sharing retry adapters (and their connection pools)
+between callers that use the same configuration
+"""
+
+from __future__ import annotations
+
+from collections.abc import Set
+from dataclasses import dataclass
+import inspect
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+import weakref
+
+from requests.adapters import BaseAdapter
+
+from .requests_retry_session import requests_retry_adapter
+from .typing_imports import Iterable
+from .utils import NOT_PASSED, validate_positive_number
+
+if TYPE_CHECKING:
+    from requests import PreparedRequest, Response
+
+    from .requests_retry_session import RequestsRetryAdapterArgs
+    from .timeout_http_adapter import (
+        CertType,
+        ProxiesType,
+        TimeoutHTTPAdapter,
+        TimeoutType,
+        VerifyType,
+    )
+    from .typing_imports import Unpack
+    from .utils import NotPassed
+
+    type AdapterConfigKey = tuple[tuple[str, object], ...]
+
+
+# How long (in seconds) an adapter that no one is using is kept open
+# before it is closed
+DEFAULT_IDLE_TIMEOUT = 60.0
+
+_REQUESTS_RETRY_ADAPTER_SIGNATURE = inspect.signature(requests_retry_adapter)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _freeze(value: object) -> object:
+    """
+    Return a hashable equivalent of the specified argument value. Sets become frozensets
+    and other non-string iterables become tuples, so that equivalent configurations
+    produce equal keys.
+    """
+    if isinstance(value, (str, bytes)):
+        return value
+    if isinstance(value, Set):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, Iterable):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def adapter_config_key(adapter_kwargs: RequestsRetryAdapterArgs) -> AdapterConfigKey:
+    """
+    Return a hashable key representing the adapter that requests_retry_adapter would create
+    from the specified arguments. Default values are filled in, so that (for example) not
+    specifying retries results in the same key as specifying DEFAULT_RETRIES.
+    Raises TypeError if the arguments are invalid or cannot be made hashable.
+    """
+    bound = _REQUESTS_RETRY_ADAPTER_SIGNATURE.bind(**adapter_kwargs)
+    bound.apply_defaults()
+    key = tuple(sorted((name, _freeze(value)) for name, value in bound.arguments.items()))
+    try:
+        hash(key)
+    except TypeError as err:
+        raise TypeError(f"Adapter arguments cannot be used as a registry key: {err}") from err
+    return key
+
+
+@dataclass(slots=True)
+class _RegistryEntry:
+    """
+    A shared adapter, the number of handles to it that are still open, and
+    (if there are none) when the last one was closed
+    """
+    adapter: TimeoutHTTPAdapter
+    refcount: int = 0
+    idle_since: float | None = None
+
+
+class SharedAdapter(BaseAdapter):
+    """
+    A handle to an adapter owned by an AdapterRegistry. Requests are sent using the shared
+    adapter, but closing the handle only releases it (once, no matter how many times close is
+    called, since a session calls close on its adapter once per mounted protocol). The shared
+    adapter itself is closed by the registry, once it has no handles and has been idle long enough.
+    """
+
+    def __init__(self, registry: AdapterRegistry, key: AdapterConfigKey, adapter: TimeoutHTTPAdapter) -> None:
+        super().__init__()
+        self._registry = registry
+        self._key = key
+        self._adapter: TimeoutHTTPAdapter | None = adapter
+
+    @property
+    def adapter(self) -> TimeoutHTTPAdapter:
+        """
+        Returns the shared adapter. Raises ValueError if this handle has been closed.
+        """
+        if self._adapter is None:
+            raise ValueError("Shared adapter handle has been closed")
+        return self._adapter
+
+    def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            request: PreparedRequest,
+            stream: bool | NotPassed = NOT_PASSED,
+            timeout: TimeoutType = None,
+            verify: VerifyType | NotPassed = NOT_PASSED,
+            cert: CertType | NotPassed = NOT_PASSED,
+            proxies: ProxiesType | NotPassed = NOT_PASSED) -> Response:
+        return self.adapter.send(request, stream=stream, timeout=timeout, verify=verify,
+                                 cert=cert, proxies=proxies)
+
+    def close(self) -> None:
+        if self._adapter is not None:
+            self._adapter = None
+            self._registry.release(self._key)
+
+
+class AdapterRegistry:
+    """
+    A thread safe registry of retry adapters, keyed by their configuration.
+
+    Every acquire call with equivalent arguments returns a handle to the same adapter, so
+    callers that create sessions per operation still reuse warm TCP/TLS connections. The
+    registry counts the open handles to each adapter; once none remain, the adapter is kept
+    for idle_timeout seconds (so the next caller finds its connections still open) before it is
+    closed. Idle adapters are evicted whenever the registry is used, or by calling evict_idle.
+    If the registry may go unused for a while, either call evict_idle periodically, or set
+    reap_interval, so that a background thread calls it every reap_interval seconds (otherwise
+    idle adapters hold on to their connections until the registry is next used). The thread is
+    stopped by close(), or once the registry is no longer referenced.
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT, reap_interval: float | None = None) -> None:
+        if idle_timeout < 0:
+            raise ValueError(f"idle_timeout must not be negative, not {idle_timeout}")
+        if reap_interval is not None:
+            validate_positive_number("reap_interval", reap_interval)
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._entries: dict[AdapterConfigKey, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def acquire(self, **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]) -> SharedAdapter:
+        """
+        Return a handle to the shared adapter for the specified requests_retry_adapter
+        arguments, creating the adapter if needed (and starting the reaper thread, if it has not
+        started yet). Close the handle when done with it.
+        """
+        key = adapter_config_key(adapter_kwargs)
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _RegistryEntry(adapter=requests_retry_adapter(**adapter_kwargs))
+                self._entries[key] = entry
+            entry.refcount += 1
+            entry.idle_since = None
+            self._start_reaper()
+            return SharedAdapter(self, key, entry.adapter)
+
+    def _start_reaper(self) -> None:
+        """
+        Start the reaper thread, if there should be one and it has not started yet.
+        Must be called with the lock held.
+        """
+        if self.reap_interval is None or self._reaper is not None or self._stop.is_set():
+            return
+        self._reaper = threading.Thread(target=_evict_periodically,
+                                        args=(weakref.ref(self), self.reap_interval, self._stop),
+                                        name="AdapterRegistry reaper", daemon=True)
+        self._reaper.start()
+
+    def release(self, key: AdapterConfigKey) -> None:
+        """
+        Release one reference to the adapter with the specified key.
+        Normally this is called by SharedAdapter.close, rather than directly.
+        """
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None and entry.refcount > 0:
+                entry.refcount -= 1
+                if entry.refcount == 0:
+                    entry.idle_since = now
+            self._evict_idle(now)
+
+    def evict_idle(self) -> int:
+        """
+        Close and remove every unreferenced adapter that has been idle for at least
+        idle_timeout seconds. Returns the number of adapters evicted.
+        """
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def _evict_idle(self, now: float) -> int:
+        """
+        Must be called with the lock held
+        """
+        expired = [key for key, entry in self._entries.items()
+                   if entry.idle_since is not None and now - entry.idle_since >= self.idle_timeout]
+        for key in expired:
+            self._entries.pop(key).adapter.close()
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        Stop the reaper thread (if it is running), and close and remove every adapter, whether
+        or not there are still open handles to it.
+        """
+        self._stop.set()
+        with self._lock:
+            reaper, self._reaper = self._reaper, None
+            entries, self._entries = self._entries, {}
+        if reaper is not None and reaper is not threading.current_thread():
+            reaper.join()
+        for entry in entries.values():
+            entry.adapter.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of adapters currently held by the registry
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+def _evict_periodically(registry_ref: weakref.ref[AdapterRegistry], interval: float,
+                        stop: threading.Event) -> None:
+    """
+    The reaper thread of a registry, which only holds a weak reference to it, so that it stops
+    once the registry is no longer referenced
+    """
+    while not stop.wait(interval):
+        registry = registry_ref()
+        if registry is None:
+            return
+        try:
+            registry.evict_idle()
+        except Exception:  # pylint: disable=broad-exception-caught
+            LOGGER.exception("Error evicting idle adapters")
+        del registry
+
+
+_shared_adapter_registry: AdapterRegistry | None = None
+_shared_adapter_registry_lock = threading.Lock()
+
+
+def shared_adapter_registry() -> AdapterRegistry:
+    """
+    Returns the process-wide AdapterRegistry, creating it if needed
+    """
+    global _shared_adapter_registry
+    with _shared_adapter_registry_lock:
+        if _shared_adapter_registry is None:
+            _shared_adapter_registry = AdapterRegistry()
+        return _shared_adapter_registry
@@ -0,0 +1,191 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+AdaptiveTimeout class: per-host read timeouts derived from the observed latencies of each host
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from .deadline import split_timeout
+from .utils import validate_positive_int, validate_positive_number
+
+if TYPE_CHECKING:
+    from .deadline import AttemptTimeoutType, RequestTimeoutType
+
+
+DEFAULT_ALPHA = 0.125
+DEFAULT_BETA = 0.25
+DEFAULT_DEVIATIONS = 4.0
+DEFAULT_MIN_SAMPLES = 10
+DEFAULT_MULTIPLIER = 2.0
+DEFAULT_READ_TIMEOUT_FLOOR = 0.1
+
+
+class LatencyEstimate(NamedTuple):
+    """
+    mean: The smoothed (EWMA) latency, in seconds
+    deviation: The smoothed mean deviation of the latency, in seconds
+    samples: The number of latencies (and timeouts) observed
+    """
+    mean: float
+    deviation: float
+    samples: int
+
+
+@dataclass(slots=True)
+class _Estimate:
+    """
+    The mutable latency estimate for one host
+    """
+    mean: float = 0.0
+    deviation: float = 0.0
+    samples: int = 0
+
+
+class AdaptiveTimeout:
+    """
+    Keeps a streaming estimate of the latency of each host (see host_key), in the same way as
+    TCP estimates round trip times: an exponentially weighted moving average of the latency
+    (with weight alpha), and of its deviation from that average (with weight beta). Their sum,
+    with deviations times the deviation, is an estimate of a high percentile of the latency.
+
+    Once min_samples latencies have been observed for a host, the read timeout of each attempt
+    to it is multiplier times that estimate, clamped between floor and ceiling (or the read
+    timeout that would otherwise be used, whichever is lower). So slow attempts to fast hosts
+    time out, and are retried, much sooner. Each attempt which times out is observed as
+    a latency equal to its timeout, so the timeouts of a host which slows down grow again.
+
+    An adaptive timeout is passed to requests_retry_adapter (and the other entry points) as the
+    adaptive_timeout argument. The same object may be shared by several adapters and threads.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            *,
+            multiplier: float = DEFAULT_MULTIPLIER,
+            floor: float = DEFAULT_READ_TIMEOUT_FLOOR,
+            ceiling: float | None = None,
+            min_samples: int = DEFAULT_MIN_SAMPLES,
+            alpha: float = DEFAULT_ALPHA,
+            beta: float = DEFAULT_BETA,
+            deviations: float = DEFAULT_DEVIATIONS) -> None:
+        validate_positive_number("multiplier", multiplier)
+        validate_positive_number("floor", floor)
+        if ceiling is not None:
+            validate_positive_number("ceiling", ceiling)
+            if ceiling < floor:
+                raise ValueError(f"ceiling ({ceiling}) must be no less than floor ({floor})")
+        validate_positive_int("min_samples", min_samples)
+        for name, weight in (("alpha", alpha), ("beta", beta)):
+            validate_positive_number(name, weight)
+            if weight > 1:
+                raise ValueError(f"{name} must be no greater than 1, not {weight}")
+        validate_positive_number("deviations", deviations)
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.alpha = alpha
+        self.beta = beta
+        self.deviations = deviations
+        self._lock = threading.Lock()
+        self._estimates: dict[str, _Estimate] = {}
+
+    def read_timeout(self, key: str, default: float | None) -> float | None:
+        """
+        Returns the read timeout for an attempt to the host with the specified key, given
+        the read timeout which would otherwise be used
+        """
+        with self._lock:
+            estimate = self._estimates.get(key)
+            if estimate is None or estimate.samples < self.min_samples:
+                return default
+            high = estimate.mean + self.deviations * estimate.deviation
+        timeout = max(self.floor, self.multiplier * high)
+        for ceiling in (self.ceiling, default):
+            if ceiling is not None:
+                timeout = min(timeout, ceiling)
+        return timeout
+
+    def attempt_timeout(self, key: str, timeout: RequestTimeoutType | AttemptTimeoutType) -> AttemptTimeoutType:
+        """
+        Returns the (connect, read) timeouts for an attempt to the host with the specified key,
+        given the requests-style timeout which would otherwise be used
+        """
+        connect, read = split_timeout(timeout)
+        return connect, self.read_timeout(key, read)
+
+    def record(self, key: str, latency: float) -> None:
+        """
+        Record the latency of an attempt to the host with the specified key
+        """
+        with self._lock:
+            estimate = self._estimates.get(key)
+            if estimate is None:
+                estimate = _Estimate()
+                self._estimates[key] = estimate
+            if estimate.samples:
+                estimate.deviation += self.beta * (abs(estimate.mean - latency) - estimate.deviation)
+                estimate.mean += self.alpha * (latency - estimate.mean)
+            else:
+                estimate.mean, estimate.deviation = latency, latency / 2
+            estimate.samples += 1
+
+    def record_timeout(self, key: str) -> None:
+        """
+        Record an attempt to the host with the specified key which timed out. If its read timeout
+        was adaptive, that is recorded as its latency; otherwise, the timeout is ignored.
+        """
+        timeout = self.read_timeout(key, None)
+        if timeout is not None:
+            self.record(key, timeout)
+
+    def estimate(self, key: str) -> LatencyEstimate | None:
+        """
+        Returns the latency estimate for the host with the specified key, if it has one
+        """
+        with self._lock:
+            estimate = self._estimates.get(key)
+            if estimate is None:
+                return None
+            return LatencyEstimate(mean=estimate.mean, deviation=estimate.deviation, samples=estimate.samples)
+
+    def reset(self, key: str | None = None) -> None:
+        """
+        Discard the estimate for the host with the specified key, or for every host
+        """
+        with self._lock:
+            if key is None:
+                self._estimates.clear()
+            else:
+                self._estimates.pop(key, None)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(multiplier={self.multiplier}, floor={self.floor}, "
+                f"ceiling={self.ceiling}, min_samples={self.min_samples})")
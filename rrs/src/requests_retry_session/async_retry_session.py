@@ -0,0 +1,724 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+AsyncRetrySession class: an asyncio counterpart of requests_retry_session, built on aiohttp.
+
+This module requires the optional aiohttp dependency (requests-retry-session[async]), so it
+is not imported by the package itself:
+
+    from requests_retry_session.async_retry_session import async_retry_session_manager
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import errno
+import ssl
+import sys
+import time
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import urlsplit
+
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+    ReadTimeout,
+    RetryError,
+)
+from urllib3.connectionpool import connection_from_url
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError as Urllib3HTTPError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+    ResponseError,
+)
+from urllib3.response import HTTPResponse
+
+from .circuit_breaker import is_circuit_open, CircuitOpen
+from .deadline import (
+    is_deadline_exceeded,
+    using_deadline,
+    Deadline,
+    DeadlineExceeded,
+    DeadlineExceededError,
+    TotalTimeout,
+)
+from .backoff import DEFAULT_BACKOFF_MAX, DEFAULT_BACKOFF_STRATEGY
+from .metrics import start_next_attempt
+from .rate_limiter import is_rate_limited, RateLimited, RateLimitedError
+from .retry_after_pause import using_retry_after_pause
+from .retry_with_logs import take_budget_denial
+from .requests_retry_session import (
+    requests_retry,
+    validate_adapter_args,
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PROTOCOL,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_STATUS_FORCELIST,
+    DEFAULT_TOTAL_TIMEOUT,
+)
+from .stale_connections import active_checkout, using_stale_connection_policy, StaleConnectionCheckout
+from .tls_sessions import shared_ssl_context
+from .typing_imports import Iterable, Mapping, Sequence
+from .utils import host_key, pool_host_key, NotPassed, NOT_PASSED
+
+try:
+    import aiohttp
+except ImportError as _err:
+    raise ImportError("The async retry session requires aiohttp: "
+                      "install requests-retry-session[async]") from _err
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace, TracebackType
+    from typing import Any, Type
+
+    from urllib3.connectionpool import HTTPConnectionPool
+
+    from .adaptive_timeout import AdaptiveTimeout
+    from .backoff import BackoffStrategyType
+    from .bulkhead import Bulkhead
+    from .circuit_breaker import CircuitBreaker
+    from .connection_lifetime import ConnectionLifetimePolicy
+    from .deadline import AttemptTimeoutType
+    from .hedging import HedgingPolicy
+    from .rate_limiter import RateLimiter
+    from .metrics import RetryMetrics
+    from .response_cache import ResponseCache
+    from .single_flight import SingleFlight
+    from .stale_connections import StaleConnectionPolicy
+    from .retry_after_pause import RetryAfterPause
+    from .retry_budget import RetryBudget
+    from .retry_events import RetryEventHook
+    from .requests_retry_session import (
+        AllowedMethodsType,
+        ProtocolType,
+        RequestsRetryAdapterArgs,
+        StatusForcelistType,
+    )
+    from .retry_with_logs import RetryWithLogs
+    from .typing_imports import AsyncIterator, Self, Unpack
+
+    type AsyncTimeoutType = float | tuple[float, float] | tuple[float, None] | None
+    type AsyncVerifyType = bool | str
+
+
+# The aiohttp exceptions that are treated the way urllib3 treats connection
+# errors (these may be retried regardless of the request method)
+_CONNECT_ERRORS = (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError)
+# The aiohttp exceptions that are treated the way urllib3 treats read errors
+# (these are only retried for allowed methods)
+_READ_ERRORS = (aiohttp.ServerTimeoutError, aiohttp.ServerDisconnectedError,
+                aiohttp.ClientOSError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+# The errnos of aiohttp.ClientOSError which mean that the server closed (or reset) the connection
+_STALE_CONNECTION_ERRNOS = frozenset({errno.ECONNRESET, errno.ECONNABORTED, errno.EPIPE})
+
+
+class _AsyncSettings(NamedTuple):
+    """
+    The async session equivalent of a TimeoutHTTPAdapter
+    """
+    retry: RetryWithLogs
+    timeout: AttemptTimeoutType
+    total_timeout: float | None
+    limit_per_host: int
+    hedging: HedgingPolicy | None
+    stale_connections: StaleConnectionPolicy | None
+    keepalive_timeout: float | None
+    ssl_context: ssl.SSLContext | None
+    rate_limiter: RateLimiter | None
+    retry_after_pause: RetryAfterPause | None
+
+
+def _unsupported(name: str, reason: str) -> ValueError:
+    """
+    Returns the exception to raise for an adapter argument which async sessions do not support
+    """
+    return ValueError(f"{name} is not supported by async sessions ({reason})")
+
+
+def _async_settings(  # pylint: disable=too-many-arguments,too-many-locals
+        *,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        status_forcelist: StatusForcelistType = DEFAULT_STATUS_FORCELIST,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        allowed_methods: AllowedMethodsType | NotPassed = NOT_PASSED,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOL_BLOCK,
+        total_timeout: float | None = DEFAULT_TOTAL_TIMEOUT,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        metrics: RetryMetrics | None = None,
+        event_hooks: Sequence[RetryEventHook] | None = None,
+        hedging: HedgingPolicy | None = None,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        stale_connections: StaleConnectionPolicy | None = None,
+        connection_lifetime: ConnectionLifetimePolicy | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        rate_limiter: RateLimiter | None = None,
+        bulkhead: Bulkhead | None = None,
+        retry_after_pause: RetryAfterPause | None = None,
+        backoff_strategy: BackoffStrategyType = DEFAULT_BACKOFF_STRATEGY,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        backoff_seed: int | None = None
+) -> _AsyncSettings:
+    """
+    Interpret the requests_retry_adapter arguments for an async session.
+
+    aiohttp does not distinguish between the number of open connections and the number of
+    connections kept for reuse, so pool_maxsize only limits the connections per host when
+    pool_block is True (that is, when requests would also wait for a free connection).
+    ValueError is raised if a cache or single_flight is specified, since aiohttp responses cannot
+    be stored and replayed, or copied for the requests sharing one, and likewise if pool_connections
+    is not the default, since it has no aiohttp equivalent. The max_idle of stale_connections and
+    connection_lifetime (the lower, if both are set) is the keep-alive timeout of the connector;
+    ValueError is raised if connection_lifetime has a max_lifetime or reap_interval, since aiohttp
+    connections cannot be closed once they are too old, or reaped in the background.
+    ssl_context is used for requests with verify=True, but asyncio does not make its connections
+    through SSLContext.wrap_socket, so a ResumingSSLContext does not resume TLS sessions for them.
+    A bulkhead blocks the thread waiting for room, so ValueError is raised if one is specified
+    (pool_maxsize with pool_block=True is the static equivalent of its per-host limit).
+    """
+    validate_adapter_args({"pool_connections": pool_connections,
+                           "pool_maxsize": pool_maxsize,
+                           "pool_block": pool_block,
+                           "total_timeout": total_timeout,
+                           "adaptive_timeout": adaptive_timeout,
+                           "circuit_breaker": circuit_breaker,
+                           "retry_budget": retry_budget,
+                           "metrics": metrics,
+                           "event_hooks": event_hooks,
+                           "hedging": hedging,
+                           "cache": cache,
+                           "single_flight": single_flight,
+                           "stale_connections": stale_connections,
+                           "connection_lifetime": connection_lifetime,
+                           "ssl_context": ssl_context,
+                           "rate_limiter": rate_limiter,
+                           "bulkhead": bulkhead,
+                           "retry_after_pause": retry_after_pause,
+                           "backoff_strategy": backoff_strategy,
+                           "backoff_max": backoff_max,
+                           "backoff_seed": backoff_seed})
+    if pool_connections != DEFAULT_POOL_CONNECTIONS:
+        raise _unsupported("pool_connections", "aiohttp does not limit the number of hosts whose connections it keeps")
+    if connection_lifetime is not None and connection_lifetime.max_lifetime is not None:
+        raise _unsupported("connection_lifetime max_lifetime", "aiohttp connections cannot be closed once too old")
+    if connection_lifetime is not None and connection_lifetime.reap_interval is not None:
+        raise _unsupported("connection_lifetime reap_interval", "aiohttp idle connections cannot be reaped")
+    if cache is not None:
+        raise _unsupported("cache", "aiohttp responses cannot be stored and replayed")
+    if single_flight is not None:
+        raise _unsupported("single_flight", "aiohttp responses cannot be copied")
+    if bulkhead is not None:
+        raise _unsupported("bulkhead", "it blocks the event loop while waiting for room; "
+                                       "use pool_maxsize with pool_block=True to limit the requests to each host")
+    retry = requests_retry(retries=retries,
+                           backoff_factor=backoff_factor,
+                           status_forcelist=status_forcelist,
+                           allowed_methods=allowed_methods,
+                           adaptive_timeout=adaptive_timeout,
+                           circuit_breaker=circuit_breaker,
+                           retry_budget=retry_budget,
+                           metrics=metrics,
+                           event_hooks=event_hooks,
+                           backoff_strategy=backoff_strategy,
+                           backoff_max=backoff_max,
+                           backoff_seed=backoff_seed)
+    max_idles = [policy.max_idle for policy in (stale_connections, connection_lifetime)
+                 if policy is not None and policy.max_idle is not None]
+    return _AsyncSettings(retry=retry,
+                          timeout=(connect_timeout, read_timeout),
+                          total_timeout=total_timeout,
+                          limit_per_host=pool_maxsize if pool_block else 0,
+                          hedging=hedging,
+                          stale_connections=stale_connections,
+                          keepalive_timeout=min(max_idles) if max_idles else None,
+                          ssl_context=ssl_context,
+                          rate_limiter=rate_limiter,
+                          retry_after_pause=retry_after_pause)
+
+
+def _client_timeout(timeout: AsyncTimeoutType | AttemptTimeoutType,
+                    deadline: Deadline | None = None) -> aiohttp.ClientTimeout:
+    """
+    Convert a requests-style timeout to an aiohttp one, shortened as needed to end at the deadline
+    """
+    if timeout is None and deadline is None:
+        return aiohttp.ClientTimeout(total=None)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    if deadline is not None:
+        connect, read = deadline.clamp(connect), deadline.clamp(read)
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+def _is_stale_connection(err: Exception) -> bool:
+    """
+    Returns True if the specified aiohttp exception means that the connection was closed
+    (or reset) before any of the response was received
+    """
+    if isinstance(err, aiohttp.ServerDisconnectedError):
+        return True
+    return isinstance(err, aiohttp.ClientOSError) and err.errno in _STALE_CONNECTION_ERRNOS
+
+
+async def _on_connection_reuse(_session: aiohttp.ClientSession,
+                               context: SimpleNamespace,
+                               _params: aiohttp.TraceConnectionReuseconnParams) -> None:
+    """
+    aiohttp trace hook, which records that the attempt reused a pooled connection
+    """
+    checkout = context.trace_request_ctx
+    if isinstance(checkout, StaleConnectionCheckout):
+        checkout.reused = True
+
+
+def _ssl_arg(verify: AsyncVerifyType, ssl_context: ssl.SSLContext | None) -> ssl.SSLContext | bool:
+    """
+    Convert a requests-style verify argument to an aiohttp ssl argument. The SSL context for a
+    CA bundle is shared, so that the bundle is only loaded once.
+    """
+    if isinstance(verify, str):
+        return shared_ssl_context(verify)
+    if verify is True and ssl_context is not None:
+        return ssl_context
+    return verify
+
+
+def _query_items(params: Mapping[str, Any]) -> list[tuple[str, str]]:
+    """
+    Convert requests-style query parameters (where a value may be a sequence, meaning the
+    parameter is repeated, or None, meaning it is omitted) to a list of pairs for aiohttp
+    """
+    items: list[tuple[str, str]] = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            value = (value,)
+        items.extend((key, v.decode() if isinstance(v, bytes) else str(v)) for v in value if v is not None)
+    return items
+
+
+def _urllib3_error(err: Exception, pool: HTTPConnectionPool, url: str) -> Urllib3HTTPError:
+    """
+    Return the urllib3 exception corresponding to the specified aiohttp exception,
+    so that the RetryWithLogs logic applies to it in the same way
+    """
+    if isinstance(err, aiohttp.ConnectionTimeoutError):
+        return ConnectTimeoutError(pool, f"Connection to {pool.host} timed out: {err}")
+    if isinstance(err, aiohttp.ClientConnectorError):
+        # In urllib3 1.26, the first argument is the pool rather than the connection,
+        # but it is only used in the exception message
+        conn = pool.ConnectionCls(host=pool.host, port=pool.port)
+        msg = f"Failed to establish a new connection: {err}"
+        return NewConnectionError(conn, msg)  # type: ignore[arg-type,unused-ignore]
+    if isinstance(err, (aiohttp.ServerTimeoutError, asyncio.TimeoutError)):
+        return ReadTimeoutError(pool, url, f"Read timed out: {err}")
+    return ProtocolError("Connection aborted.", err)
+
+
+async def _first_response(
+        attempts: Sequence[asyncio.Future[aiohttp.ClientResponse]]) -> asyncio.Future[aiohttp.ClientResponse]:
+    """
+    Wait for the first of the attempts to return a response, and return it (or the first attempt,
+    if all of them fail)
+    """
+    pending = set(attempts)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for attempt in attempts:
+            if attempt in done and attempt.exception() is None:
+                return attempt
+    return attempts[0]
+
+
+def _release_response(attempt: asyncio.Future[aiohttp.ClientResponse]) -> None:
+    """
+    Release the response of a losing attempt, if it got one
+    """
+    if not attempt.cancelled() and attempt.exception() is None:
+        attempt.result().release()
+
+
+def _requests_error(err: Urllib3HTTPError) -> Exception:
+    """
+    Return the requests exception that requests would raise for the specified urllib3 exception
+    """
+    if isinstance(err, MaxRetryError):
+        if is_deadline_exceeded(err):
+            return DeadlineExceeded(err)
+        if is_circuit_open(err):
+            return CircuitOpen(err)
+        if is_rate_limited(err):
+            return RateLimited(err)
+        if isinstance(err.reason, ConnectTimeoutError) and not isinstance(err.reason, NewConnectionError):
+            return ConnectTimeout(err)
+        if isinstance(err.reason, ResponseError):
+            return RetryError(err)
+        return RequestsConnectionError(err)
+    if isinstance(err, ReadTimeoutError):
+        return ReadTimeout(err)
+    if isinstance(err, ConnectTimeoutError) and not isinstance(err, NewConnectionError):
+        return ConnectTimeout(err)
+    return RequestsConnectionError(err)
+
+
+def _response_view(resp: aiohttp.ClientResponse) -> HTTPResponse:
+    """
+    Return a body-less urllib3 response with the status and headers of the aiohttp response,
+    for use with the urllib3 Retry methods
+    """
+    return HTTPResponse(body=b"", headers=dict(resp.headers), status=resp.status, preload_content=False)
+
+
+class AsyncRetrySession:
+    """
+    An asyncio counterpart of the session returned by requests_retry_session. It takes the same
+    arguments, and retries requests with the same RetryWithLogs logic (so the same defaults,
+    status_forcelist, allowed_methods, backoff, and logging apply), with the same per-attempt
+    connect and read timeouts. When retries are exhausted or a request fails, the same
+    requests exceptions are raised (RetryError, ConnectionError, ConnectTimeout, ReadTimeout).
+
+    As with requests_retry_session, requests using a protocol that is not in the specified
+    protocols are made without retries or timeouts.
+
+    This is an async context manager; the underlying aiohttp session is created on entry and
+    closed on exit. Responses are aiohttp.ClientResponse objects, which should be released
+    (for example, by using them as async context managers) when no longer needed.
+    """
+
+    def __init__(self,
+                 protocol: ProtocolType | None = None,
+                 **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]) -> None:
+        """
+        If specified, protocols should omit the trailing "://" because it will be automatically appended later
+        """
+        requests_protocol = protocol if protocol is not None else DEFAULT_PROTOCOL
+        if isinstance(requests_protocol, str):
+            requests_protocol = (requests_protocol,)
+        self._protocols = frozenset(requests_protocol)
+        self._settings = _async_settings(**adapter_kwargs)
+        self._client: aiohttp.ClientSession | None = None
+        self._pools: dict[str, HTTPConnectionPool] = {}
+
+    async def __aenter__(self) -> Self:
+        stale_connections = self._settings.stale_connections
+        trace_configs: list[aiohttp.TraceConfig] = []
+        connector_kwargs: dict[str, Any] = {}
+        if self._settings.keepalive_timeout is not None:
+            connector_kwargs["keepalive_timeout"] = self._settings.keepalive_timeout
+        if stale_connections is not None:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_reuseconn.append(_on_connection_reuse)
+            trace_configs.append(trace_config)
+        connector = aiohttp.TCPConnector(limit=0, limit_per_host=self._settings.limit_per_host,
+                                         **connector_kwargs)
+        client = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+        # Newer aiohttp versions silently resend idempotent requests once if the server
+        # disconnects, which would bypass allowed_methods and the retry counters. There is
+        # no public option to disable this.
+        if hasattr(client, "_retry_connection"):
+            client._retry_connection = False  # pylint: disable=protected-access
+        self._client = client
+        return self
+
+    async def __aexit__(
+            self, exc_type: Type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+
+    @property
+    def client(self) -> aiohttp.ClientSession:
+        """
+        Returns the underlying aiohttp session. Raises RuntimeError outside of the context manager.
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncRetrySession must be used as an async context manager")
+        return self._client
+
+    def _pool(self, url: str) -> HTTPConnectionPool:
+        """
+        Return a (connectionless) urllib3 pool for the host of the specified URL, which provides
+        the scheme, host, and port to RetryWithLogs, and to the urllib3 exceptions
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = connection_from_url(key)
+            self._pools[key] = pool
+        return pool
+
+    async def request(  # pylint: disable=too-many-arguments
+            self,
+            method: str,
+            url: str,
+            *,
+            params: Mapping[str, Any] | None = None,
+            timeout: AsyncTimeoutType | TotalTimeout | NotPassed = NOT_PASSED,
+            verify: AsyncVerifyType = True,
+            **kwargs: Any) -> aiohttp.ClientResponse:
+        """
+        Make a request, retrying as needed. The timeout and verify arguments have the same
+        meaning as for requests (including TotalTimeout). Other keyword arguments are passed to aiohttp.
+        """
+        method = method.upper()
+        kwargs["ssl"] = _ssl_arg(verify, self._settings.ssl_context)
+        if params is not None:
+            kwargs["params"] = _query_items(params)
+        parts = urlsplit(url)
+        # The path is what urllib3 would pass to the Retry methods
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        pool = self._pool(url)
+        if parts.scheme not in self._protocols:
+            if isinstance(timeout, TotalTimeout):
+                deadline = None if timeout.total is None else Deadline(timeout.total)
+                kwargs["timeout"] = _client_timeout(timeout.attempt_timeout(None), deadline)
+            else:
+                kwargs["timeout"] = _client_timeout(None if isinstance(timeout, NotPassed) else timeout)
+            try:
+                return await self.client.request(method, url, **kwargs)
+            except _CONNECT_ERRORS + _READ_ERRORS as err:
+                raise _requests_error(_urllib3_error(err, pool, path)) from err
+        attempt_timeout: AsyncTimeoutType | AttemptTimeoutType = self._settings.timeout
+        total_timeout = self._settings.total_timeout
+        if isinstance(timeout, TotalTimeout):
+            attempt_timeout = timeout.attempt_timeout(attempt_timeout)
+            total_timeout = timeout.total
+        elif not isinstance(timeout, NotPassed):
+            attempt_timeout = timeout
+        deadline = None if total_timeout is None else Deadline(total_timeout)
+        retry = self._settings.retry
+        if retry.circuit_breaker is not None:
+            breaker_key = host_key(url)
+            if not retry.circuit_breaker.allow_request(breaker_key):
+                raise CircuitOpen(f"Circuit breaker for '{breaker_key}' is open")
+        hedging = self._settings.hedging
+        with (using_deadline(deadline), using_retry_after_pause(self._settings.retry_after_pause),
+              using_stale_connection_policy(self._settings.stale_connections),
+              retry.timing_request(url, method)):
+            if hedging is not None and hedging.applies(method):
+                resp = await self._request_hedged(hedging, method, url, path, attempt_timeout, deadline, kwargs)
+            else:
+                resp = await self._request_attempts(method, url, path, attempt_timeout, deadline, kwargs)
+            retry.record_success(url, resp.status)
+        return resp
+
+    async def _request_attempts(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            method: str,
+            url: str,
+            path: str,
+            attempt_timeout: AsyncTimeoutType | AttemptTimeoutType,
+            deadline: Deadline | None,
+            kwargs: dict[str, Any]) -> aiohttp.ClientResponse:
+        """
+        Make the request, with its retries
+        """
+        retry = self._settings.retry
+        pool = self._pool(url)
+        while True:
+            await self._wait_for_retry_after_pause(pool, path, deadline)
+            await self._wait_for_rate_limit(pool, path, deadline)
+            timeout = attempt_timeout
+            if retry.adaptive_timeout is not None:
+                # Unlike the requests adapter, each attempt gets the latest adaptive timeout
+                timeout = retry.adaptive_timeout.attempt_timeout(host_key(url), attempt_timeout)
+            kwargs["timeout"] = _client_timeout(timeout, deadline)
+            checkout = active_checkout()
+            if checkout is not None:
+                checkout.reused = False
+                kwargs["trace_request_ctx"] = checkout
+            try:
+                resp = await self.client.request(method, url, **kwargs)
+            except _CONNECT_ERRORS + _READ_ERRORS as err:
+                if _is_stale_connection(err) and retry.replays_stale_connection(
+                        method, path, _urllib3_error(err, pool, path), pool):
+                    start_next_attempt()
+                    continue
+                try:
+                    retry = retry.increment(method, path, error=_urllib3_error(err, pool, path), _pool=pool,
+                                            _stacktrace=sys.exc_info()[2])
+                except Urllib3HTTPError as u3err:
+                    raise _requests_error(u3err) from err
+                await asyncio.sleep(retry.retry_delay())
+                start_next_attempt()
+                continue
+            if not retry.is_retry(method, resp.status, "Retry-After" in resp.headers):
+                budget_denial = take_budget_denial()
+                if budget_denial is not None:
+                    budget_denial.emit_budget_denial(method, path, _response_view(resp), pool)
+                return resp
+            view = _response_view(resp)
+            try:
+                retry = retry.increment(method, path, response=view, _pool=pool)
+            except MaxRetryError as u3err:
+                if retry.raise_on_status:
+                    resp.release()
+                    raise _requests_error(u3err) from u3err
+                return resp
+            resp.release()
+            await asyncio.sleep(retry.retry_delay(view))
+            start_next_attempt()
+
+    async def _wait_for_retry_after_pause(self, pool: HTTPConnectionPool, path: str,
+                                          deadline: Deadline | None) -> None:
+        """
+        Wait until the Retry-After pause of the host (if there is one) has ended, or raise
+        DeadlineExceeded if it would outlast the deadline
+        """
+        pause = self._settings.retry_after_pause
+        if pause is None:
+            return
+        key = pool_host_key(pool)
+        wait = pause.reserve(key, None if deadline is None else max(deadline.remaining(), 0.0))
+        if wait is None:
+            raise _requests_error(MaxRetryError(pool, path, DeadlineExceededError(
+                f"Request for '{path}' would outlast its deadline waiting for the Retry-After pause of '{key}'")))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _wait_for_rate_limit(self, pool: HTTPConnectionPool, path: str, deadline: Deadline | None) -> None:
+        """
+        Wait until the next attempt to the host can be made, according to the rate limiter (if
+        there is one), or raise RateLimited if it would have to wait too long
+        """
+        limiter = self._settings.rate_limiter
+        if limiter is None:
+            return
+        key = pool_host_key(pool)
+        wait = limiter.reserve(key, None if deadline is None else max(deadline.remaining(), 0.0))
+        if wait is None:
+            raise _requests_error(MaxRetryError(pool, path, RateLimitedError(
+                f"Request for '{path}' would have to wait too long for the rate limit of '{key}'")))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _request_hedged(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            hedging: HedgingPolicy,
+            method: str,
+            url: str,
+            path: str,
+            attempt_timeout: AsyncTimeoutType | AttemptTimeoutType,
+            deadline: Deadline | None,
+            kwargs: dict[str, Any]) -> aiohttp.ClientResponse:
+        """
+        Make the request, and hedge it if it is not answered in time (see HedgingPolicy).
+        The losing attempt is cancelled, and its response (if it got one) is released.
+        """
+        key = host_key(url)
+        started = time.monotonic()
+        # Each attempt is a task, with its own copy of the context (so it sees the deadline
+        # and the request timing of this one), and its own copy of the arguments
+        attempts = [asyncio.ensure_future(
+            self._request_attempts(method, url, path, attempt_timeout, deadline, dict(kwargs)))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=hedging.hedge_delay(key))
+            if not done and hedging.try_hedge(key, method):
+                attempts.append(asyncio.ensure_future(
+                    self._request_attempts(method, url, path, attempt_timeout, deadline, dict(kwargs))))
+            winner = await _first_response(attempts)
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+        if winner is not attempts[0]:
+            # Record how long the first attempt ran until it stopped (having been cancelled), rather
+            # than how long it took its hedge to win, which would drag the hedge delay down
+            attempts[0].add_done_callback(lambda _: hedging.record_latency(key, time.monotonic() - started))
+        resp = winner.result()
+        for loser in attempts:
+            if loser is not winner:
+                loser.add_done_callback(_release_response)
+        if winner is attempts[0]:
+            hedging.record_latency(key, time.monotonic() - started)
+        if resp.ok:
+            hedging.record_success()
+        return resp
+
+    async def get(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make a GET request """
+        return await self.request("GET", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make a HEAD request """
+        return await self.request("HEAD", url, **kwargs)
+
+    async def options(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make an OPTIONS request """
+        return await self.request("OPTIONS", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make a POST request """
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make a PUT request """
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make a PATCH request """
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        """ Make a DELETE request """
+        return await self.request("DELETE", url, **kwargs)
+
+
+@asynccontextmanager
+async def async_retry_session_manager(
+    protocol: ProtocolType | None = None,
+    **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]
+) -> AsyncIterator[AsyncRetrySession]:
+    """
+    Provides an async context manager for an AsyncRetrySession, which is closed on exit
+
+    If specified, protocols should omit the trailing "://" because it will be automatically appended later
+    """
+    async with AsyncRetrySession(protocol=protocol, **adapter_kwargs) as session:
+        yield session
@@ -0,0 +1,95 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Backoff strategies for RetryWithLogs
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import random
+
+
+type BackoffStrategyType = Literal["exponential", "full_jitter", "equal_jitter", "decorrelated_jitter"]
+BACKOFF_STRATEGIES: frozenset[BackoffStrategyType] = frozenset(
+    {"exponential", "full_jitter", "equal_jitter", "decorrelated_jitter"})
+
+DEFAULT_BACKOFF_STRATEGY: BackoffStrategyType = "exponential"
+# The same as the urllib3 default
+DEFAULT_BACKOFF_MAX = 120.0
+
+
+def validate_backoff_strategy(value: object) -> None:
+    """
+    Raise ValueError if value is not a valid backoff strategy
+    """
+    if value not in BACKOFF_STRATEGIES:
+        raise ValueError(f"backoff_strategy must be one of {sorted(BACKOFF_STRATEGIES)}, not {value!r}")
+
+
+def exponential_backoff(backoff_factor: float, consecutive_errors: int, backoff_max: float) -> float:
+    """
+    The urllib3 backoff: nothing before the first retry, then backoff_factor * 2 ** (n - 1)
+    before the retry following n consecutive errors, capped at backoff_max
+    """
+    if consecutive_errors <= 1:
+        return 0.0
+    return min(backoff_max, backoff_factor * 2.0 ** (consecutive_errors - 1))
+
+
+def jittered_backoff(  # pylint: disable=too-many-arguments
+        strategy: BackoffStrategyType,
+        rng: random.Random,
+        *,
+        backoff_factor: float,
+        consecutive_errors: int,
+        backoff_max: float,
+        previous_backoff: float) -> float:
+    """
+    Returns the backoff before the retry following the specified number of consecutive errors,
+    using one of the jittered strategies described in
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+
+    full_jitter: A random time between 0 and the exponential backoff
+    equal_jitter: Half the exponential backoff, plus a random time up to the other half
+    decorrelated_jitter: A random time between backoff_factor and three times the previous backoff
+
+    For these strategies, the exponential backoff is backoff_factor * 2 ** (n - 1), without
+    urllib3's exception for the first retry, so that the first retries are also spread out.
+    All are capped at backoff_max.
+    """
+    if consecutive_errors < 1:
+        return 0.0
+    if strategy == "decorrelated_jitter":
+        upper = max(backoff_factor, previous_backoff * 3)
+        return min(backoff_max, rng.uniform(backoff_factor, upper))
+    exponential = min(backoff_max, backoff_factor * 2.0 ** (consecutive_errors - 1))
+    if strategy == "full_jitter":
+        return rng.uniform(0, exponential)
+    if strategy == "equal_jitter":
+        return exponential / 2 + rng.uniform(0, exponential / 2)
+    raise ValueError(f"{strategy!r} is not a jittered backoff strategy")
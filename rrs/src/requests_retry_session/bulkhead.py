@@ -0,0 +1,264 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Bulkhead class: limits the number of concurrent requests to each host, optionally adapting the limits (AIMD)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import NamedTuple
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from .deadline import active_deadline
+from .utils import (
+    validate_bool,
+    validate_non_negative_number,
+    validate_positive_int,
+    validate_positive_number,
+)
+
+
+DEFAULT_MAX_CONCURRENT = 10
+DEFAULT_MIN_CONCURRENT = 1
+DEFAULT_INCREASE = 1.0
+DEFAULT_DECREASE = 0.5
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BulkheadFull(RequestsConnectionError):
+    """
+    Raised instead of making a request when the bulkhead for its host is full,
+    and the request would have to wait too long for room in it
+    """
+
+
+class BulkheadStats(NamedTuple):
+    """
+    admitted: The number of requests which were admitted (after waiting, if need be)
+    queued: The number of those requests which had to wait
+    rejected: The number of requests which were not made, because they would have had to wait too long
+    total_wait: The total time (in seconds) that requests waited
+    longest_wait: The longest time (in seconds) that a request waited
+    """
+    admitted: int
+    queued: int
+    rejected: int
+    total_wait: float
+    longest_wait: float
+
+
+class HostConcurrency(NamedTuple):
+    """
+    limit: The current limit on the number of concurrent requests to the host
+    in_flight: The number of requests to the host currently being made
+    waiting: The number of requests to the host waiting for room
+    """
+    limit: int
+    in_flight: int
+    waiting: int
+
+
+@dataclass(slots=True)
+class _Host:
+    """
+    The state of one host. The limit is fractional, so that it can grow gradually.
+    """
+    limit: float
+    in_flight: int = 0
+    waiting: int = 0
+
+
+@dataclass(slots=True)
+class _Counters:
+    """
+    The counters reported by Bulkhead.stats()
+    """
+    admitted: int = 0
+    queued: int = 0
+    rejected: int = 0
+    total_wait: float = 0.0
+    longest_wait: float = 0.0
+
+
+class Bulkhead:
+    """
+    Limits the number of requests to each host (scheme://host:port) which are in flight at the
+    same time, so that a slow host cannot take up every thread making requests. A request which
+    would exceed the limit waits for one of the others to finish. If max_wait is set, a request
+    which would have to wait longer than max_wait seconds is not made (with max_wait=0, requests
+    fail fast instead of waiting), and neither is one which would have to wait past the overall
+    deadline of its request: BulkheadFull is raised instead.
+
+    If adaptive is True, the limit of each host adapts to how it copes with its load (additive
+    increase, multiplicative decrease): each timed out attempt and each response with a status
+    in status_forcelist multiplies it by decrease (down to min_concurrent), and each successful
+    request raises it by increase / limit (that is, by about increase for each round of limit
+    requests), up to max_concurrent.
+
+    A bulkhead is passed to requests_retry_adapter (and the other entry points) as the bulkhead
+    argument. The same bulkhead can be shared by any number of adapters and threads, and then
+    limits their combined concurrency. A request holds its place from when it is sent until its
+    response (after any retries) is returned; the body of a streamed response may still be being
+    read after that. Async sessions do not support bulkheads, since waiting for room would block
+    the event loop; pool_maxsize with pool_block=True limits the requests to each host instead.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+            *,
+            max_wait: float | None = None,
+            adaptive: bool = False,
+            min_concurrent: int = DEFAULT_MIN_CONCURRENT,
+            increase: float = DEFAULT_INCREASE,
+            decrease: float = DEFAULT_DECREASE) -> None:
+        validate_positive_int("max_concurrent", max_concurrent)
+        if max_wait is not None:
+            validate_non_negative_number("max_wait", max_wait)
+        validate_bool("adaptive", adaptive)
+        validate_positive_int("min_concurrent", min_concurrent)
+        if min_concurrent > max_concurrent:
+            raise ValueError(f"min_concurrent ({min_concurrent}) must not exceed max_concurrent ({max_concurrent})")
+        validate_positive_number("increase", increase)
+        validate_positive_number("decrease", decrease)
+        if decrease >= 1:
+            raise ValueError(f"decrease must be less than 1, not {decrease}")
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self.adaptive = adaptive
+        self.min_concurrent = min_concurrent
+        self.increase = increase
+        self.decrease = decrease
+        self._condition = threading.Condition()
+        self._hosts: dict[str, _Host] = {}
+        self._counters = _Counters()
+
+    def _host(self, key: str) -> _Host:
+        """
+        Returns the state of the host, creating it if needed (the condition must be held)
+        """
+        host = self._hosts.get(key)
+        if host is None:
+            host = self._hosts[key] = _Host(limit=float(self.max_concurrent))
+        return host
+
+    def acquire(self, key: str) -> bool:
+        """
+        Wait until there is room for another request to the host, and take it. Returns False
+        (after counting a rejection) if it would have to wait longer than max_wait, or past the
+        deadline of the active request.
+        """
+        deadline = active_deadline()
+        max_waits = [wait for wait in (self.max_wait, None if deadline is None else max(deadline.remaining(), 0.0))
+                     if wait is not None]
+        started = time.monotonic()
+        with self._condition:
+            host = self._host(key)
+            if host.in_flight >= int(host.limit):
+                host.waiting += 1
+                try:
+                    admitted = self._condition.wait_for(lambda: host.in_flight < int(host.limit),
+                                                        timeout=min(max_waits) if max_waits else None)
+                finally:
+                    host.waiting -= 1
+                if not admitted:
+                    self._counters.rejected += 1
+                    return False
+                waited = time.monotonic() - started
+                self._counters.queued += 1
+                self._counters.total_wait += waited
+                self._counters.longest_wait = max(self._counters.longest_wait, waited)
+            host.in_flight += 1
+            self._counters.admitted += 1
+            return True
+
+    def release(self, key: str) -> None:
+        """
+        Give up the place of a request to the host, once it has finished
+        """
+        with self._condition:
+            self._host(key).in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, key: str) -> None:
+        """
+        Record a successful request to the host (raising its limit, if adaptive)
+        """
+        if not self.adaptive:
+            return
+        with self._condition:
+            host = self._host(key)
+            previous = int(host.limit)
+            host.limit = min(host.limit + self.increase / host.limit, float(self.max_concurrent))
+            if int(host.limit) > previous:
+                self._condition.notify_all()
+
+    def record_overload(self, key: str) -> None:
+        """
+        Record a timed out attempt, or a response with a status in status_forcelist, from the host
+        (cutting its limit, if adaptive)
+        """
+        if not self.adaptive:
+            return
+        with self._condition:
+            host = self._host(key)
+            previous = int(host.limit)
+            host.limit = max(host.limit * self.decrease, float(self.min_concurrent))
+            if int(host.limit) < previous:
+                LOGGER.info("Bulkhead limit for '%s' cut to %d concurrent requests", key, int(host.limit))
+
+    def limit(self, key: str) -> int:
+        """
+        Returns the current limit on the number of concurrent requests to the host
+        """
+        with self._condition:
+            host = self._hosts.get(key)
+            return self.max_concurrent if host is None else int(host.limit)
+
+    def snapshot(self) -> dict[str, HostConcurrency]:
+        """
+        Returns the limit and load of every host which has been requested
+        """
+        with self._condition:
+            return {key: HostConcurrency(limit=int(host.limit), in_flight=host.in_flight, waiting=host.waiting)
+                    for key, host in self._hosts.items()}
+
+    def stats(self) -> BulkheadStats:
+        """
+        Returns the counters
+        """
+        with self._condition:
+            counters = self._counters
+            return BulkheadStats(admitted=counters.admitted, queued=counters.queued, rejected=counters.rejected,
+                                 total_wait=counters.total_wait, longest_wait=counters.longest_wait)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(max_concurrent={self.max_concurrent}, max_wait={self.max_wait}, "
+                f"adaptive={self.adaptive})")
@@ -0,0 +1,210 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+CircuitBreaker class: stops requests to hosts that keep failing, until they have had time to recover
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Literal, NamedTuple
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, MaxRetryError
+
+from .utils import host_key, validate_positive_int, validate_positive_number
+
+
+type CircuitStateType = Literal["closed", "open", "half_open"]
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Urllib3HTTPError):
+    """
+    The reason given by RetryWithLogs in the MaxRetryError it raises when the circuit
+    for the host opens while a request is being retried
+    """
+
+
+class CircuitOpen(RequestsConnectionError):
+    """
+    Raised instead of making a request (or instead of retrying it) when the circuit breaker
+    for its host is open
+    """
+
+
+def is_circuit_open(err: BaseException) -> bool:
+    """
+    Returns True if the specified urllib3 or requests exception was caused by an open circuit
+    """
+    if isinstance(err, RequestsConnectionError) and err.args:
+        return is_circuit_open(err.args[0])
+    return isinstance(err, MaxRetryError) and isinstance(err.reason, CircuitOpenError)
+
+
+class CircuitStatus(NamedTuple):
+    """
+    state: The state of the circuit
+    failures: The number of consecutive failed attempts
+    opened_at: When the circuit last opened (or went half-open), as a time.monotonic() value
+    """
+    state: CircuitStateType
+    failures: int
+    opened_at: float | None
+
+
+@dataclass(slots=True)
+class _Circuit:
+    """
+    The mutable state of the circuit for one host
+    """
+    state: CircuitStateType = "closed"
+    failures: int = 0
+    opened_at: float = 0.0
+    trial_calls: int = 0
+
+
+class CircuitBreaker:
+    """
+    A per-host (scheme, host, and port) circuit breaker.
+
+    Each circuit starts closed. After failure_threshold consecutive failed attempts (connection
+    errors, timeouts, or status_forcelist responses -- the failures that RetryWithLogs retries),
+    it opens, and requests to that host fail fast with CircuitOpen, without retries. Once
+    recovery_timeout seconds have passed, the circuit goes half-open, and up to half_open_max_calls
+    trial requests are let through: a successful response closes the circuit again, and a failed
+    attempt reopens it.
+
+    A circuit breaker is passed to requests_retry_adapter (and the other entry points) as the
+    circuit_breaker argument. The same breaker can be shared by any number of adapters and
+    threads, so that they all stop calling a host that is down.
+    """
+
+    def __init__(self,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+                 half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS) -> None:
+        validate_positive_int("failure_threshold", failure_threshold)
+        validate_positive_number("recovery_timeout", recovery_timeout)
+        validate_positive_int("half_open_max_calls", half_open_max_calls)
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        # Only hosts which have had failures since their last success have an entry
+        self._circuits: dict[str, _Circuit] = {}
+
+    def allow_request(self, key: str) -> bool:
+        """
+        Returns True if a request may be made to the host with the specified host key.
+        If the circuit is open and has had time to recover, this makes it half-open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == "closed":
+                return True
+            recovered = time.monotonic() - circuit.opened_at >= self.recovery_timeout
+            if circuit.state == "open":
+                if not recovered:
+                    return False
+                LOGGER.info("Circuit breaker for '%s' is half-open; allowing trial requests", key)
+                circuit.state = "half_open"
+                circuit.opened_at = time.monotonic()
+                circuit.trial_calls = 0
+            elif recovered:
+                # Trial requests which ended without a success or failure being recorded (for
+                # example, because of a deadline) should not leave the circuit half-open forever
+                circuit.opened_at = time.monotonic()
+                circuit.trial_calls = 0
+            if circuit.trial_calls >= self.half_open_max_calls:
+                return False
+            circuit.trial_calls += 1
+            return True
+
+    def record_failure(self, key: str) -> CircuitStateType:
+        """
+        Record a failed attempt on the host with the specified host key, and return the
+        resulting state of its circuit
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == "half_open" or (
+                    circuit.state == "closed" and circuit.failures >= self.failure_threshold):
+                LOGGER.warning("Circuit breaker for '%s' opened after %d consecutive failed attempts; "
+                               "failing requests for %ss", key, circuit.failures, self.recovery_timeout)
+                circuit.state = "open"
+                circuit.opened_at = time.monotonic()
+            return circuit.state
+
+    def record_success(self, key: str) -> None:
+        """
+        Record a successful request to the host with the specified host key (see host_key),
+        which closes its circuit
+        """
+        with self._lock:
+            circuit = self._circuits.pop(key, None)
+        if circuit is not None and circuit.state != "closed":
+            LOGGER.info("Circuit breaker for '%s' closed", key)
+
+    def state(self, url: str) -> CircuitStateType:
+        """
+        Returns the state of the circuit for the host of the specified URL (or host key)
+        """
+        with self._lock:
+            circuit = self._circuits.get(host_key(url))
+            return "closed" if circuit is None else circuit.state
+
+    def snapshot(self) -> dict[str, CircuitStatus]:
+        """
+        Returns the status of every circuit which has had failures since its last success,
+        keyed by host key
+        """
+        with self._lock:
+            return {key: CircuitStatus(state=circuit.state, failures=circuit.failures,
+                                       opened_at=None if circuit.state == "closed" else circuit.opened_at)
+                    for key, circuit in self._circuits.items()}
+
+    def reset(self, url: str | None = None) -> None:
+        """
+        Close the circuit for the host of the specified URL (or host key), or every circuit
+        """
+        with self._lock:
+            if url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host_key(url), None)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(failure_threshold={self.failure_threshold}, "
+                f"recovery_timeout={self.recovery_timeout}, half_open_max_calls={self.half_open_max_calls})")
@@ -0,0 +1,199 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+ConnectionLifetimePolicy class: closes pooled connections which have been idle, or open, for too long
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+import weakref
+
+from .utils import validate_positive_number
+
+if TYPE_CHECKING:
+    from .connection_pools import TrackedHTTPConnectionPool
+    from .typing_imports import Iterator
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionPoolStats(NamedTuple):
+    """
+    pools: The number of connection pools the policy has been applied to, which are still open
+    idle_connections: The number of open connections currently idle in those pools
+    reaped_idle: The number of pooled connections closed for being idle for longer than max_idle
+    reaped_expired: The number of pooled connections closed for being open for longer than max_lifetime
+    """
+    pools: int
+    idle_connections: int
+    reaped_idle: int
+    reaped_expired: int
+
+
+_ACTIVE_LIFETIME_POLICY: ContextVar[ConnectionLifetimePolicy | None] = ContextVar("active_connection_lifetime_policy",
+                                                                                  default=None)
+
+
+def active_lifetime_policy() -> ConnectionLifetimePolicy | None:
+    """
+    Returns the connection lifetime policy of the request being made in the current context, if any
+    """
+    return _ACTIVE_LIFETIME_POLICY.get()
+
+
+@contextmanager
+def using_connection_lifetime(policy: ConnectionLifetimePolicy | None) -> Iterator[None]:
+    """
+    Make the specified policy the active connection lifetime policy within the context
+    """
+    token = _ACTIVE_LIFETIME_POLICY.set(policy)
+    try:
+        yield
+    finally:
+        _ACTIVE_LIFETIME_POLICY.reset(token)
+
+
+class ConnectionLifetimePolicy:
+    """
+    Keeps the connection pools of the adapters it is attached to healthy, by closing pooled
+    connections which have been idle for longer than max_idle seconds, or open for longer than
+    max_lifetime seconds. Such connections are likely to have been closed by the other end
+    (or by an idle timeout of a service mesh or load balancer in between), so using them would
+    likely cost a failed attempt. Connections are checked whenever they are taken from their pool
+    (they are reconnected, rather than used, if they have expired), and if reap_interval is set,
+    a background thread also checks the idle connections of every pool every reap_interval
+    seconds, so that expired connections do not hold on to their sockets until they are next
+    needed. The thread is stopped by close(), or once the policy is no longer referenced.
+
+    A policy is passed to requests_retry_adapter (and the other entry points) as the
+    connection_lifetime argument. The async session uses max_idle as the keep-alive timeout of
+    its connector, and raises ValueError if the policy has a max_lifetime or reap_interval,
+    since it does not support them.
+    """
+
+    def __init__(self,
+                 max_idle: float | None = None,
+                 max_lifetime: float | None = None,
+                 reap_interval: float | None = None) -> None:
+        for name, value in (("max_idle", max_idle), ("max_lifetime", max_lifetime),
+                            ("reap_interval", reap_interval)):
+            if value is not None:
+                validate_positive_number(name, value)
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.reap_interval = reap_interval
+        self._lock = threading.Lock()
+        self._pools: weakref.WeakSet[TrackedHTTPConnectionPool] = weakref.WeakSet()
+        self._reaped_idle = self._reaped_expired = 0
+        self._reaper: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def track(self, pool: TrackedHTTPConnectionPool) -> None:
+        """
+        Apply the policy to the specified pool (starting the reaper thread, if it has not started yet)
+        """
+        with self._lock:
+            self._pools.add(pool)
+            if self.reap_interval is None or self._reaper is not None or self._stop.is_set():
+                return
+            self._reaper = threading.Thread(target=_reap_periodically,
+                                            args=(weakref.ref(self), self.reap_interval, self._stop),
+                                            name="ConnectionLifetimePolicy reaper", daemon=True)
+            self._reaper.start()
+
+    def is_expired(self, idle_since: float | None, connected_at: float | None, now: float) -> bool:
+        """
+        Returns True (and counts it) if a pooled connection which has been idle since idle_since
+        and open since connected_at (both time.monotonic() values, or None if not known) should
+        be closed
+        """
+        if self.max_lifetime is not None and connected_at is not None and now - connected_at > self.max_lifetime:
+            with self._lock:
+                self._reaped_expired += 1
+            return True
+        if self.max_idle is not None and idle_since is not None and now - idle_since > self.max_idle:
+            with self._lock:
+                self._reaped_idle += 1
+            return True
+        return False
+
+    def reap(self) -> None:
+        """
+        Close the expired idle connections of every pool the policy has been applied to
+        """
+        with self._lock:
+            pools = list(self._pools)
+        for pool in pools:
+            pool.reap_connections(self)
+
+    def close(self) -> None:
+        """
+        Stop the reaper thread, if it is running. Connections are still checked when they are
+        taken from their pool.
+        """
+        self._stop.set()
+        with self._lock:
+            reaper, self._reaper = self._reaper, None
+        if reaper is not None and reaper is not threading.current_thread():
+            reaper.join()
+
+    def stats(self) -> ConnectionPoolStats:
+        """
+        Returns the pool sizes and counters
+        """
+        with self._lock:
+            pools = list(self._pools)
+            reaped_idle, reaped_expired = self._reaped_idle, self._reaped_expired
+        open_pools = [pool for pool in pools if pool.pool is not None]
+        return ConnectionPoolStats(pools=len(open_pools),
+                                   idle_connections=sum(pool.idle_connections() for pool in open_pools),
+                                   reaped_idle=reaped_idle, reaped_expired=reaped_expired)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(max_idle={self.max_idle}, max_lifetime={self.max_lifetime}, "
+                f"reap_interval={self.reap_interval})")
+
+
+def _reap_periodically(policy_ref: weakref.ref[ConnectionLifetimePolicy], interval: float,
+                       stop: threading.Event) -> None:
+    """
+    The reaper thread of a policy, which only holds a weak reference to it, so that it stops
+    once the policy is no longer referenced
+    """
+    while not stop.wait(interval):
+        policy = policy_ref()
+        if policy is None:
+            return
+        try:
+            policy.reap()
+        except Exception:  # pylint: disable=broad-exception-caught
+            LOGGER.exception("Error reaping pooled connections")
+        del policy
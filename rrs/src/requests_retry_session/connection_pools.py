@@ -0,0 +1,252 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+urllib3 connection pools which keep track of how their connections are used
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import logging
+import time
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError, MaxRetryError
+
+from .connection_lifetime import active_lifetime_policy
+from .deadline import DeadlineExceededError
+from .hedging import active_hedge_cancellation, HedgeCancelledError
+from .rate_limiter import active_rate_limiter, RateLimitedError
+from .retry_after_pause import active_retry_after_pause
+from .retry_deferral import active_retry_deferral
+from .retry_with_logs import take_budget_denial
+from .stale_connections import active_checkout
+from .tls_sessions import read_session_tickets, remember_tls_session
+from .utils import pool_host_key
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .connection_lifetime import ConnectionLifetimePolicy
+    from .typing_imports import Iterator
+
+    try:
+        # We tell mypy to ignore this if this fails.
+        # We also have to specify unused-ignore, since this only fails sometimes,
+        # depending on the version of urllib3 that is installed
+        from urllib3._base_connection import BaseHTTPConnection  # type: ignore[import,unused-ignore]
+    except ImportError:
+        # Older versions of urllib3 need this adjustment
+        from urllib3.connection import HTTPConnection as BaseHTTPConnection
+
+    try:
+        # See retry_with_logs.py
+        from urllib3 import BaseHTTPResponse  # type: ignore[import,attr-defined,unused-ignore]
+    except ImportError:
+        from urllib3 import HTTPResponse as BaseHTTPResponse
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _is_connected(conn: BaseHTTPConnection) -> bool:
+    """
+    Returns True if the connection has a socket (that is, it has been connected, and not closed since)
+    """
+    return getattr(conn, "sock", None) is not None
+
+
+class TrackedHTTPConnectionPool(HTTPConnectionPool):
+    """
+    An HTTPConnectionPool which records when each of its connections was connected, and when it
+    was returned to it (that is, since when it has been idle). When it hands out a connection
+    which has been used before, it closes it instead (so that it is reconnected) if it has expired
+    according to the ConnectionLifetimePolicy of the request being made, or has been idle for too
+    long according to its StaleConnectionPolicy, and tells the latter whether it was reused.
+
+    If the request being made is being resumed by a RetryScheduler, it is resumed with the Retry
+    object of its deferred retry, rather than the one it was sent with.
+
+    Every attempt made with the pool (urllib3 calls urlopen again for each retry) first waits for
+    the pause of its host to end, if the request being made has a RetryAfterPause, or fails with a
+    MaxRetryError (with a DeadlineExceededError as its reason) if the pause would outlast its
+    deadline. Then it waits for the RateLimiter of the request, if it has one, or fails with a
+    MaxRetryError (with a RateLimitedError as its reason) if it would have to wait too long.
+    An attempt of a cancelled hedged attempt fails with a MaxRetryError (with a
+    HedgeCancelledError as its reason), and while a hedged attempt is using a connection, it is
+    recorded with its HedgeCancellation, so that cancelling it shuts the connection down.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._idle_since: WeakKeyDictionary[BaseHTTPConnection, float] = WeakKeyDictionary()
+        self._connected_at: WeakKeyDictionary[BaseHTTPConnection, float] = WeakKeyDictionary()
+
+    def urlopen(self, method: str, url: str, *args: Any, **kwargs: Any) -> BaseHTTPResponse:
+        cancellation = active_hedge_cancellation()
+        if cancellation is not None and cancellation.cancelled:
+            raise MaxRetryError(self, url, HedgeCancelledError(f"Hedged {method} request for '{url}' was cancelled"))
+        deferral = active_retry_deferral()
+        if deferral is not None:
+            resumed = deferral.take_retry()
+            if resumed is not None:
+                kwargs["retries"] = resumed
+        pause = active_retry_after_pause()
+        if pause is not None:
+            key = pool_host_key(self)
+            if not pause.wait(key):
+                raise MaxRetryError(self, url, DeadlineExceededError(
+                    f"{method} request for '{url}' would outlast its deadline waiting for the "
+                    f"Retry-After pause of '{key}'"))
+        limiter = active_rate_limiter()
+        if limiter is not None:
+            key = pool_host_key(self)
+            if not limiter.acquire(key):
+                raise MaxRetryError(self, url, RateLimitedError(
+                    f"{method} request for '{url}' would have to wait too long for the rate limit of '{key}'"))
+        response = super().urlopen(method, url, *args, **kwargs)
+        budget_denial = take_budget_denial()
+        if budget_denial is not None:
+            budget_denial.emit_budget_denial(method, url, response, self)
+        return response
+
+    def _get_conn(self, timeout: float | None = None) -> BaseHTTPConnection:
+        conn = super()._get_conn(timeout)
+        idle_since = self._idle_since.pop(conn, None)
+        # Connections are only connected once they are used, so a connected one has been used before
+        reused = _is_connected(conn)
+        lifetime = active_lifetime_policy()
+        if lifetime is not None:
+            lifetime.track(self)
+            if reused and lifetime.is_expired(idle_since, self._connected_at.get(conn), time.monotonic()):
+                LOGGER.debug("Reconnecting expired connection to %s", self.host)
+                conn.close()
+                reused = False
+        checkout = active_checkout()
+        if checkout is not None:
+            if reused and checkout.policy.is_too_idle(idle_since):
+                LOGGER.debug("Discarding connection to %s, which has been idle for too long", self.host)
+                conn.close()
+                reused = False
+            checkout.reused = reused
+        if not reused:
+            # It is about to be connected
+            self._connected_at[conn] = time.monotonic()
+        cancellation = active_hedge_cancellation()
+        if cancellation is not None:
+            cancellation.using_connection(conn)
+        return conn
+
+    def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
+        cancellation = active_hedge_cancellation()
+        if cancellation is not None:
+            cancellation.released_connection(conn)
+        if conn is not None:
+            self._idle_since[conn] = time.monotonic()
+        super()._put_conn(conn)
+
+    def reap_connections(self, policy: ConnectionLifetimePolicy) -> None:
+        """
+        Close the idle connections of the pool which have expired according to the policy
+        """
+        pool = self.pool
+        if pool is None:
+            return
+        now = time.monotonic()
+        # The connections stay in the pool (as urllib3 does with dropped connections), and are
+        # reconnected when they are next used
+        with pool.mutex:
+            for conn in pool.queue:
+                if (conn is not None and _is_connected(conn)
+                        and policy.is_expired(self._idle_since.get(conn), self._connected_at.get(conn), now)):
+                    LOGGER.debug("Closing expired idle connection to %s", self.host)
+                    conn.close()
+
+    @contextmanager
+    def taken_connections(self, count: int) -> Iterator[list[BaseHTTPConnection]]:
+        """
+        Take up to count connections from the pool, without waiting for any to be returned to
+        it (or opening any more than it can hold), and return them to it on exit
+        """
+        conns: list[BaseHTTPConnection] = []
+        try:
+            while len(conns) < count and self.pool is not None and not self.pool.empty():
+                try:
+                    conns.append(self._get_conn(timeout=0))
+                except EmptyPoolError:
+                    break
+            yield conns
+        finally:
+            for conn in conns:
+                self._put_conn(conn)
+
+    def connect(self, conn: BaseHTTPConnection, timeout: float | None) -> None:
+        """
+        Connect a connection taken from the pool (with taken_connections), if it is not connected.
+        For HTTPS connections, this includes the TLS handshake (and receiving any session tickets).
+        """
+        if _is_connected(conn):
+            return
+        # urllib3 sets the timeout of a connection the same way before making a request on it
+        conn.timeout = timeout
+        self._connected_at[conn] = time.monotonic()
+        try:
+            conn.connect()
+        except BaseException:
+            conn.close()
+            raise
+        if not read_session_tickets(getattr(conn, "sock", None)):
+            conn.close()
+            raise ConnectionAbortedError(f"The connection to {self.host} was closed after it was opened")
+
+    def idle_connections(self) -> int:
+        """
+        Returns the number of open connections in the pool
+        """
+        pool = self.pool
+        if pool is None:
+            return 0
+        with pool.mutex:
+            return sum(1 for conn in pool.queue if conn is not None and _is_connected(conn))
+
+
+class TrackedHTTPSConnectionPool(TrackedHTTPConnectionPool, HTTPSConnectionPool):
+    """
+    The HTTPS equivalent of TrackedHTTPConnectionPool. When its connections are returned to it,
+    their TLS sessions are remembered by their SSL context, if it is a ResumingSSLContext.
+    """
+
+    def _put_conn(self, conn: BaseHTTPConnection | None) -> None:
+        if conn is not None:
+            remember_tls_session(getattr(conn, "sock", None))
+        super()._put_conn(conn)
+
+
+POOL_CLASSES_BY_SCHEME: dict[str, type[HTTPConnectionPool]] = {
+    "http": TrackedHTTPConnectionPool,
+    "https": TrackedHTTPSConnectionPool,
+}
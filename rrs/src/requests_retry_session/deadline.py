@@ -0,0 +1,200 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Overall request deadlines, which span every attempt and backoff sleep of a request
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING
+
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    Timeout as RequestsTimeout,
+)
+from urllib3.exceptions import MaxRetryError, TimeoutError as Urllib3TimeoutError
+from urllib3.util.timeout import Timeout
+
+from .utils import validate_positive_number
+
+if TYPE_CHECKING:
+    from .typing_imports import Iterator
+
+    type AttemptTimeoutType = tuple[float | None, float | None]
+    type RequestTimeoutType = float | tuple[float, float] | tuple[float, None] | Timeout | None
+
+
+# Attempts are never given less time than this, because a socket timeout of 0 would
+# make the socket non-blocking rather than failing immediately
+MIN_ATTEMPT_TIMEOUT = 0.001
+
+
+class DeadlineExceededError(Urllib3TimeoutError):
+    """
+    The reason given by RetryWithLogs in the MaxRetryError it raises when the
+    overall deadline of a request has passed, or would pass during the next backoff
+    """
+
+
+class DeadlineExceeded(RequestsConnectionError, RequestsTimeout):
+    """
+    Raised when the overall deadline of a request passes before it succeeds. Like the
+    requests ConnectTimeout, this is both a ConnectionError (which is what requests raises
+    for other failed retries) and a Timeout.
+    """
+
+
+def is_deadline_exceeded(err: BaseException) -> bool:
+    """
+    Returns True if the specified urllib3 or requests exception was caused by the
+    overall deadline of a request passing
+    """
+    if isinstance(err, RequestsConnectionError) and err.args:
+        return is_deadline_exceeded(err.args[0])
+    return isinstance(err, MaxRetryError) and isinstance(err.reason, DeadlineExceededError)
+
+
+def split_timeout(timeout: RequestTimeoutType | AttemptTimeoutType) -> AttemptTimeoutType:
+    """
+    Return the (connect, read) timeouts of a requests-style timeout argument
+    """
+    if isinstance(timeout, Timeout):
+        connect, read = timeout.connect_timeout, timeout.read_timeout
+        return (connect if isinstance(connect, (int, float)) else None,
+                read if isinstance(read, (int, float)) else None)
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
+
+
+@dataclass(frozen=True, slots=True)
+class TotalTimeout:
+    """
+    A timeout argument for a single request, which overrides the total_timeout of the adapter.
+
+    total: The overall deadline (in seconds) for the request, spanning all of its attempts and
+           backoff sleeps, or None for no deadline
+    connect, read: The timeouts for each attempt. If not specified, those of the adapter are used.
+
+    e.g.    session.get(url, timeout=TotalTimeout(5))
+    """
+    total: float | None
+    connect: float | None = None
+    read: float | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("total", "connect", "read"):
+            value = getattr(self, name)
+            if value is not None:
+                validate_positive_number(name, value)
+
+    def attempt_timeout(self, default: RequestTimeoutType | AttemptTimeoutType) -> AttemptTimeoutType:
+        """
+        Return the (connect, read) timeouts for each attempt, using those of the
+        specified default timeout for any which were not specified
+        """
+        default_connect, default_read = split_timeout(default)
+        return (default_connect if self.connect is None else self.connect,
+                default_read if self.read is None else self.read)
+
+
+@dataclass(slots=True)
+class Deadline:
+    """
+    The point in time by which a request must have finished, total seconds after it started
+    """
+    total: float
+    expires_at: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.expires_at = time.monotonic() + self.total
+
+    def remaining(self) -> float:
+        """ Returns the number of seconds until the deadline (negative once it has passed) """
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        """ Returns True if there is no longer time for another attempt """
+        return self.remaining() < MIN_ATTEMPT_TIMEOUT
+
+    def clamp(self, timeout: float | None) -> float:
+        """
+        Returns the specified attempt timeout, shortened as needed to end at the deadline
+        """
+        remaining = max(self.remaining(), MIN_ATTEMPT_TIMEOUT)
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+class DeadlineTimeout(Timeout):
+    """
+    A urllib3 Timeout whose connect and read timeouts shrink to fit the time remaining before
+    a deadline. urllib3 clones the Timeout for each attempt and reads the timeouts as it
+    uses them, so every retry of the request gets whatever is left of the deadline.
+    """
+
+    def __init__(self, deadline: Deadline, connect: float | None = None, read: float | None = None) -> None:
+        super().__init__(connect=connect, read=read)
+        self.deadline = deadline
+        self._attempt_connect = connect
+        self._attempt_read = read
+
+    def clone(self) -> DeadlineTimeout:
+        return DeadlineTimeout(self.deadline, connect=self._attempt_connect, read=self._attempt_read)
+
+    @property
+    def connect_timeout(self) -> float:
+        return self.deadline.clamp(self._attempt_connect)
+
+    @property
+    def read_timeout(self) -> float:
+        return self.deadline.clamp(self._attempt_read)
+
+
+# The deadline of the request being made in the current thread (or asyncio task), if any.
+# This is how RetryWithLogs, which urllib3 copies for each retry, finds the deadline.
+_ACTIVE_DEADLINE: ContextVar[Deadline | None] = ContextVar("active_deadline", default=None)
+
+
+def active_deadline() -> Deadline | None:
+    """
+    Returns the deadline of the request being made in the current context, if any
+    """
+    return _ACTIVE_DEADLINE.get()
+
+
+@contextmanager
+def using_deadline(deadline: Deadline | None) -> Iterator[None]:
+    """
+    Make the specified deadline the active deadline within the context
+    """
+    token = _ACTIVE_DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _ACTIVE_DEADLINE.reset(token)
@@ -0,0 +1,262 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Functions for streaming downloads which resume (with Range requests) where they were cut off
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+import requests
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ConnectionError as RequestsConnectionError,
+    SSLError as RequestsSSLError,
+)
+from urllib3.exceptions import (
+    HTTPError as Urllib3HTTPError,
+    MaxRetryError,
+    ProtocolError,
+    ReadTimeoutError,
+    SSLError,
+)
+
+from .circuit_breaker import is_circuit_open, CircuitOpen
+from .timeout_http_adapter import TimeoutHTTPAdapter
+from .utils import validate_positive_int
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .typing_imports import Iterator
+
+    from urllib3 import Retry
+
+    from .typing_imports import Protocol
+
+    class WritableBinaryFile(Protocol):  # pylint: disable=too-few-public-methods
+        """
+        The file-like objects that downloads can be written to
+        """
+        def write(self, data: bytes, /) -> object:
+            """ Write the data """
+
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Content-Range: bytes <first>-<last>/<complete length or *>
+_CONTENT_RANGE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$")
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DownloadNotResumable(RequestsConnectionError):
+    """
+    Raised when a download was cut off, and the server did not resume it where it left off when
+    asked (it ignored the Range header, or the file changed since the download started)
+    """
+
+
+class DownloadOutcome(NamedTuple):
+    """
+    The result of a download. received is the number of bytes written, and resumes is the number
+    of times it was cut off and resumed. length is the length of the file, if the server said.
+    """
+    url: str
+    received: int
+    resumes: int
+    length: int | None
+
+
+def _validator(response: requests.Response) -> str | None:
+    """
+    Returns the validator which an If-Range header must have for the server to resume the
+    download of the response only if the file has not changed: its strong ETag, or failing
+    that, its Last-Modified date. Returns None if it has neither, since it cannot be resumed safely.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _encoded(response: requests.Response) -> bool:
+    """
+    Returns True if the body of the response is compressed (or otherwise encoded), in which case
+    byte ranges of it are not byte ranges of the file
+    """
+    return response.headers.get("Content-Encoding", "identity").strip().lower() not in ("", "identity")
+
+
+def _iter_body(response: requests.Response, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yield the (unencoded) body of the response as it arrives, raising the same exceptions as
+    requests.Response.iter_content. Unlike it, this yields every byte received before the body
+    is cut off, rather than discarding the last partial chunk.
+    """
+    # read1 returns whatever has arrived (up to the chunk size), rather than waiting for a whole
+    # chunk, so nothing is lost if a read times out part way through one (it is only available
+    # in urllib3 2.3 and later; before that, read does not wait for a whole chunk at the end
+    # of a body which is cut off, but does if a read times out)
+    read1 = getattr(response.raw, "read1", None)
+    try:
+        if read1 is None:
+            yield from response.raw.stream(chunk_size, decode_content=False)
+            return
+        while chunk := read1(chunk_size, decode_content=False):
+            yield chunk
+    except ProtocolError as err:
+        raise ChunkedEncodingError(err) from err
+    except ReadTimeoutError as err:
+        raise RequestsConnectionError(err) from err
+    except SSLError as err:
+        raise RequestsSSLError(err) from err
+
+
+def _length(response: requests.Response) -> int | None:
+    """
+    Returns the length of the complete file, from the Content-Range or Content-Length of the
+    response, if it has one
+    """
+    content_range = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+    if content_range is not None:
+        return None if content_range.group(3) == "*" else int(content_range.group(3))
+    content_length = response.headers.get("Content-Length", "")
+    return int(content_length) if content_length.isdigit() else None
+
+
+def _resumes_at(response: requests.Response, offset: int) -> bool:
+    """
+    Returns True if the response is the rest of the file, starting at the specified offset
+    """
+    if response.status_code != 206:
+        return False
+    content_range = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+    return content_range is not None and int(content_range.group(1)) == offset
+
+
+def _check_complete(response: requests.Response, written: int) -> None:
+    """
+    Raise ChunkedEncodingError if fewer bytes were written from the body of the response than
+    its Content-Length (older versions of urllib3 do not check this themselves)
+    """
+    expected = response.headers.get("Content-Length", "")
+    if expected.isdigit() and written < int(expected):
+        raise ChunkedEncodingError(ProtocolError(f"Response ended after {written} of {expected} bytes"),
+                                   response=response)
+
+
+def _requests_error(err: MaxRetryError, request: requests.PreparedRequest | None) -> RequestsConnectionError:
+    """
+    Return the requests exception to raise when the retries of a download are exhausted
+    """
+    if is_circuit_open(err):
+        return CircuitOpen(err, request=request)
+    return RequestsConnectionError(err, request=request)
+
+
+def resumable_download(  # pylint: disable=too-many-locals
+    session: requests.Session,
+    url: str,
+    file: WritableBinaryFile,
+    *,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    **kwargs: Any,
+) -> DownloadOutcome:
+    """
+    Stream the body of a GET request to the URL (made with the keyword arguments of
+    requests.Session.request) into the file, using the specified session, which must use a
+    retry adapter for the URL. Like any other request, the request is retried (before its
+    response is returned) according to the retry adapter. Then, if the body is cut off (the
+    connection is reset, or a read times out), the retry policy of the adapter decides whether
+    (and after what backoff) to carry on: the request is made again with a Range header for the
+    rest of the body, and an If-Range header, so that it is only resumed if the file has not
+    changed. Each time counts as a read error retry (for example, it is reported to the event
+    hooks, and is limited by the retries of the adapter); once they are exhausted, ConnectionError
+    is raised. Retries made before a resumed response is returned are counted separately.
+
+    An HTTPError is raised (by raise_for_status) if the first response is an error, and
+    DownloadNotResumable if a resumed response is not the rest of the file. If the file has
+    no strong ETag or Last-Modified date, it cannot be resumed safely, so the error that cut it
+    off is raised instead. The same goes if the server compresses the file: unless an
+    Accept-Encoding header is specified, it is requested without compression, since a download
+    can only be resumed where it left off if it is not.
+    """
+    validate_positive_int("chunk_size", chunk_size)
+    # A SharedAdapter (see AdapterRegistry) wraps a retry adapter
+    mounted = session.get_adapter(url)
+    adapter = getattr(mounted, "adapter", mounted)
+    if not isinstance(adapter, TimeoutHTTPAdapter):
+        raise ValueError(f"The session does not use a retry adapter for '{url}'")
+    retry: Retry = adapter.max_retries
+    pool = adapter.connection_pool(url)
+    headers = dict(kwargs.pop("headers", None) or {})
+    if not any(name.lower() == "accept-encoding" for name in headers):
+        headers["Accept-Encoding"] = "identity"
+    received = 0
+    resumes = 0
+    length: int | None = None
+    validator: str | None = None
+    while True:
+        request_headers = dict(headers)
+        if received:
+            request_headers["Range"] = f"bytes={received}-"
+            request_headers["If-Range"] = validator or ""
+        with session.get(url, headers=request_headers, stream=True, **kwargs) as response:
+            if not received:
+                response.raise_for_status()
+                validator = None if _encoded(response) else _validator(response)
+                length = _length(response)
+            elif not _resumes_at(response, received):
+                raise DownloadNotResumable(f"Resuming the download of '{url}' at byte {received} got a "
+                                           f"{response.status_code} response, not the rest of it",
+                                           request=response.request, response=response)
+            started_at = received
+            try:
+                body = _iter_body(response, chunk_size) if validator else response.iter_content(chunk_size)
+                for chunk in body:
+                    file.write(chunk)
+                    received += len(chunk)
+                _check_complete(response, received - started_at)
+                return DownloadOutcome(url=url, received=received, resumes=resumes, length=length)
+            except (ChunkedEncodingError, RequestsConnectionError) as err:
+                if validator is None:
+                    raise
+                # requests wraps the urllib3 error, which is what the Retry object expects
+                reason = err.args[0] if err.args and isinstance(err.args[0], Exception) else err
+                try:
+                    retry = retry.increment("GET", response.request.path_url, error=reason, _pool=pool,
+                                            _stacktrace=sys.exc_info()[2])
+                except MaxRetryError as u3err:
+                    raise _requests_error(u3err, response.request) from err
+                except Urllib3HTTPError:
+                    # The retry policy does not retry read errors at all
+                    raise err from None
+        LOGGER.debug("Resuming the download of '%s' at byte %d", url, received)
+        retry.sleep()
+        resumes += 1
@@ -0,0 +1,212 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Functions for making many requests concurrently over one retry session
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+import copy
+import itertools
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+import requests
+
+from .adapter_registry import SharedAdapter
+from .requests_retry_session import DEFAULT_POOL_MAXSIZE
+from .timeout_http_adapter import TimeoutHTTPAdapter
+from .utils import validate_positive_int
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .typing_imports import Callable, Iterable, Iterator, Mapping
+
+    type RequestSpecType = RequestSpec | str
+    type SendFunctionType = Callable[[RequestSpec], requests.Response]
+
+
+class RequestSpec(NamedTuple):
+    """
+    A request to make: the HTTP method, the URL, and any other keyword arguments
+    for requests.Session.request (params, json, headers, and so on)
+    """
+    method: str
+    url: str
+    kwargs: Mapping[str, Any] | None = None
+
+
+class RequestOutcome(NamedTuple):
+    """
+    The result of one request from a batch. position is the index of the request in the
+    input. Exactly one of response and error is set: error is the exception raised by
+    requests (for example, RetryError or ConnectionError) if the request failed.
+    """
+    position: int
+    spec: RequestSpec
+    response: requests.Response | None
+    error: requests.RequestException | None
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if a response was received, regardless of its status code
+        """
+        return self.error is None
+
+
+def as_request_spec(spec: RequestSpecType) -> RequestSpec:
+    """
+    A URL on its own is shorthand for a GET request
+    """
+    if isinstance(spec, str):
+        return RequestSpec(method="GET", url=spec)
+    return spec
+
+
+def session_pool_maxsize(session: requests.Session, url: str) -> int:
+    """
+    Returns the pool_maxsize of the retry adapter the session would use for the URL,
+    or DEFAULT_POOL_MAXSIZE if it is not using one
+    """
+    adapter = session.get_adapter(url)
+    if isinstance(adapter, SharedAdapter):
+        adapter = adapter.adapter
+    if isinstance(adapter, TimeoutHTTPAdapter):
+        return adapter.pool_maxsize
+    return DEFAULT_POOL_MAXSIZE
+
+
+def _worker_session(session: requests.Session) -> requests.Session:
+    """
+    Returns a new session with the settings (headers, auth, cookies, hooks, and so on) of the
+    specified one, for use by another thread, since sessions are not thread safe. It shares the
+    adapters of the session (which are thread safe), and so their connection pools, so it must
+    not be closed, since that would close them. Its cookies are a copy, so cookies set by its
+    responses are not seen by the session, or by its other worker sessions.
+    """
+    worker = requests.Session()
+    for attr in requests.Session.__attrs__:
+        setattr(worker, attr, copy.copy(getattr(session, attr)))
+    return worker
+
+
+def _send_one(send: SendFunctionType, position: int, spec: RequestSpec) -> RequestOutcome:
+    """
+    Make one request, capturing any requests exception in the outcome
+    """
+    try:
+        return RequestOutcome(position=position, spec=spec, response=send(spec), error=None)
+    except requests.RequestException as err:
+        return RequestOutcome(position=position, spec=spec, response=None, error=err)
+
+
+def map_with(
+    send: SendFunctionType,
+    specs: Iterable[RequestSpecType],
+    *,
+    max_workers: int,
+    ordered: bool = False,
+) -> Iterator[RequestOutcome]:
+    """
+    Make every request using the send function, with at most max_workers in flight at once,
+    and yield their outcomes, either as they complete, or (if ordered is True) in input order.
+    The specs are consumed lazily, so they may come from a generator. If ordered is True,
+    the outcomes which completed before that of an earlier request count towards max_workers
+    until they are yielded, so that no more than max_workers responses are held at once.
+    Exceptions other than requests exceptions are not captured, and end the batch.
+    """
+    validate_positive_int("max_workers", max_workers)
+    spec_iter = enumerate(as_request_spec(spec) for spec in specs)
+    in_flight: set[Future[RequestOutcome]] = set()
+    # Completed outcomes that cannot be yielded yet, because ordered is True
+    # and an earlier request is still in flight
+    pending: dict[int, RequestOutcome] = {}
+    next_position = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            while len(in_flight) + len(pending) < max_workers:
+                item = next(spec_iter, None)
+                if item is None:
+                    break
+                position, spec = item
+                in_flight.add(executor.submit(_send_one, send, position, spec))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = future.result()
+                if not ordered:
+                    yield outcome
+                    continue
+                pending[outcome.position] = outcome
+            while next_position in pending:
+                yield pending.pop(next_position)
+                next_position += 1
+
+
+def map_requests(
+    session: requests.Session,
+    specs: Iterable[RequestSpecType],
+    *,
+    max_workers: int | None = None,
+    ordered: bool = False,
+) -> Iterator[RequestOutcome]:
+    """
+    Make the requests concurrently using the specified session (typically a retry session),
+    and yield a RequestOutcome for each, either as they complete, or (if ordered is True) in
+    input order. A request that fails with a requests exception (including RetryError once its
+    retries are exhausted) does not affect the others; the exception is in its outcome.
+
+    Since sessions are not thread safe, each worker thread makes its requests with its own
+    session (see _worker_session), which shares the adapters of the specified session.
+
+    By default, the number of worker threads is the pool_maxsize of the session's retry adapter
+    for the first URL, so that every worker can have its own pooled connection.
+    """
+    spec_iter: Iterator[RequestSpecType] = iter(specs)
+    if max_workers is None:
+        first = next(spec_iter, None)
+        if first is None:
+            return iter(())
+        max_workers = session_pool_maxsize(session, as_request_spec(first).url)
+        spec_iter = itertools.chain((first,), spec_iter)
+
+    local = threading.local()
+
+    def _send(spec: RequestSpec) -> requests.Response:
+        worker: requests.Session | None = getattr(local, "session", None)
+        if worker is None:
+            worker = local.session = _worker_session(session)
+        return worker.request(spec.method, spec.url, **(spec.kwargs or {}))
+
+    return map_with(_send, spec_iter, max_workers=max_workers, ordered=ordered)
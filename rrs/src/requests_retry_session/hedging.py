@@ -0,0 +1,308 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+HedgingPolicy class: sends a second (hedge) attempt of slow idempotent requests, to cut tail latency
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import socket
+import threading
+from typing import TYPE_CHECKING
+
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from .retry_budget import RetryBudget
+from .utils import validate_optional_instance, validate_positive_int, validate_positive_number
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from requests import Response
+
+    from .typing_imports import Collection, Iterator
+
+    try:
+        # See connection_pools.py
+        from urllib3._base_connection import BaseHTTPConnection  # type: ignore[import,unused-ignore]
+    except ImportError:
+        from urllib3.connection import HTTPConnection as BaseHTTPConnection
+
+
+DEFAULT_HEDGE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+DEFAULT_HEDGE_QUANTILE = 0.95
+DEFAULT_INITIAL_HEDGE_DELAY = 1.0
+DEFAULT_LATENCY_WINDOW = 100
+DEFAULT_MAX_HEDGE_WORKERS = 64
+DEFAULT_MIN_LATENCY_SAMPLES = 20
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HedgingPolicy:
+    """
+    When to hedge a request: if a request using one of the methods (which must be idempotent)
+    has not been answered after the hedge delay, a second attempt (with its own retries) is sent
+    on another pooled connection. The first response wins; the other attempt is cancelled: if it
+    is already running, the connection it is using is shut down (so it is released at once, rather
+    than once its response arrives), and it stops instead of retrying or backing off (see
+    HedgeCancellation). If both attempts fail, the error of the first is raised.
+
+    The hedge delay is delay seconds, if it is specified. Otherwise, it is the quantile of the
+    latencies of the last latency_window requests to the host (or initial_delay, until
+    min_samples latencies have been observed). The latency of a hedged request is that of its
+    first attempt: if the hedge wins, how long the first attempt ran until it was cancelled.
+
+    Every hedge spends a token from budget (a RetryBudget), and every successful request the
+    policy applies to deposits to it, so that hedging adds a bounded fraction to the load on a host. Requests
+    are not hedged while it is empty. If no budget is specified, each policy has its own.
+
+    A policy is passed to requests_retry_adapter (and the other entry points) as the hedging
+    argument. It may be shared by several adapters. Each adapter using it runs its hedged
+    requests in up to max_workers threads (async sessions use tasks instead).
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            delay: float | None = None,
+            *,
+            quantile: float = DEFAULT_HEDGE_QUANTILE,
+            initial_delay: float = DEFAULT_INITIAL_HEDGE_DELAY,
+            min_samples: int = DEFAULT_MIN_LATENCY_SAMPLES,
+            latency_window: int = DEFAULT_LATENCY_WINDOW,
+            methods: Collection[str] = DEFAULT_HEDGE_METHODS,
+            budget: RetryBudget | None = None,
+            max_workers: int = DEFAULT_MAX_HEDGE_WORKERS) -> None:
+        if delay is not None:
+            validate_positive_number("delay", delay)
+        validate_positive_number("quantile", quantile)
+        if quantile > 1:
+            raise ValueError(f"quantile must be no greater than 1, not {quantile}")
+        validate_positive_number("initial_delay", initial_delay)
+        validate_positive_int("min_samples", min_samples)
+        validate_positive_int("latency_window", latency_window)
+        if min_samples > latency_window:
+            raise ValueError(f"min_samples ({min_samples}) must be no greater than latency_window ({latency_window})")
+        validate_optional_instance("budget", budget, RetryBudget)
+        validate_positive_int("max_workers", max_workers)
+        self.delay = delay
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.latency_window = latency_window
+        self.methods = frozenset(method.upper() for method in methods)
+        self.budget = RetryBudget() if budget is None else budget
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+
+    def applies(self, method: str | None) -> bool:
+        """
+        Returns True if requests with the specified method may be hedged
+        """
+        return method is not None and method.upper() in self.methods
+
+    def hedge_delay(self, key: str) -> float:
+        """
+        Returns how long to wait for a response to a request to the host with the specified key
+        (see host_key) before hedging it
+        """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(latencies)
+        return ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+    def record_latency(self, key: str, latency: float) -> None:
+        """
+        Record how long a request to the host with the specified key took to be answered
+        """
+        if self.delay is not None:
+            return
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = deque(maxlen=self.latency_window)
+                self._latencies[key] = latencies
+            latencies.append(latency)
+
+    def try_hedge(self, key: str, method: str) -> bool:
+        """
+        Spend a token from the budget for a hedge of a request to the host with the specified key,
+        if there is one. Returns True if the request may be hedged.
+        """
+        if self.budget.try_spend():
+            LOGGER.debug("Hedging %s request to '%s'", method, key)
+            return True
+        LOGGER.debug("Hedging budget exhausted; not hedging %s request to '%s'", method, key)
+        return False
+
+    def record_success(self) -> None:
+        """
+        Record a successful request (which the policy applies to) with the budget
+        """
+        self.budget.deposit()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(delay={self.delay}, quantile={self.quantile}, "
+                f"initial_delay={self.initial_delay}, methods={sorted(self.methods)}, budget={self.budget})")
+
+
+class HedgeCancelledError(Urllib3HTTPError):
+    """
+    The reason given in the MaxRetryError raised when a hedged attempt is cancelled, because the
+    other attempt of its request won
+    """
+
+
+class HedgeCancellation:
+    """
+    Lets a running hedged attempt be cancelled. Once it is cancelled, RetryWithLogs does not
+    retry it or back off (and the connection pool does not make another attempt), and the
+    connection it is using (if any) is shut down, so that the attempt fails at once and the
+    connection is released, rather than waiting for its response.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._conn: BaseHTTPConnection | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """ True once the attempt has been cancelled """
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """
+        Cancel the attempt, shutting down the connection it is using, if any
+        """
+        with self._lock:
+            self._cancelled.set()
+            conn = self._conn
+        if conn is not None:
+            _shut_down(conn)
+
+    def wait(self, seconds: float) -> bool:
+        """
+        Wait for up to the specified number of seconds, or until the attempt is cancelled.
+        Returns True if it has been cancelled.
+        """
+        return self._cancelled.wait(seconds)
+
+    def using_connection(self, conn: BaseHTTPConnection) -> None:
+        """
+        Record that the attempt has taken the connection from its pool (shutting it down at once,
+        if the attempt has been cancelled)
+        """
+        with self._lock:
+            self._conn = conn
+            cancelled = self._cancelled.is_set()
+        if cancelled:
+            _shut_down(conn)
+
+    def released_connection(self, conn: BaseHTTPConnection | None) -> None:
+        """
+        Record that a connection has been returned to its pool, so that it is no longer the
+        attempt's to shut down
+        """
+        with self._lock:
+            if conn is None or conn is self._conn:
+                self._conn = None
+
+
+def _shut_down(conn: BaseHTTPConnection) -> None:
+    """
+    Shut down the socket of the connection (if it has one), so that a read or write blocked on it
+    in another thread fails at once. The thread using it closes it.
+    """
+    sock = getattr(conn, "sock", None)
+    if sock is None:
+        return
+    try:
+        # Bypass the SSLSocket override, which also unwraps the socket from under its reader
+        socket.socket.shutdown(sock, socket.SHUT_RDWR)
+    except OSError as err:
+        LOGGER.debug("Error shutting down the connection of a cancelled hedged attempt: %s", err)
+
+
+_ACTIVE_HEDGE_CANCELLATION: ContextVar[HedgeCancellation | None] = ContextVar(
+    "active_hedge_cancellation", default=None)
+
+
+def active_hedge_cancellation() -> HedgeCancellation | None:
+    """
+    Returns the cancellation of the hedged attempt being made in the current context, if any
+    """
+    return _ACTIVE_HEDGE_CANCELLATION.get()
+
+
+@contextmanager
+def using_hedge_cancellation(cancellation: HedgeCancellation | None) -> Iterator[None]:
+    """
+    Make the specified cancellation the active one within the context
+    """
+    token = _ACTIVE_HEDGE_CANCELLATION.set(cancellation)
+    try:
+        yield
+    finally:
+        _ACTIVE_HEDGE_CANCELLATION.reset(token)
+
+
+def _discard_response(future: Future[Response]) -> None:
+    """
+    Close the response of a losing attempt, if it got one, releasing its connection
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def first_response(futures: list[Future[Response]], cancellations: list[HedgeCancellation]) -> Future[Response]:
+    """
+    Wait for the first of the attempts to return a response, and return it (or the first attempt,
+    if all of them fail). The others are cancelled: those which have not started are never run,
+    and those which have are cancelled with their HedgeCancellation (the cancellation of each
+    attempt is at the same index as its future), and their responses (if they get any) are
+    closed when they arrive.
+    """
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = next((future for future in futures if future in done and future.exception() is None), None)
+        if winner is not None:
+            for loser, cancellation in zip(futures, cancellations):
+                if loser is not winner and not loser.cancel():
+                    cancellation.cancel()
+                    loser.add_done_callback(_discard_response)
+            return winner
+    return futures[0]
@@ -0,0 +1,356 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+RetryMetrics class: in-process counters and latency histograms for requests and their retries
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+)
+
+if TYPE_CHECKING:
+    from .typing_imports import Iterator, Sequence
+
+    try:
+        # See retry_with_logs.py
+        from urllib3 import BaseHTTPResponse  # type: ignore[import,attr-defined,unused-ignore]
+    except ImportError:
+        from urllib3 import HTTPResponse as BaseHTTPResponse
+
+
+# The upper bounds (in seconds) of the latency histogram buckets. Latencies above
+# the last bound are counted in an additional overflow bucket.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def retry_cause(error: Exception | None, response: BaseHTTPResponse | None) -> str:
+    """
+    Returns why an attempt failed: its status code (as a string) for a response, otherwise
+    "connect" or "read" for the errors which urllib3 counts as such, or "other"
+    """
+    if error is None:
+        return "other" if response is None else str(response.status)
+    if isinstance(error, ConnectTimeoutError):
+        return "connect"
+    if isinstance(error, (ReadTimeoutError, ProtocolError)):
+        return "read"
+    return "other"
+
+
+def is_timeout(error: Exception | None) -> bool:
+    """
+    Returns True if the specified error is a connect or read timeout
+    """
+    return isinstance(error, ReadTimeoutError) or (
+        isinstance(error, ConnectTimeoutError) and not isinstance(error, NewConnectionError))
+
+
+class LatencyHistogram(NamedTuple):
+    """
+    buckets: The upper bounds of the buckets, in seconds
+    counts: The number of latencies in each bucket (that is, greater than the bound of the
+            previous bucket, and no greater than its own), plus the number above the last bound
+    samples: The total number of latencies
+    total: The sum of the latencies, in seconds
+    """
+    buckets: tuple[float, ...]
+    counts: tuple[int, ...]
+    samples: int
+    total: float
+
+    @property
+    def mean(self) -> float:
+        """ The mean latency, in seconds """
+        return self.total / self.samples if self.samples else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the upper bound of the bucket containing the specified quantile (between 0 and 1)
+        of the latencies, or infinity if it is in the overflow bucket
+        """
+        target = q * self.samples
+        seen = 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), self.counts):
+            seen += bucket_count
+            if seen >= target and seen:
+                return bound
+        return 0.0
+
+
+class EndpointMetrics(NamedTuple):
+    """
+    The metrics for one host and method.
+
+    requests: The number of requests (each of which may have made several attempts)
+    attempts: The number of attempts
+    retries: The number of retries, by the cause of the failed attempt (see retry_cause)
+    exhausted: The number of requests which stopped retrying without succeeding
+    timeouts: The number of attempts which timed out
+    attempt_latency: The latencies of the attempts
+    request_latency: The latencies of the requests, including all attempts and backoffs
+    """
+    requests: int
+    attempts: int
+    retries: dict[str, int]
+    exhausted: int
+    timeouts: int
+    attempt_latency: LatencyHistogram
+    request_latency: LatencyHistogram
+
+
+@dataclass(slots=True)
+class _Histogram:
+    """
+    The mutable state of a latency histogram
+    """
+    counts: list[int]
+    total: float = 0.0
+
+    def add(self, buckets: tuple[float, ...], latency: float) -> None:
+        """ Record a latency """
+        self.counts[bisect_left(buckets, latency)] += 1
+        self.total += latency
+
+    def snapshot(self, buckets: tuple[float, ...]) -> LatencyHistogram:
+        """ Returns an immutable copy """
+        return LatencyHistogram(buckets=buckets, counts=tuple(self.counts), samples=sum(self.counts),
+                                total=self.total)
+
+
+@dataclass(slots=True)
+class _Endpoint:
+    """
+    The mutable metrics for one host and method. Each has its own lock, so that
+    requests to different endpoints never contend.
+    """
+    attempt_latency: _Histogram
+    request_latency: _Histogram
+    requests: int = 0
+    attempts: int = 0
+    retries: dict[str, int] = field(default_factory=dict)
+    exhausted: int = 0
+    timeouts: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass(slots=True)
+class _RequestTiming:
+    """
+    When the request being made, and its current attempt, started
+    """
+    started: float
+    attempt_started: float
+    # Whether the current attempt has been recorded already
+    attempt_recorded: bool = False
+    # Whether the request was deferred (see defer_timing), rather than finished, when its context exited
+    deferred: bool = False
+
+
+_ACTIVE_TIMING: ContextVar[_RequestTiming | None] = ContextVar("active_timing", default=None)
+
+
+@contextmanager
+def timing_attempts(resumed: _RequestTiming | None = None) -> Iterator[_RequestTiming]:
+    """
+    Times the request made within the context, and its attempts (see attempt_elapsed).
+    If the timing of a deferred request is specified, its next attempt starts now.
+    """
+    now = time.monotonic()
+    if resumed is None:
+        timing = _RequestTiming(started=now, attempt_started=now)
+    else:
+        timing = resumed
+        timing.attempt_started = now
+        timing.attempt_recorded = timing.deferred = False
+    token = _ACTIVE_TIMING.set(timing)
+    try:
+        yield timing
+    finally:
+        _ACTIVE_TIMING.reset(token)
+
+
+def attempt_elapsed() -> float | None:
+    """
+    Returns how long the current attempt of the request being timed in the current context
+    has taken so far, in seconds, or None if no request is being timed
+    """
+    timing = _ACTIVE_TIMING.get()
+    return None if timing is None else time.monotonic() - timing.attempt_started
+
+
+def defer_timing() -> _RequestTiming | None:
+    """
+    Mark the request being timed in the current context (if any) as deferred, so that it is not
+    recorded as finished when its context exits, and return its timing, to be resumed later
+    """
+    timing = _ACTIVE_TIMING.get()
+    if timing is not None:
+        timing.deferred = True
+    return timing
+
+
+def start_next_attempt() -> None:
+    """
+    Mark the start of the next attempt of the request being timed in the current context, if any
+    """
+    timing = _ACTIVE_TIMING.get()
+    if timing is not None:
+        timing.attempt_started = time.monotonic()
+        timing.attempt_recorded = False
+
+
+class RetryMetrics:
+    """
+    Counters and latency histograms for requests and their attempts, by host key (see host_key)
+    and method.
+
+    A metrics object is passed to requests_retry_adapter (and the other entry points) as the
+    metrics argument, and is available as the metrics attribute of the adapter, its
+    RetryWithLogs, and RetrySessionManager. The same object may be shared by several adapters.
+    Recording only takes a lock per endpoint, so threads making requests to different
+    endpoints do not contend.
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        buckets = tuple(float(bound) for bound in latency_buckets)
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("latency_buckets must be a non-empty sequence of increasing numbers")
+        self.latency_buckets = buckets
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], _Endpoint] = {}
+
+    def _endpoint(self, key: str, method: str) -> _Endpoint:
+        """
+        Returns the metrics for the specified host key and method, creating them if needed
+        """
+        endpoint = self._endpoints.get((key, method))
+        if endpoint is None:
+            with self._lock:
+                endpoint = self._endpoints.get((key, method))
+                if endpoint is None:
+                    size = len(self.latency_buckets) + 1
+                    endpoint = _Endpoint(attempt_latency=_Histogram([0] * size),
+                                         request_latency=_Histogram([0] * size))
+                    self._endpoints[(key, method)] = endpoint
+        return endpoint
+
+    @contextmanager
+    def timing_request(self, key: str, method: str, resumed: _RequestTiming | None = None) -> Iterator[None]:
+        """
+        Times the request made within the context, and records it (and its final attempt,
+        if that has not already been recorded as failed) on exit, unless it was deferred.
+        If the timing of a deferred request is specified, it is resumed.
+        """
+        with timing_attempts(resumed) as timing:
+            try:
+                yield
+            finally:
+                if not timing.deferred:
+                    self._record_request(key, method, timing)
+
+    def _record_request(self, key: str, method: str, timing: _RequestTiming) -> None:
+        """
+        Record a finished request (and its final attempt, if that has not already been recorded)
+        """
+        now = time.monotonic()
+        endpoint = self._endpoint(key, method)
+        with endpoint.lock:
+            endpoint.requests += 1
+            endpoint.request_latency.add(self.latency_buckets, now - timing.started)
+            if not timing.attempt_recorded:
+                endpoint.attempts += 1
+                endpoint.attempt_latency.add(self.latency_buckets, now - timing.attempt_started)
+
+    def record_failed_attempt(self, key: str, method: str, error: Exception | None) -> None:
+        """
+        Record a failed attempt of the request being timed in the current context
+        """
+        timing = _ACTIVE_TIMING.get()
+        endpoint = self._endpoint(key, method)
+        with endpoint.lock:
+            endpoint.attempts += 1
+            if is_timeout(error):
+                endpoint.timeouts += 1
+            if timing is not None and not timing.attempt_recorded:
+                endpoint.attempt_latency.add(self.latency_buckets, time.monotonic() - timing.attempt_started)
+        if timing is not None:
+            timing.attempt_recorded = True
+
+    def record_retry(self, key: str, method: str, cause: str) -> None:
+        """
+        Record a retry, and its cause
+        """
+        endpoint = self._endpoint(key, method)
+        with endpoint.lock:
+            endpoint.retries[cause] = endpoint.retries.get(cause, 0) + 1
+
+    def record_exhausted(self, key: str, method: str) -> None:
+        """
+        Record a request which stopped retrying without succeeding
+        """
+        endpoint = self._endpoint(key, method)
+        with endpoint.lock:
+            endpoint.exhausted += 1
+
+    def snapshot(self) -> dict[tuple[str, str], EndpointMetrics]:
+        """
+        Returns a copy of the metrics, keyed by (host key, method)
+        """
+        with self._lock:
+            endpoints = list(self._endpoints.items())
+        result: dict[tuple[str, str], EndpointMetrics] = {}
+        for endpoint_key, endpoint in endpoints:
+            with endpoint.lock:
+                result[endpoint_key] = EndpointMetrics(
+                    requests=endpoint.requests, attempts=endpoint.attempts, retries=dict(endpoint.retries),
+                    exhausted=endpoint.exhausted, timeouts=endpoint.timeouts,
+                    attempt_latency=endpoint.attempt_latency.snapshot(self.latency_buckets),
+                    request_latency=endpoint.request_latency.snapshot(self.latency_buckets))
+        return result
+
+    def reset(self) -> None:
+        """
+        Discard all of the metrics
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(latency_buckets={self.latency_buckets})"
@@ -0,0 +1,170 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Functions for opening the pooled connections of a retry session before they are needed
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from .connection_lifetime import using_connection_lifetime
+from .connection_pools import TrackedHTTPConnectionPool
+from .deadline import split_timeout
+from .timeout_http_adapter import TimeoutHTTPAdapter
+from .utils import validate_positive_int
+
+if TYPE_CHECKING:
+    from .typing_imports import Sequence
+
+    try:
+        # We tell mypy to ignore this if this fails.
+        # We also have to specify unused-ignore, since this only fails sometimes,
+        # depending on the version of urllib3 that is installed
+        from urllib3._base_connection import BaseHTTPConnection  # type: ignore[import,unused-ignore]
+    except ImportError:
+        # Older versions of urllib3 need this adjustment
+        from urllib3.connection import HTTPConnection as BaseHTTPConnection
+
+
+DEFAULT_PREWARM_CONNECTIONS = 1
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PrewarmOutcome(NamedTuple):
+    """
+    The result of prewarming the connections to one base URL. connected is the number of pooled
+    connections to its host which are now connected (including any which already were), and
+    errors are the exceptions raised for those which could not be connected (or for the URL
+    itself, if it cannot be prewarmed at all).
+    """
+    url: str
+    connected: int
+    errors: tuple[Exception, ...]
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if no connection failed
+        """
+        return not self.errors
+
+
+def validate_prewarm_args(urls: object, connections: object) -> None:
+    """
+    Raise TypeError or ValueError if either of the specified prewarm arguments is invalid
+    """
+    if urls is not None:
+        if not isinstance(urls, (list, tuple)):
+            raise TypeError(f"prewarm_urls must be a list or tuple, not {type(urls).__name__}")
+        for url in urls:
+            if not isinstance(url, str):
+                raise TypeError(f"prewarm_urls must only contain strs, not {type(url).__name__}")
+    validate_positive_int("prewarm_connections", connections)
+
+
+def _retry_pool(session: requests.Session, url: str) -> tuple[TimeoutHTTPAdapter, TrackedHTTPConnectionPool]:
+    """
+    Returns the retry adapter which the session would use for a request to the URL, and its
+    connection pool for the URL. Raises ValueError if it does not use a retry adapter, or
+    its connections cannot be prewarmed (such as connections through proxies).
+    """
+    # A SharedAdapter (see AdapterRegistry) wraps a retry adapter. It is not imported here,
+    # because that would be a circular import (requests_retry_session uses this module).
+    mounted = session.get_adapter(url)
+    adapter = getattr(mounted, "adapter", mounted)
+    if not isinstance(adapter, TimeoutHTTPAdapter):
+        raise ValueError(f"The session does not use a retry adapter for '{url}'")
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    pool = adapter.connection_pool(url, verify=settings["verify"], cert=settings["cert"],
+                                   proxies=settings["proxies"])
+    if not isinstance(pool, TrackedHTTPConnectionPool):
+        raise ValueError(f"Connections for '{url}' cannot be prewarmed (they are made through a proxy)")
+    return adapter, pool
+
+
+def prewarm_session(
+    session: requests.Session,
+    urls: Sequence[str],
+    connections: int = DEFAULT_PREWARM_CONNECTIONS,
+) -> list[PrewarmOutcome]:
+    """
+    Open (and for HTTPS, handshake) up to the specified number of pooled connections to each of
+    the base URLs, in the connection pools of the retry adapters the session uses for them, so
+    that the first requests to them do not have to wait for new connections. The connections
+    are all opened in parallel, using the connect timeout of the adapter, and no more are opened
+    than the pools can hold (pool_maxsize). Pooled connections which are already connected
+    count towards the number.
+
+    Failures do not stop the other connections from being opened, or raise exceptions: they are
+    logged, and returned in the PrewarmOutcome of their URL (one for each URL, in input order).
+    """
+    validate_prewarm_args(urls, connections)
+    errors: list[list[Exception]] = [[] for _ in urls]
+    connected = [0] * len(urls)
+    with ExitStack() as stack:
+        tasks: list[tuple[int, TrackedHTTPConnectionPool, BaseHTTPConnection, float | None]] = []
+        for index, url in enumerate(urls):
+            try:
+                adapter, pool = _retry_pool(session, url)
+            except (requests.RequestException, Urllib3HTTPError, ValueError) as err:
+                LOGGER.warning("Not prewarming connections for '%s': %s", url, err)
+                errors[index].append(err)
+                continue
+            timeout, _ = split_timeout(adapter.timeout)
+            # Like requests sent through the adapter, this lets its lifetime policy track the pool,
+            # and reconnect pooled connections which have expired
+            with using_connection_lifetime(adapter.connection_lifetime):
+                conns = stack.enter_context(pool.taken_connections(connections))
+            tasks.extend((index, pool, conn, timeout) for conn in conns)
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="prewarm") as executor:
+                results = list(executor.map(lambda task: _connect(*task[1:]), tasks))
+            for (index, _, _, _), error in zip(tasks, results):
+                if error is None:
+                    connected[index] += 1
+                else:
+                    LOGGER.warning("Failed to prewarm a connection for '%s': %s", urls[index], error)
+                    errors[index].append(error)
+    return [PrewarmOutcome(url=url, connected=connected[index], errors=tuple(errors[index]))
+            for index, url in enumerate(urls)]
+
+
+def _connect(pool: TrackedHTTPConnectionPool, conn: BaseHTTPConnection, timeout: float | None) -> Exception | None:
+    """
+    Connect the connection, and return the exception raised if that failed
+    """
+    try:
+        pool.connect(conn, timeout)
+    except (OSError, Urllib3HTTPError) as err:
+        return err
+    return None
@@ -0,0 +1,216 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+RateLimiter class: limits the rate of attempts to each host, with a token bucket per host
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, MaxRetryError
+
+from .deadline import active_deadline
+from .utils import validate_non_negative_number, validate_positive_number
+
+if TYPE_CHECKING:
+    from .typing_imports import Iterator
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RateLimitedError(Urllib3HTTPError):
+    """
+    The reason given in the MaxRetryError raised when an attempt would have to wait longer
+    for the rate limit of its host than it is allowed to
+    """
+
+
+class RateLimited(RequestsConnectionError):
+    """
+    Raised instead of making a request (or instead of retrying it) when it would have to wait
+    longer for the rate limit of its host than it is allowed to
+    """
+
+
+def is_rate_limited(err: BaseException) -> bool:
+    """
+    Returns True if the specified urllib3 or requests exception was caused by a rate limit
+    """
+    if isinstance(err, RequestsConnectionError) and err.args:
+        return is_rate_limited(err.args[0])
+    return isinstance(err, MaxRetryError) and isinstance(err.reason, RateLimitedError)
+
+
+class RateLimiterStats(NamedTuple):
+    """
+    acquired: The number of attempts which were allowed (after waiting, if need be)
+    delayed: The number of those attempts which had to wait
+    rejected: The number of attempts which were not made, because they would have had to wait too long
+    total_wait: The total time (in seconds) that attempts waited
+    longest_wait: The longest time (in seconds) that an attempt waited
+    """
+    acquired: int
+    delayed: int
+    rejected: int
+    total_wait: float
+    longest_wait: float
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """
+    The tokens of one host (negative when attempts are waiting for them), as of updated_at
+    """
+    tokens: float
+    updated_at: float
+
+
+class RateLimiter:
+    """
+    A token bucket for each host (scheme://host:port), which refills at rate tokens per second,
+    and holds at most burst tokens. Every attempt to a host (the first attempt of each request,
+    and each of its retries) takes a token from its bucket. If there is none, the attempt waits
+    for its turn, so that the attempts to each host are spread out at the rate, instead of
+    arriving in bursts.
+
+    If max_wait is set, an attempt which would have to wait longer than max_wait seconds is not
+    made (with max_wait=0, attempts fail fast instead of waiting), and neither is one which would
+    have to wait past the overall deadline of its request: RateLimited is raised instead.
+
+    A limiter is passed to requests_retry_adapter (and the other entry points) as the
+    rate_limiter argument. The same limiter can be shared by any number of adapters and threads,
+    and then limits their combined rate.
+    """
+
+    def __init__(self,
+                 rate: float,
+                 burst: float = 1.0,
+                 max_wait: float | None = None) -> None:
+        validate_positive_number("rate", rate)
+        validate_positive_number("burst", burst)
+        if max_wait is not None:
+            validate_non_negative_number("max_wait", max_wait)
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._longest_wait = 0.0
+
+    def reserve(self, key: str, max_wait: float | None = None) -> float | None:
+        """
+        Take a token from the bucket of the host, and return how long (in seconds) the attempt
+        must wait before it is made. If it would have to wait longer than max_wait (or than the
+        max_wait of the limiter, if that is lower), no token is taken, and None is returned.
+        """
+        if self.max_wait is not None:
+            max_wait = self.max_wait if max_wait is None else min(max_wait, self.max_wait)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(tokens=self.burst, updated_at=now)
+            else:
+                bucket.tokens = min(bucket.tokens + (now - bucket.updated_at) * self.rate, self.burst)
+                bucket.updated_at = now
+            wait = max(1 - bucket.tokens, 0.0) / self.rate
+            if max_wait is not None and wait > max_wait:
+                self._rejected += 1
+                return None
+            bucket.tokens -= 1
+            self._acquired += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._longest_wait = max(self._longest_wait, wait)
+            return wait
+
+    def acquire(self, key: str) -> bool:
+        """
+        Wait until the next attempt to the host can be made. Returns False (without waiting) if
+        it would have to wait longer than max_wait, or past the deadline of the active request.
+        """
+        deadline = active_deadline()
+        wait = self.reserve(key, None if deadline is None else max(deadline.remaining(), 0.0))
+        if wait is None:
+            return False
+        if wait > 0:
+            LOGGER.debug("Waiting %.3fs for the rate limit of '%s'", wait, key)
+            time.sleep(wait)
+        return True
+
+    def stats(self) -> RateLimiterStats:
+        """
+        Returns the counters
+        """
+        with self._lock:
+            return RateLimiterStats(acquired=self._acquired, delayed=self._delayed, rejected=self._rejected,
+                                    total_wait=self._total_wait, longest_wait=self._longest_wait)
+
+    def reset(self) -> None:
+        """
+        Refill the buckets and zero the counters
+        """
+        with self._lock:
+            self._buckets.clear()
+            self._acquired = self._delayed = self._rejected = 0
+            self._total_wait = self._longest_wait = 0.0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rate={self.rate}, burst={self.burst}, max_wait={self.max_wait})"
+
+
+_ACTIVE_RATE_LIMITER: ContextVar[RateLimiter | None] = ContextVar("active_rate_limiter", default=None)
+
+
+def active_rate_limiter() -> RateLimiter | None:
+    """
+    Returns the rate limiter of the request being made in the current context, if any
+    """
+    return _ACTIVE_RATE_LIMITER.get()
+
+
+@contextmanager
+def using_rate_limiter(limiter: RateLimiter | None) -> Iterator[None]:
+    """
+    Make the specified rate limiter the active one within the context
+    """
+    token = _ACTIVE_RATE_LIMITER.set(limiter)
+    try:
+        yield
+    finally:
+        _ACTIVE_RATE_LIMITER.reset(token)
@@ -27,20 +27,54 @@ Requests session functions and classes
 
 from __future__ import annotations
 
+import random
+import ssl
 from typing import TYPE_CHECKING
 
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
 
+from .adaptive_timeout import AdaptiveTimeout
+from .backoff import (
+    validate_backoff_strategy,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_BACKOFF_STRATEGY,
+)
+from .bulkhead import Bulkhead
+from .circuit_breaker import CircuitBreaker
+from .connection_lifetime import ConnectionLifetimePolicy
+from .hedging import HedgingPolicy
+from .metrics import RetryMetrics
+from .prewarm import prewarm_session, validate_prewarm_args, DEFAULT_PREWARM_CONNECTIONS
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry_after_pause import RetryAfterPause
+from .retry_budget import RetryBudget
+from .retry_events import validate_event_hooks
 from .retry_with_logs import RetryWithLogs
+from .single_flight import SingleFlight
+from .stale_connections import StaleConnectionPolicy
 from .timeout_http_adapter import TimeoutHTTPAdapter
 from .typing_imports import (
     Collection,
     Iterable,
+    Sequence,
     TypedDict,
 )
-from .utils import NotPassed, NOT_PASSED
+from .utils import (
+    validate_bool,
+    validate_int,
+    validate_optional_instance,
+    validate_positive_int,
+    validate_positive_number,
+    NotPassed,
+    NOT_PASSED,
+)
 
 if TYPE_CHECKING:
+    from .adapter_registry import AdapterRegistry
+    from .backoff import BackoffStrategyType
+    from .retry_events import RetryEventHook
     from .typing_imports import Unpack
 
 
@@ -63,11 +97,18 @@ if TYPE_CHECKING:
 
 DEFAULT_BACKOFF_FACTOR = 0.5
 DEFAULT_CONNECT_TIMEOUT = 3
+# The pool defaults match those of requests itself: 10 pools (one per host),
+# each holding up to 10 connections, not blocking when the pool is exhausted
+DEFAULT_POOL_BLOCK: bool = DEFAULT_POOLBLOCK
+DEFAULT_POOL_CONNECTIONS: int = DEFAULT_POOLSIZE
+DEFAULT_POOL_MAXSIZE: int = DEFAULT_POOLSIZE
 # Protocols should omit the trailing "://" because it will be automatically appended
 DEFAULT_PROTOCOL: ProtocolType = ('http', 'https')
 DEFAULT_READ_TIMEOUT = 10
 DEFAULT_RETRIES = 10
 DEFAULT_STATUS_FORCELIST: StatusForcelistType = (500, 502, 503, 504)
+# By default, requests have no overall deadline
+DEFAULT_TOTAL_TIMEOUT: float | None = None
 
 
 class RequestsRetryAdapterArgs(TypedDict, total=False):
@@ -81,9 +122,67 @@ class RequestsRetryAdapterArgs(TypedDict, total=False):
     allowed_methods: AllowedMethodsType
     connect_timeout: float
     read_timeout: float
+    pool_connections: int
+    pool_maxsize: int
+    pool_block: bool
+    total_timeout: float | None
+    adaptive_timeout: AdaptiveTimeout | None
+    circuit_breaker: CircuitBreaker | None
+    retry_budget: RetryBudget | None
+    metrics: RetryMetrics | None
+    event_hooks: Sequence[RetryEventHook] | None
+    hedging: HedgingPolicy | None
+    cache: ResponseCache | None
+    single_flight: SingleFlight | None
+    stale_connections: StaleConnectionPolicy | None
+    connection_lifetime: ConnectionLifetimePolicy | None
+    ssl_context: ssl.SSLContext | None
+    rate_limiter: RateLimiter | None
+    bulkhead: Bulkhead | None
+    retry_after_pause: RetryAfterPause | None
+    backoff_strategy: BackoffStrategyType
+    backoff_max: float
+    backoff_seed: int | None
 
 
-def requests_session(adapter: requests.adapters.HTTPAdapter,
+def validate_adapter_args(adapter_kwargs: RequestsRetryAdapterArgs) -> None:
+    """
+    Raise TypeError or ValueError if any of the specified requests_retry_adapter
+    arguments are invalid. This lets callers that create their adapters lazily
+    (like RetrySessionManager) report bad arguments up front.
+    """
+    if "pool_connections" in adapter_kwargs:
+        validate_positive_int("pool_connections", adapter_kwargs["pool_connections"])
+    if "pool_maxsize" in adapter_kwargs:
+        validate_positive_int("pool_maxsize", adapter_kwargs["pool_maxsize"])
+    if "pool_block" in adapter_kwargs:
+        validate_bool("pool_block", adapter_kwargs["pool_block"])
+    if adapter_kwargs.get("total_timeout") is not None:
+        validate_positive_number("total_timeout", adapter_kwargs["total_timeout"])
+    validate_optional_instance("adaptive_timeout", adapter_kwargs.get("adaptive_timeout"), AdaptiveTimeout)
+    validate_optional_instance("circuit_breaker", adapter_kwargs.get("circuit_breaker"), CircuitBreaker)
+    validate_optional_instance("retry_budget", adapter_kwargs.get("retry_budget"), RetryBudget)
+    validate_optional_instance("metrics", adapter_kwargs.get("metrics"), RetryMetrics)
+    validate_event_hooks("event_hooks", adapter_kwargs.get("event_hooks"))
+    validate_optional_instance("hedging", adapter_kwargs.get("hedging"), HedgingPolicy)
+    validate_optional_instance("cache", adapter_kwargs.get("cache"), ResponseCache)
+    validate_optional_instance("single_flight", adapter_kwargs.get("single_flight"), SingleFlight)
+    validate_optional_instance("stale_connections", adapter_kwargs.get("stale_connections"), StaleConnectionPolicy)
+    validate_optional_instance("connection_lifetime", adapter_kwargs.get("connection_lifetime"),
+                               ConnectionLifetimePolicy)
+    validate_optional_instance("ssl_context", adapter_kwargs.get("ssl_context"), ssl.SSLContext)
+    validate_optional_instance("rate_limiter", adapter_kwargs.get("rate_limiter"), RateLimiter)
+    validate_optional_instance("bulkhead", adapter_kwargs.get("bulkhead"), Bulkhead)
+    validate_optional_instance("retry_after_pause", adapter_kwargs.get("retry_after_pause"), RetryAfterPause)
+    if "backoff_strategy" in adapter_kwargs:
+        validate_backoff_strategy(adapter_kwargs["backoff_strategy"])
+    if "backoff_max" in adapter_kwargs:
+        validate_positive_number("backoff_max", adapter_kwargs["backoff_max"])
+    if adapter_kwargs.get("backoff_seed") is not None:
+        validate_int("backoff_seed", adapter_kwargs["backoff_seed"])
+
+
+def requests_session(adapter: requests.adapters.BaseAdapter,
                      session: requests.Session | None = None,
                      protocol: ProtocolType = DEFAULT_PROTOCOL) -> requests.Session:
     """
@@ -99,16 +198,24 @@ def requests_session(adapter: requests.adapters.HTTPAdapter,
     return session
 
 
-def requests_retry_adapter(  # pylint: disable=too-many-positional-arguments
+def requests_retry(  # pylint: disable=too-many-arguments
+        *,
         retries: int = DEFAULT_RETRIES,
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
         status_forcelist: StatusForcelistType = DEFAULT_STATUS_FORCELIST,
-        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
-        read_timeout: float = DEFAULT_READ_TIMEOUT,
-        allowed_methods: AllowedMethodsType | NotPassed = NOT_PASSED
-) -> TimeoutHTTPAdapter:
+        allowed_methods: AllowedMethodsType | NotPassed = NOT_PASSED,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        metrics: RetryMetrics | None = None,
+        event_hooks: Sequence[RetryEventHook] | None = None,
+        bulkhead: Bulkhead | None = None,
+        backoff_strategy: BackoffStrategyType = DEFAULT_BACKOFF_STRATEGY,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        backoff_seed: int | None = None
+) -> RetryWithLogs:
     """
-    Return a TimeoutHTTPAdapter based on the specified arguments
+    Return the RetryWithLogs object used by requests_retry_adapter for the specified arguments
     """
     retry_kwargs: _RetryArgs = {
         "total": retries,
@@ -119,19 +226,184 @@ def requests_retry_adapter(  # pylint: disable=too-many-positional-arguments
     if not isinstance(allowed_methods, NotPassed):
         retry_kwargs["allowed_methods"] = allowed_methods
     retry = RetryWithLogs(**retry_kwargs)
-    return TimeoutHTTPAdapter(max_retries=retry,
-                              timeout=(connect_timeout, read_timeout))
+    retry.adaptive_timeout = adaptive_timeout
+    retry.circuit_breaker = circuit_breaker
+    retry.bulkhead = bulkhead
+    retry.retry_budget = retry_budget
+    retry.metrics = metrics
+    if event_hooks is not None:
+        retry.event_hooks = tuple(event_hooks)
+    retry.backoff_strategy = backoff_strategy
+    retry.backoff_max = backoff_max
+    if backoff_strategy != "exponential":
+        # Each adapter has its own random generator, so a seed makes its backoffs repeatable
+        retry.backoff_random = random.Random(backoff_seed)
+    return retry
+
+
+def requests_retry_adapter(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        status_forcelist: StatusForcelistType = DEFAULT_STATUS_FORCELIST,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        allowed_methods: AllowedMethodsType | NotPassed = NOT_PASSED,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOL_BLOCK,
+        total_timeout: float | None = DEFAULT_TOTAL_TIMEOUT,
+        adaptive_timeout: AdaptiveTimeout | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        metrics: RetryMetrics | None = None,
+        event_hooks: Sequence[RetryEventHook] | None = None,
+        hedging: HedgingPolicy | None = None,
+        cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        stale_connections: StaleConnectionPolicy | None = None,
+        connection_lifetime: ConnectionLifetimePolicy | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+        rate_limiter: RateLimiter | None = None,
+        bulkhead: Bulkhead | None = None,
+        retry_after_pause: RetryAfterPause | None = None,
+        backoff_strategy: BackoffStrategyType = DEFAULT_BACKOFF_STRATEGY,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        backoff_seed: int | None = None
+) -> TimeoutHTTPAdapter:
+    """
+    Return a TimeoutHTTPAdapter based on the specified arguments
+
+    pool_connections is the number of per-host connection pools to cache, pool_maxsize is
+    the maximum number of connections kept in each of those pools, and pool_block controls
+    whether a request waits for a free connection when a pool is exhausted (True), or opens
+    a new connection that is discarded afterwards (False). Size pool_maxsize to at least the
+    number of threads sharing the adapter, to avoid "Connection pool is full" churn.
+
+    connect_timeout and read_timeout apply to each attempt. total_timeout, if specified, is the
+    overall deadline for each request, spanning all of its attempts and backoff sleeps; once it
+    passes, DeadlineExceeded is raised. It can be overridden for a single request by passing a
+    TotalTimeout as the timeout of that request. If an adaptive_timeout is specified, the read
+    timeout of each attempt is derived from the observed latency of its host, and read_timeout
+    (or the timeout of the request) is its upper bound (see AdaptiveTimeout).
+
+    If a circuit_breaker is specified, it tracks the failed attempts to each host, and requests
+    to a host whose circuit is open fail fast with CircuitOpen (see CircuitBreaker). A breaker
+    may be shared between adapters. Likewise, if a retry_budget is specified, retries are
+    limited to a fraction of successful requests (see RetryBudget). If metrics are specified,
+    requests, attempts, and retries are counted and timed with them (see RetryMetrics).
+    If event_hooks are specified, they are called with a RetryEvent for every failed attempt,
+    instead of the default hook, which logs it (an empty sequence disables the retry logging).
+    If hedging is specified, slow idempotent requests are hedged with a second attempt
+    (see HedgingPolicy). If a cache is specified, GET responses are stored in it, and served
+    from it (after revalidation, once they are stale) when possible (see ResponseCache).
+    If single_flight is specified, concurrent identical GET and HEAD requests share a single
+    request (and its retries), and each gets its own copy of the response (see SingleFlight).
+    If stale_connections is specified, requests whose pooled connection turns out to have been
+    closed by the server are replayed immediately on a new connection, without using up a retry,
+    and connections which have been idle for too long are not reused (see StaleConnectionPolicy).
+    If connection_lifetime is specified, pooled connections which have been idle or open for too
+    long are closed when they are next used, or by a background reaper (see ConnectionLifetimePolicy).
+    If an ssl_context is specified, it is used for HTTPS requests which verify certificates with
+    the default CA bundle (verify=True, which requests replaces with the REQUESTS_CA_BUNDLE or
+    CURL_CA_BUNDLE environment variable, if the session trusts the environment and either is set),
+    and do not present a client certificate (cert), so that the bundle is only loaded once. It may
+    be shared between adapters; if it is a ResumingSSLContext (see create_ssl_context and shared_ssl_context),
+    their new connections resume the TLS sessions of earlier ones, skipping full handshakes.
+    If a rate_limiter is specified, every attempt to a host (including retries) waits for its
+    rate limit, or fails with RateLimited if it would have to wait too long (see RateLimiter).
+    A limiter may be shared between adapters, to limit their combined rate.
+    If a bulkhead is specified, it limits the number of concurrent requests to each host: requests
+    beyond the limit wait for room, or fail with BulkheadFull if they would have to wait too long.
+    An adaptive bulkhead cuts the limit of a host when its attempts time out or get a response with
+    a status in status_forcelist, and raises it again as requests succeed (see Bulkhead).
+    If a retry_after_pause is specified, a Retry-After header on a response which is retried pauses
+    every request to its host (through the adapter, or any other sharing the pause) until then,
+    up to its max_pause, rather than only the request which got it (see RetryAfterPause).
+
+    backoff_strategy is one of exponential (the urllib3 backoff), full_jitter, equal_jitter, or
+    decorrelated_jitter; the jittered strategies spread out the retries of clients which failed
+    at the same time (see jittered_backoff). Backoffs are capped at backoff_max seconds. If a
+    backoff_seed is specified, the jittered backoffs of the adapter are repeatable.
+    """
+    validate_adapter_args({"pool_connections": pool_connections,
+                           "pool_maxsize": pool_maxsize,
+                           "pool_block": pool_block,
+                           "total_timeout": total_timeout,
+                           "adaptive_timeout": adaptive_timeout,
+                           "circuit_breaker": circuit_breaker,
+                           "retry_budget": retry_budget,
+                           "metrics": metrics,
+                           "event_hooks": event_hooks,
+                           "hedging": hedging,
+                           "cache": cache,
+                           "single_flight": single_flight,
+                           "stale_connections": stale_connections,
+                           "connection_lifetime": connection_lifetime,
+                           "ssl_context": ssl_context,
+                           "rate_limiter": rate_limiter,
+                           "bulkhead": bulkhead,
+                           "retry_after_pause": retry_after_pause,
+                           "backoff_strategy": backoff_strategy,
+                           "backoff_max": backoff_max,
+                           "backoff_seed": backoff_seed})
+    retry = requests_retry(retries=retries,
+                           backoff_factor=backoff_factor,
+                           status_forcelist=status_forcelist,
+                           allowed_methods=allowed_methods,
+                           adaptive_timeout=adaptive_timeout,
+                           circuit_breaker=circuit_breaker,
+                           retry_budget=retry_budget,
+                           metrics=metrics,
+                           event_hooks=event_hooks,
+                           bulkhead=bulkhead,
+                           backoff_strategy=backoff_strategy,
+                           backoff_max=backoff_max,
+                           backoff_seed=backoff_seed)
+    return TimeoutHTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              max_retries=retry,
+                              pool_block=pool_block,
+                              timeout=(connect_timeout, read_timeout),
+                              total_timeout=total_timeout,
+                              hedging=hedging,
+                              cache=cache,
+                              single_flight=single_flight,
+                              stale_connections=stale_connections,
+                              connection_lifetime=connection_lifetime,
+                              ssl_context=ssl_context,
+                              rate_limiter=rate_limiter,
+                              bulkhead=bulkhead,
+                              retry_after_pause=retry_after_pause)
 
 
 def requests_retry_session(
         session: requests.Session | None = None,
         protocol: ProtocolType = DEFAULT_PROTOCOL,
+        adapter_registry: AdapterRegistry | None = None,
+        prewarm_urls: Sequence[str] | None = None,
+        prewarm_connections: int = DEFAULT_PREWARM_CONNECTIONS,
         **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]
 ) -> requests.Session:
     """
     Protocols should omit the trailing "://" because it will be automatically appended later
+
+    If an adapter registry is specified, the session uses the registry's shared adapter for
+    these arguments (see AdapterRegistry), which is released when the session is closed.
+
+    If prewarm_urls are specified, up to prewarm_connections pooled connections to each of them
+    are opened (in parallel) before the session is returned (see prewarm_session). Connections
+    which cannot be opened are logged, rather than raising an exception.
     """
-    adapter = requests_retry_adapter(**adapter_kwargs)
-    return requests_session(adapter=adapter,
-                            session=session,
-                            protocol=protocol)
+    validate_prewarm_args(prewarm_urls, prewarm_connections)
+    adapter: requests.adapters.BaseAdapter
+    if adapter_registry is not None:
+        adapter = adapter_registry.acquire(**adapter_kwargs)
+    else:
+        adapter = requests_retry_adapter(**adapter_kwargs)
+    retry_session = requests_session(adapter=adapter,
+                                     session=session,
+                                     protocol=protocol)
+    if prewarm_urls:
+        prewarm_session(retry_session, prewarm_urls, prewarm_connections)
+    return retry_session
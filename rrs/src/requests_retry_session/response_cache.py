@@ -0,0 +1,404 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+ResponseCache class: an in-memory HTTP cache for GET responses, with ETag/Last-Modified revalidation
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+import io
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .utils import validate_positive_int
+
+if TYPE_CHECKING:
+    from requests import PreparedRequest
+
+    from .typing_imports import Callable, Mapping
+
+    type SendFunctionType = Callable[[PreparedRequest], Response]
+
+
+DEFAULT_MAX_CACHE_ENTRIES = 256
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# Responses with these status codes are stored
+CACHEABLE_STATUSES = frozenset({200, 203})
+# Successful requests with other methods invalidate the stored response for their URL
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+# Requests with these headers are conditional already, so they bypass the cache
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since", "If-Match", "If-Unmodified-Since", "If-Range")
+# Requests with these headers may get responses meant only for their sender, so they are only
+# answered with (and their responses are only stored if they are) responses marked as shareable
+CREDENTIAL_HEADERS = ("Authorization", "Cookie")
+# The Cache-Control directives which mark a response to a request with credentials as shareable
+SHARED_DIRECTIVES = ("public", "s-maxage", "must-revalidate")
+# Headers of a 304 response which do not replace those of the stored response
+_UNMERGED_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding", "content-range"})
+# Headers which describe how a body was encoded in transit, rather than the decoded body
+_ENCODING_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding"})
+
+
+class CacheStats(NamedTuple):
+    """
+    hits: The number of responses served from the cache without a request
+    misses: The number of requests which could not be answered from the cache
+    revalidations: The number of stale responses which were revalidated (with a 304 response),
+                   and served from the cache
+    stores: The number of responses stored
+    evictions: The number of stored responses evicted to keep within the size limits
+    entries: The number of responses currently stored
+    size: The total size of the bodies of the responses currently stored, in bytes
+    """
+    hits: int
+    misses: int
+    revalidations: int
+    stores: int
+    evictions: int
+    entries: int
+    size: int
+
+
+def cache_directives(header: str | None) -> dict[str, str | None]:
+    """
+    Returns the directives of a Cache-Control header, with lowercase names and unquoted values
+    """
+    directives: dict[str, str | None] = {}
+    for directive in (header or "").split(","):
+        name, sep, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if sep else None
+    return directives
+
+
+def _http_date(value: str | None) -> float | None:
+    """
+    Returns the timestamp of an HTTP date header value, or None if it is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _seconds(value: str | None) -> float | None:
+    """
+    Returns the number of seconds in a delta-seconds value, or None if it is missing or invalid
+    """
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """
+    Returns how many more seconds a response with the specified headers is fresh for,
+    according to its Cache-Control (max-age or no-cache), Expires, Date, and Age headers
+    """
+    directives = cache_directives(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0.0
+    lifetime = _seconds(directives.get("max-age"))
+    if lifetime is None:
+        expires = _http_date(headers.get("Expires"))
+        if expires is None:
+            return 0.0
+        date = _http_date(headers.get("Date"))
+        lifetime = expires - (time.time() if date is None else date)
+    return lifetime - (_seconds(headers.get("Age")) or 0.0)
+
+
+def _has_credentials(request: PreparedRequest) -> bool:
+    """
+    Returns True if the request has an Authorization or Cookie header
+    """
+    return any(header in request.headers for header in CREDENTIAL_HEADERS)
+
+
+def _shareable(directives: Mapping[str, str | None]) -> bool:
+    """
+    Returns True if a response with the specified Cache-Control directives may be served to
+    requests with credentials (other than the one it answered)
+    """
+    return any(directive in directives for directive in SHARED_DIRECTIVES)
+
+
+def _private(request: PreparedRequest, response: Response) -> bool:
+    """
+    Returns True if the response is meant only for the sender of the request: its Cache-Control
+    has private, or the request has credentials and the response is not marked as shareable
+    """
+    directives = cache_directives(response.headers.get("Cache-Control"))
+    return "private" in directives or (_has_credentials(request) and not _shareable(directives))
+
+
+def decoded_headers(headers: Mapping[str, str], content: bytes) -> dict[str, str]:
+    """
+    Returns the headers of a response, rewritten for its decoded body (the content): without
+    Content-Encoding and Transfer-Encoding, and with the Content-Length of the content
+    """
+    decoded = {name: value for name, value in headers.items() if name.lower() not in _ENCODING_HEADERS}
+    decoded["Content-Length"] = str(len(content))
+    return decoded
+
+
+def replay_response(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        request: PreparedRequest,
+        status: int,
+        reason: str | None,
+        headers: Mapping[str, str],
+        content: bytes,
+        elapsed: timedelta = timedelta(0)) -> Response:
+    """
+    Returns a new Response to the request, with the specified status, headers, and body
+    (which it reads from memory, rather than from a connection)
+    """
+    response = Response()
+    response.status_code = status
+    response.reason = reason or ""
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(content)
+    response.url = request.url or ""
+    response.request = request
+    response.elapsed = elapsed
+    return response
+
+
+@dataclass(slots=True)
+class _Entry:
+    """
+    A stored response
+    """
+    status: int
+    reason: str | None
+    headers: dict[str, str]
+    content: bytes
+    # The request headers named by the Vary header of the response, and their values
+    vary: tuple[tuple[str, str | None], ...]
+    # When the response becomes stale (time.monotonic)
+    expires_at: float
+    # Whether the response may be served to requests with credentials
+    shareable: bool
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """ The conditional request headers which revalidate the response """
+        headers = CaseInsensitiveDict(self.headers)
+        validators: dict[str, str] = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        return validators
+
+    def matches(self, request: PreparedRequest) -> bool:
+        """
+        Returns True if the request has the same values of the Vary headers, and either has no
+        credentials, or the response may be served to requests with credentials
+        """
+        if not self.shareable and _has_credentials(request):
+            return False
+        return all(request.headers.get(name) == value for name, value in self.vary)
+
+    def response(self, request: PreparedRequest) -> Response:
+        """ Returns a new Response for the request, with the stored status, headers, and body """
+        return replay_response(request, self.status, self.reason, self.headers, self.content)
+
+
+class ResponseCache:
+    """
+    An in-memory cache of GET responses, shared by every request made through the adapters it
+    is attached to, and bounded by the number of responses and the total size of their bodies
+    (the least recently used responses are evicted first).
+
+    Responses with status 200 or 203 are stored unless their Cache-Control (or that of their
+    request) has no-store, or they Vary on every header. While a stored response is fresh
+    (according to its Cache-Control max-age, or its Expires header), it is served without
+    making a request. Once it is stale (or if the request has Cache-Control no-cache or max-age=0),
+    it is revalidated with If-None-Match and If-Modified-Since headers (from its ETag and
+    Last-Modified), and served from the cache if the response is 304 Not Modified. Responses with
+    neither a freshness lifetime nor a validator are not stored.
+
+    Since the cache may be shared by many sessions, responses marked private are never stored,
+    and requests with credentials (an Authorization or Cookie header) are only answered from the
+    cache, and their responses are only stored, if the response is marked as shareable (its
+    Cache-Control has public, s-maxage, or must-revalidate).
+
+    Streamed requests, and requests which are conditional already, bypass the cache. Successful
+    requests with unsafe methods (such as PUT or DELETE) evict the stored response for their URL.
+
+    A cache is passed to requests_retry_adapter (and the other entry points) as the cache argument.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_CACHE_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+        validate_positive_int("max_entries", max_entries)
+        validate_positive_int("max_bytes", max_bytes)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._hits = self._misses = self._revalidations = self._stores = self._evictions = 0
+
+    def send(self, request: PreparedRequest, send: SendFunctionType) -> Response:
+        """
+        Answer the request from the cache, or with the send function (revalidating the stored
+        response, if there is one), storing the response if it can be
+        """
+        url = request.url or ""
+        if request.method != "GET":
+            response = send(request)
+            if request.method not in SAFE_METHODS and response.status_code < 400:
+                self.invalidate(url)
+            return response
+        directives = cache_directives(request.headers.get("Cache-Control"))
+        if "no-store" in directives or any(header in request.headers for header in CONDITIONAL_HEADERS):
+            return send(request)
+        revalidate = "no-cache" in directives or _seconds(directives.get("max-age")) == 0
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and not entry.matches(request):
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(url)
+                if not revalidate and time.monotonic() < entry.expires_at:
+                    self._hits += 1
+                    return entry.response(request)
+            validators = {} if entry is None else entry.validators
+            if not validators:
+                self._misses += 1
+        if not validators:
+            response = send(request)
+            self._store(request, response)
+            return response
+        conditional = request.copy()
+        conditional.headers.update(validators)
+        response = send(conditional)
+        if response.status_code != 304 or entry is None:
+            with self._lock:
+                self._misses += 1
+            self._store(request, response)
+            return response
+        response.close()
+        with self._lock:
+            self._revalidations += 1
+            entry.headers.update((name, value) for name, value in response.headers.items()
+                                 if name.lower() not in _UNMERGED_HEADERS)
+            entry.expires_at = time.monotonic() + freshness_lifetime(CaseInsensitiveDict(entry.headers))
+            return entry.response(request)
+
+    def _store(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Store the response to the request, if it can be stored. Otherwise, unless it is a server
+        error, or is meant only for the sender of the request, evict any stored response for its
+        URL, since it has been superseded.
+        """
+        url = request.url or ""
+        entry = self._entry(request, response)
+        if entry is None and (response.status_code >= 500 or _private(request, response)):
+            return
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._size -= len(old.content)
+            if entry is None:
+                return
+            self._entries[url] = entry
+            self._size += len(entry.content)
+            self._stores += 1
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+                self._evictions += 1
+
+    def _entry(self, request: PreparedRequest, response: Response) -> _Entry | None:
+        """
+        Returns the entry for the response to the request, or None if it cannot be stored
+        """
+        if response.status_code not in CACHEABLE_STATUSES:
+            return None
+        directives = cache_directives(response.headers.get("Cache-Control"))
+        if "no-store" in directives or _private(request, response):
+            return None
+        vary_names = [name.strip() for name in response.headers.get("Vary", "").split(",") if name.strip()]
+        if "*" in vary_names:
+            return None
+        lifetime = freshness_lifetime(response.headers)
+        if lifetime <= 0 and "ETag" not in response.headers and "Last-Modified" not in response.headers:
+            return None
+        content = response.content
+        if len(content) > self.max_bytes:
+            return None
+        # The content is stored decoded, so the headers are rewritten to describe it
+        return _Entry(status=response.status_code, reason=response.reason,
+                      headers=decoded_headers(response.headers, content), content=content,
+                      vary=tuple((name, request.headers.get(name)) for name in vary_names),
+                      expires_at=time.monotonic() + lifetime, shareable=_shareable(directives))
+
+    def invalidate(self, url: str) -> None:
+        """
+        Evict the stored response for the specified URL, if there is one
+        """
+        with self._lock:
+            entry = self._entries.pop(url, None)
+            if entry is not None:
+                self._size -= len(entry.content)
+
+    def clear(self) -> None:
+        """
+        Evict every stored response, and zero the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = self._misses = self._revalidations = self._stores = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the counters, and the current number and size of the stored responses
+        """
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, revalidations=self._revalidations,
+                              stores=self._stores, evictions=self._evictions, entries=len(self._entries),
+                              size=self._size)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_entries={self.max_entries}, max_bytes={self.max_bytes})"
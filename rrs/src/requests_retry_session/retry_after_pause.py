@@ -0,0 +1,199 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+RetryAfterPause class: holds back every attempt to a host which has asked for a pause with Retry-After
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from .deadline import active_deadline
+from .utils import validate_positive_number
+
+if TYPE_CHECKING:
+    from .typing_imports import Iterator
+
+
+DEFAULT_MAX_PAUSE = 60.0
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RetryAfterPauseStats(NamedTuple):
+    """
+    pauses: The number of Retry-After headers which paused (or extended the pause of) a host
+    held: The number of attempts which waited for the pause of their host to end
+    rejected: The number of attempts which were not made, because the pause of their host would
+              have outlasted the deadline of their request
+    total_wait: The total time (in seconds) that attempts waited
+    longest_wait: The longest time (in seconds) that an attempt waited
+    """
+    pauses: int
+    held: int
+    rejected: int
+    total_wait: float
+    longest_wait: float
+
+
+class RetryAfterPause:
+    """
+    Coordinates the backoff of every request to a host when it asks for a pause. When a response
+    which would be retried (with a status that urllib3 respects Retry-After for, such as 503 or
+    429) has a Retry-After header, the host (scheme://host:port) is paused until then, capped at
+    max_pause seconds from now. Every attempt to the host (the first attempt of each request, and
+    each of its retries) waits for its pause to end before it is made, so that other threads stop
+    sending it requests which would only get the same response, instead of each of them backing
+    off on its own. An attempt whose request has an overall deadline which the pause would
+    outlast is not made: DeadlineExceeded is raised instead.
+
+    A pause is passed to requests_retry_adapter (and the other entry points) as the
+    retry_after_pause argument. The same pause can be shared by any number of adapters and
+    threads, and then pauses all of their requests to the host.
+    """
+
+    def __init__(self, max_pause: float = DEFAULT_MAX_PAUSE) -> None:
+        validate_positive_number("max_pause", max_pause)
+        self.max_pause = max_pause
+        self._lock = threading.Lock()
+        # The monotonic time until which each host is paused
+        self._not_before: dict[str, float] = {}
+        self._pauses = 0
+        self._held = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._longest_wait = 0.0
+
+    def pause(self, key: str, retry_after: float) -> float:
+        """
+        Pause the host for retry_after seconds (capped at max_pause), unless it is already paused
+        for longer. Returns how long (in seconds) it is now paused for.
+        """
+        now = time.monotonic()
+        with self._lock:
+            not_before = now + min(max(retry_after, 0.0), self.max_pause)
+            if not_before > self._not_before.get(key, now):
+                self._not_before[key] = not_before
+                self._pauses += 1
+                LOGGER.info("Pausing requests to '%s' for %.3fs (Retry-After)", key, not_before - now)
+            return max(self._not_before.get(key, now) - now, 0.0)
+
+    def remaining(self, key: str) -> float:
+        """
+        Returns how long (in seconds) the host is still paused for (0 if it is not paused)
+        """
+        now = time.monotonic()
+        with self._lock:
+            not_before = self._not_before.get(key)
+            if not_before is not None and not_before <= now:
+                del self._not_before[key]
+                not_before = None
+            return 0.0 if not_before is None else not_before - now
+
+    def reserve(self, key: str, max_wait: float | None = None) -> float | None:
+        """
+        Returns how long (in seconds) an attempt to the host must wait for its pause to end before
+        it is made, counting it. If it would have to wait longer than max_wait, None is returned.
+        """
+        wait = self.remaining(key)
+        if wait <= 0:
+            return 0.0
+        with self._lock:
+            if max_wait is not None and wait > max_wait:
+                self._rejected += 1
+                return None
+            self._held += 1
+            self._total_wait += wait
+            self._longest_wait = max(self._longest_wait, wait)
+        return wait
+
+    def wait(self, key: str) -> bool:
+        """
+        Wait until the pause of the host (if any) has ended. Returns False (without waiting) if
+        it would have to wait past the deadline of the active request.
+        """
+        deadline = active_deadline()
+        wait = self.reserve(key, None if deadline is None else max(deadline.remaining(), 0.0))
+        if wait is None:
+            return False
+        if wait > 0:
+            LOGGER.debug("Waiting %.3fs for the Retry-After pause of '%s' to end", wait, key)
+            time.sleep(wait)
+        return True
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Returns how long (in seconds) each paused host is still paused for, keyed by host key
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {key: not_before - now for key, not_before in self._not_before.items() if not_before > now}
+
+    def stats(self) -> RetryAfterPauseStats:
+        """
+        Returns the counters
+        """
+        with self._lock:
+            return RetryAfterPauseStats(pauses=self._pauses, held=self._held, rejected=self._rejected,
+                                        total_wait=self._total_wait, longest_wait=self._longest_wait)
+
+    def reset(self) -> None:
+        """
+        End every pause and zero the counters
+        """
+        with self._lock:
+            self._not_before.clear()
+            self._pauses = self._held = self._rejected = 0
+            self._total_wait = self._longest_wait = 0.0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_pause={self.max_pause})"
+
+
+_ACTIVE_RETRY_AFTER_PAUSE: ContextVar[RetryAfterPause | None] = ContextVar(
+    "active_retry_after_pause", default=None)
+
+
+def active_retry_after_pause() -> RetryAfterPause | None:
+    """
+    Returns the Retry-After pause of the request being made in the current context, if any
+    """
+    return _ACTIVE_RETRY_AFTER_PAUSE.get()
+
+
+@contextmanager
+def using_retry_after_pause(pause: RetryAfterPause | None) -> Iterator[None]:
+    """
+    Make the specified Retry-After pause the active one within the context
+    """
+    token = _ACTIVE_RETRY_AFTER_PAUSE.set(pause)
+    try:
+        yield
+    finally:
+        _ACTIVE_RETRY_AFTER_PAUSE.reset(token)
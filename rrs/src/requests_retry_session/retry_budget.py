@@ -0,0 +1,135 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+RetryBudget class: limits retries to a fraction of successful requests, to prevent retry storms
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple
+
+from .utils import validate_positive_number
+
+
+DEFAULT_MAX_TOKENS = 10.0
+DEFAULT_RETRY_RATIO = 0.1
+
+
+class RetryBudgetStats(NamedTuple):
+    """
+    tokens: The number of tokens currently in the bucket (each retry costs one)
+    deposits: The number of successful requests which have deposited tokens
+    retries: The number of retries which were allowed
+    denied: The number of retries which were denied because the budget was exhausted
+    """
+    tokens: float
+    deposits: int
+    retries: int
+    denied: int
+
+
+class RetryBudget:
+    """
+    A token bucket shared by every request made through the adapters it is attached to.
+
+    Each successful request deposits retry_ratio tokens, and each retry spends one token. The
+    bucket starts full, and holds at most max_tokens tokens. While it has less than one token,
+    RetryWithLogs makes no further attempts, so the last error or response is surfaced as though
+    the retries had been exhausted. With the defaults, retries can add at most 10% to the load on
+    an upstream service (plus a burst of 10), rather than multiplying it during an outage.
+
+    A budget is passed to requests_retry_adapter (and the other entry points) as the
+    retry_budget argument. The same budget can be shared by any number of adapters and threads.
+    """
+
+    def __init__(self,
+                 max_tokens: float = DEFAULT_MAX_TOKENS,
+                 retry_ratio: float = DEFAULT_RETRY_RATIO) -> None:
+        validate_positive_number("max_tokens", max_tokens)
+        validate_positive_number("retry_ratio", retry_ratio)
+        self.max_tokens = max_tokens
+        self.retry_ratio = retry_ratio
+        self._lock = threading.Lock()
+        self._tokens = float(max_tokens)
+        self._deposits = 0
+        self._retries = 0
+        self._denied = 0
+
+    @property
+    def tokens(self) -> float:
+        """ The number of tokens currently in the bucket """
+        return self._tokens
+
+    def can_retry(self) -> bool:
+        """
+        Returns True if the budget currently has a token for a retry, without spending it
+        (so this can change before try_spend() is called). If not, a denied retry is counted.
+        """
+        # Reading a float is atomic, so the lock is only needed to count a denial
+        if self._tokens >= 1:
+            return True
+        with self._lock:
+            self._denied += 1
+        return False
+
+    def try_spend(self) -> bool:
+        """
+        Spend a token for a retry, if there is one. Returns True if the retry is allowed.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self._denied += 1
+                return False
+            self._tokens -= 1
+            self._retries += 1
+            return True
+
+    def deposit(self) -> None:
+        """
+        Record a successful request
+        """
+        with self._lock:
+            self._tokens = min(self._tokens + self.retry_ratio, self.max_tokens)
+            self._deposits += 1
+
+    def stats(self) -> RetryBudgetStats:
+        """
+        Returns the current token count and counters
+        """
+        with self._lock:
+            return RetryBudgetStats(tokens=self._tokens, deposits=self._deposits,
+                                    retries=self._retries, denied=self._denied)
+
+    def reset(self) -> None:
+        """
+        Refill the bucket and zero the counters
+        """
+        with self._lock:
+            self._tokens = float(self.max_tokens)
+            self._deposits = self._retries = self._denied = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_tokens={self.max_tokens}, retry_ratio={self.retry_ratio})"
@@ -0,0 +1,108 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Deferring the retries of requests (instead of sleeping until they are due), for RetryScheduler
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .deadline import active_deadline
+from .metrics import defer_timing
+
+if TYPE_CHECKING:
+    from .deadline import Deadline
+    from .metrics import _RequestTiming
+    from .retry_with_logs import RetryWithLogs
+    from .typing_imports import Iterator
+
+
+class RetryDeferred(Exception):
+    """
+    Raised (instead of sleeping) by RetryWithLogs.sleep when the retry of a request is deferred,
+    to unwind the attempt that failed. It is caught by the RetryScheduler that made the request,
+    so it never reaches the caller.
+    """
+
+
+@dataclass(slots=True)
+class RetryDeferral:
+    """
+    The state of a request made by a RetryScheduler, carried from the attempt whose retry was
+    deferred to the next one: the Retry object to resume with, the deadline and timing of the
+    request, and how long to wait before resuming it
+    """
+    retry: RetryWithLogs | None = None
+    deadline: Deadline | None = None
+    timing: _RequestTiming | None = None
+    delay: float = 0.0
+    deferrals: int = 0
+
+    def defer(self, retry: RetryWithLogs, delay: float) -> None:
+        """
+        Defer the retry of the request for delay seconds, resuming it with the specified Retry
+        object (raising RetryDeferred to unwind the failed attempt)
+        """
+        self.retry = retry
+        self.delay = delay
+        self.deadline = active_deadline()
+        self.timing = defer_timing()
+        self.deferrals += 1
+        raise RetryDeferred(f"Retry deferred for {delay:.3f}s")
+
+    def take_retry(self) -> RetryWithLogs | None:
+        """
+        Returns the Retry object to resume the request with, if it is being resumed, and forgets it
+        (so that it is only used for the first attempt of the resumed request)
+        """
+        retry, self.retry = self.retry, None
+        return retry
+
+
+_ACTIVE_DEFERRAL: ContextVar[RetryDeferral | None] = ContextVar("active_deferral", default=None)
+
+
+def active_retry_deferral() -> RetryDeferral | None:
+    """
+    Returns the deferral state of the request being made in the current context, if its retries
+    are being deferred (see RetryScheduler)
+    """
+    return _ACTIVE_DEFERRAL.get()
+
+
+@contextmanager
+def using_retry_deferral(deferral: RetryDeferral | None) -> Iterator[None]:
+    """
+    Make the specified deferral state the active one within the context (None makes the
+    retries of requests made within it sleep, as usual)
+    """
+    token = _ACTIVE_DEFERRAL.set(deferral)
+    try:
+        yield
+    finally:
+        _ACTIVE_DEFERRAL.reset(token)
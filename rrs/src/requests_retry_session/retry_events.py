@@ -0,0 +1,108 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+RetryEvent class: a compact record of a failed attempt, delivered to retry event hooks
+"""
+
+from __future__ import annotations
+
+from typing import Literal, NamedTuple
+
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+
+from .typing_imports import Callable
+from .utils import format_host_key
+
+
+# What is done about a failed attempt:
+# retry: it is retried, after sleeping
+# exhausted: its retries are exhausted (or the error is not retried)
+# deadline_exceeded: its overall deadline has passed, or would be overrun by the sleep
+# circuit_open: the circuit breaker for its host is open
+# budget_exhausted: the retry budget has no tokens left
+type RetryEventKindType = Literal["retry", "exhausted", "deadline_exceeded", "circuit_open", "budget_exhausted"]
+
+
+class RetryEvent(NamedTuple):
+    """
+    A failed attempt of a request, and what is done about it.
+
+    Nothing is formatted when the event is created: the endpoint and host_key properties
+    build their strings only when they are used.
+
+    kind: What is done about the failed attempt (see RetryEventKindType)
+    method: The HTTP method of the request
+    scheme, host, port, url: The parts of the endpoint (url is the path and query)
+    status: The status code of the response to the attempt, if it got one
+    error_type: The class of the error raised by the attempt, if it raised one
+    attempt: The number of the failed attempt (1 for the first attempt)
+    elapsed: How long the failed attempt took, in seconds, if the adapter timed it
+    sleep: The planned sleep before the next attempt, in seconds, for retry events (and for
+           deadline_exceeded events, if it was the sleep which would overrun the deadline)
+    deadline: The overall deadline of the request, in seconds, if it has one
+    """
+    kind: RetryEventKindType
+    method: str
+    scheme: str
+    host: str | None
+    port: int | None
+    url: str
+    status: int | None
+    error_type: type[Exception] | None
+    attempt: int
+    elapsed: float | None = None
+    sleep: float | None = None
+    deadline: float | None = None
+
+    @property
+    def endpoint(self) -> str:
+        """ The endpoint of the request, as it appears in the log messages """
+        return f"{self.scheme}://{self.host}{self.url}"
+
+    @property
+    def host_key(self) -> str:
+        """ The key (scheme://host:port) of the host of the request """
+        return format_host_key(self.scheme, self.host, self.port)
+
+    @property
+    def timed_out(self) -> bool:
+        """ True if the attempt raised a timeout error """
+        return self.error_type is not None and issubclass(self.error_type, Urllib3TimeoutError)
+
+
+type RetryEventHook = Callable[[RetryEvent], None]
+
+
+def validate_event_hooks(name: str, value: object) -> None:
+    """
+    Raise TypeError if value is not None or a list or tuple of callables
+    """
+    if value is None:
+        return
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(f"{name} must be a list or tuple, not {type(value).__name__}")
+    for hook in value:
+        if not callable(hook):
+            raise TypeError(f"{name} must only contain callables, not {type(hook).__name__}")
@@ -0,0 +1,294 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+RetryLogAggregator class: a retry event hook which coalesces similar retry events into summary log lines
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import re
+import threading
+import time
+from typing import TYPE_CHECKING
+import weakref
+
+from .retry_with_logs import log_retry_event
+from .utils import validate_positive_number
+
+if TYPE_CHECKING:
+    from .retry_events import RetryEvent
+
+
+DEFAULT_AGGREGATION_WINDOW = 10.0
+DEFAULT_MAX_LINES_PER_SECOND = 10.0
+
+LOGGER = logging.getLogger(__name__)
+
+# Path segments which identify a particular resource: numbers, UUIDs, and long hex strings
+_ID_SEGMENT = re.compile(r"\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+                         r"|[0-9a-fA-F]{16,}")
+
+type AggregateKeyType = tuple[str, str, str, str]
+
+
+def path_template(url: str) -> str:
+    """
+    Returns the path of the specified URL (a path with an optional query), without its query,
+    and with the segments which identify a particular resource replaced by {id}
+    """
+    path = url.split("?", 1)[0].split("#", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.fullmatch(segment) else segment for segment in path.split("/"))
+
+
+@dataclass(slots=True)
+class _Aggregate:
+    """
+    The retry events for one key which have not been logged, since its window started
+    """
+    started: float
+    count: int = 0
+    kinds: dict[str, int] = field(default_factory=dict)
+    min_elapsed: float | None = None
+    max_elapsed: float | None = None
+    max_attempt: int = 0
+
+    def add(self, event: RetryEvent) -> None:
+        """ Add an event """
+        self.count += 1
+        self.kinds[event.kind] = self.kinds.get(event.kind, 0) + 1
+        self.max_attempt = max(self.max_attempt, event.attempt)
+        if event.elapsed is not None:
+            self.min_elapsed = event.elapsed if self.min_elapsed is None else min(self.min_elapsed, event.elapsed)
+            self.max_elapsed = event.elapsed if self.max_elapsed is None else max(self.max_elapsed, event.elapsed)
+
+
+class RetryLogAggregator:
+    """
+    A retry event hook (see RetryEvent), to be used in place of log_retry_event when many
+    requests may be retried at once.
+
+    Events are grouped by method, host, path template (see path_template), and status code
+    (or error class). The first event of a group is logged immediately, as log_retry_event
+    would log it. The events of the group which follow it within window seconds are counted,
+    and logged as one summary line (with the range of their attempt latencies) once the window
+    has passed. Summaries are logged by a background thread (started with the first event) as
+    soon as their windows end, so the summary of the last window of a burst of retries is not
+    lost once the retries stop. The thread is stopped by close() (which also logs the summaries
+    not yet logged), or once the aggregator is no longer referenced. flush() logs them at once.
+
+    No more than max_lines_per_second lines (counting all of the lines logged for a first event
+    as one) are logged, on average. When that rate is exceeded, first events are counted in the
+    next summary of their group instead, and summaries are dropped, with the number of events
+    they held reported in the next line logged.
+
+    One aggregator may be shared by several adapters, and used from several threads.
+    """
+
+    def __init__(self, window: float = DEFAULT_AGGREGATION_WINDOW,
+                 max_lines_per_second: float = DEFAULT_MAX_LINES_PER_SECOND) -> None:
+        validate_positive_number("window", window)
+        validate_positive_number("max_lines_per_second", max_lines_per_second)
+        self.window = window
+        self.max_lines_per_second = max_lines_per_second
+        self._lock = threading.Lock()
+        self._aggregates: dict[AggregateKeyType, _Aggregate] = {}
+        # When the earliest window ends
+        self._next_flush = float("inf")
+        # A token bucket, holding up to one second of lines
+        self._tokens = max(1.0, max_lines_per_second)
+        self._refilled = time.monotonic()
+        # The number of events in summaries dropped by the rate limit, not yet reported
+        self._suppressed = 0
+        self._flusher: threading.Thread | None = None
+        # Set to wake the flush thread when a window ending sooner has started, or to stop it
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+
+    def __call__(self, event: RetryEvent) -> None:
+        now = time.monotonic()
+        cause = str(event.status) if event.error_type is None else event.error_type.__name__
+        key = (event.method, event.host_key, path_template(event.url), cause)
+        with self._lock:
+            summaries = self._take_due(now) if now >= self._next_flush else []
+            aggregate = self._aggregates.get(key)
+            first = aggregate is None
+            if aggregate is None:
+                aggregate = _Aggregate(started=now)
+                self._aggregates[key] = aggregate
+                if now + self.window < self._next_flush:
+                    self._next_flush = now + self.window
+                    self._wakeup.set()
+                self._start_flusher()
+            log_first = first and self._take_token(now)
+            if not log_first:
+                aggregate.add(event)
+            summaries = self._limit(summaries, now)
+            suppressed = self._take_suppressed() if log_first or summaries else 0
+        if log_first:
+            log_retry_event(event, LOGGER)
+        self._log(summaries, suppressed)
+
+    def flush(self) -> None:
+        """
+        Log the summaries of all of the events not yet logged (subject to the rate limit),
+        without waiting for their windows to pass
+        """
+        now = time.monotonic()
+        with self._lock:
+            summaries = self._limit(self._take_due(float("inf")), now)
+            suppressed = self._take_suppressed() if summaries else 0
+        self._log(summaries, suppressed)
+
+    def flush_due(self) -> float:
+        """
+        Log the summaries of the windows which have ended (subject to the rate limit), and return
+        how many seconds it is until the next window ends (or window, if none have started)
+        """
+        now = time.monotonic()
+        with self._lock:
+            summaries = self._limit(self._take_due(now), now) if now >= self._next_flush else []
+            suppressed = self._take_suppressed() if summaries else 0
+            next_flush = self._next_flush
+        self._log(summaries, suppressed)
+        return self.window if next_flush == float("inf") else max(next_flush - now, 0.0)
+
+    def close(self) -> None:
+        """
+        Stop the flush thread, if it is running, and log the summaries of all of the events not
+        yet logged. Summaries of later events are only logged when events follow them, or when
+        flush() is called.
+        """
+        self._stop.set()
+        self._wakeup.set()
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+
+    def _start_flusher(self) -> None:
+        """
+        Start the flush thread, if it has not started yet (and the aggregator has not been closed).
+        Must be called with the lock held.
+        """
+        if self._flusher is not None or self._stop.is_set():
+            return
+        self._flusher = threading.Thread(target=_flush_periodically,
+                                         args=(weakref.ref(self), self._wakeup, self._stop),
+                                         name="RetryLogAggregator flusher", daemon=True)
+        self._flusher.start()
+
+    def _take_due(self, now: float) -> list[tuple[AggregateKeyType, _Aggregate, float]]:
+        """
+        Remove the aggregates whose windows have ended by the specified time, and return those
+        holding events (with how long they were aggregated for). Must be called with the lock held.
+        """
+        due: list[tuple[AggregateKeyType, _Aggregate, float]] = []
+        self._next_flush = float("inf")
+        current = time.monotonic()
+        for key, aggregate in list(self._aggregates.items()):
+            ends = aggregate.started + self.window
+            if ends > now:
+                self._next_flush = min(self._next_flush, ends)
+                continue
+            del self._aggregates[key]
+            if aggregate.count:
+                due.append((key, aggregate, min(current, ends) - aggregate.started))
+        return due
+
+    def _take_token(self, now: float) -> bool:
+        """
+        Take a token for a line from the bucket, if it has one. Must be called with the lock held.
+        """
+        capacity = max(1.0, self.max_lines_per_second)
+        self._tokens = min(capacity, self._tokens + (now - self._refilled) * self.max_lines_per_second)
+        self._refilled = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _limit(self, summaries: list[tuple[AggregateKeyType, _Aggregate, float]],
+               now: float) -> list[tuple[AggregateKeyType, _Aggregate, float]]:
+        """
+        Return the summaries which may be logged within the rate limit, counting the events of the others
+        as suppressed. Must be called with the lock held.
+        """
+        allowed: list[tuple[AggregateKeyType, _Aggregate, float]] = []
+        for summary in summaries:
+            if self._take_token(now):
+                allowed.append(summary)
+            else:
+                self._suppressed += summary[1].count
+        return allowed
+
+    def _take_suppressed(self) -> int:
+        """
+        Return the number of suppressed events not yet reported, and reset it. Must be called with the lock held.
+        """
+        suppressed, self._suppressed = self._suppressed, 0
+        return suppressed
+
+    @staticmethod
+    def _log(summaries: list[tuple[AggregateKeyType, _Aggregate, float]], suppressed: int) -> None:
+        """
+        Log the specified summaries, and the number of events in summaries which were suppressed
+        """
+        if suppressed:
+            LOGGER.warning("%d retry events were not logged, to keep within the retry log rate limit", suppressed)
+        for (method, key, path, cause), aggregate, duration in summaries:
+            kinds = ", ".join(f"{kind}={count}" for kind, count in sorted(aggregate.kinds.items()))
+            if aggregate.min_elapsed is None or aggregate.max_elapsed is None:
+                latency = "unknown"
+            else:
+                latency = f"{aggregate.min_elapsed:.3f}s-{aggregate.max_elapsed:.3f}s"
+            LOGGER.warning("%d more %s attempts on '%s%s' resulted in %s in %.1fs (%s; up to attempt %d; "
+                           "attempt latency %s)", aggregate.count, method, key, path, cause, duration, kinds,
+                           aggregate.max_attempt, latency)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(window={self.window}, max_lines_per_second={self.max_lines_per_second})"
+
+
+def _flush_periodically(aggregator_ref: weakref.ref[RetryLogAggregator], wakeup: threading.Event,
+                        stop: threading.Event) -> None:
+    """
+    The flush thread of an aggregator, which logs the summaries of its windows as they end. It only
+    holds a weak reference to the aggregator, so that it stops once it is no longer referenced.
+    """
+    while not stop.is_set():
+        wakeup.clear()
+        aggregator = aggregator_ref()
+        if aggregator is None:
+            return
+        try:
+            delay = aggregator.flush_due()
+        except Exception:  # pylint: disable=broad-exception-caught
+            LOGGER.exception("Error logging retry event summaries")
+            delay = aggregator.window
+        del aggregator
+        wakeup.wait(delay)
@@ -0,0 +1,214 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+RetryScheduler class: makes submitted requests in a small thread pool, with their backoffs
+waited out by a timer thread rather than by sleeping workers
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from .fan_out import RequestSpec
+from .requests_retry_session import DEFAULT_POOL_MAXSIZE
+from .retry_deferral import using_retry_deferral, RetryDeferral, RetryDeferred
+from .utils import validate_positive_int
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    import requests
+
+    from .fan_out import SendFunctionType
+    from .typing_imports import Callable
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RetrySchedulerStats(NamedTuple):
+    """
+    submitted: The number of requests which were submitted
+    finished: The number of those requests which have finished (successfully or not)
+    deferred: The number of retries which were deferred (that is, waited for by the timer thread)
+    waiting: The number of requests currently waiting for their retries to be due
+    """
+    submitted: int
+    finished: int
+    deferred: int
+    waiting: int
+
+
+class RetryScheduler:  # pylint: disable=too-many-instance-attributes
+    """
+    Makes requests in a pool of max_workers worker threads, and returns a Future for each.
+    When an attempt fails and the request is to be retried, the worker does not sleep for the
+    backoff (or the Retry-After) of the retry: the request is set aside, and the timer thread
+    of the scheduler hands it back to the pool once its retry is due. A small pool can therefore
+    keep many requests in flight, including ones waiting to be retried.
+
+    The retry is made by sending the request again with send (typically through a retry session)
+    and resuming it with the Retry object of the failed attempt, so it counts against the same
+    retries, and keeps its overall deadline. This only applies to retries made by the RetryWithLogs
+    of a TimeoutHTTPAdapter, and not to hedged or coalesced (single_flight) requests, whose
+    retries still sleep in the worker. Request bodies must be able to be sent again (for
+    example, bytes rather than a generator), and redirects are followed again from the start.
+
+    close() waits for the requests being made, and fails those which are waiting for a retry
+    with RuntimeError.
+    """
+
+    def __init__(self, send: SendFunctionType, max_workers: int = DEFAULT_POOL_MAXSIZE) -> None:
+        validate_positive_int("max_workers", max_workers)
+        self.max_workers = max_workers
+        self._send = send
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rrs-retry-scheduler")
+        self._condition = threading.Condition()
+        # The deferred requests, as (due time, sequence number, resume function), in a heap
+        self._timers: list[tuple[float, int, Callable[[], None]]] = []
+        # For each deferred request, the future to fail if the scheduler is closed first
+        self._waiting: dict[int, Future[requests.Response]] = {}
+        self._sequence = itertools.count()
+        self._timer_thread: threading.Thread | None = None
+        self._closed = False
+        self._submitted = 0
+        self._finished = 0
+        self._deferred = 0
+
+    def submit(self, method: str, url: str, **kwargs: Any) -> Future[requests.Response]:
+        """
+        Make the request (with the keyword arguments of requests.Session.request) in a worker
+        thread, and return a Future for its response (or the exception it raised)
+        """
+        future: Future[requests.Response] = Future()
+        spec = RequestSpec(method=method, url=url, kwargs=kwargs)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit requests to a closed RetryScheduler")
+            self._submitted += 1
+        self._executor.submit(self._attempt, future, spec, RetryDeferral())
+        return future
+
+    def _attempt(self, future: Future[requests.Response], spec: RequestSpec, deferral: RetryDeferral) -> None:
+        """
+        Make (or resume) the request, and either finish its future, or defer its retry
+        """
+        if deferral.deferrals == 0 and not future.set_running_or_notify_cancel():
+            self._finish()
+            return
+        try:
+            with using_retry_deferral(deferral):
+                response = self._send(spec)
+        except RetryDeferred:
+            self._defer(future, spec, deferral)
+            return
+        except BaseException as err:  # pylint: disable=broad-exception-caught
+            future.set_exception(err)
+        else:
+            future.set_result(response)
+        self._finish()
+
+    def _finish(self) -> None:
+        """
+        Count a finished request
+        """
+        with self._condition:
+            self._finished += 1
+
+    def _defer(self, future: Future[requests.Response], spec: RequestSpec, deferral: RetryDeferral) -> None:
+        """
+        Hand the request back to the pool once its retry is due
+        """
+        LOGGER.debug("Deferring the retry of %s %s for %.3fs", spec.method, spec.url, deferral.delay)
+        with self._condition:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                sequence = next(self._sequence)
+                self._waiting[sequence] = future
+
+                def resume() -> None:
+                    del self._waiting[sequence]
+                    self._executor.submit(self._attempt, future, spec, deferral)
+
+                heapq.heappush(self._timers, (time.monotonic() + deferral.delay, sequence, resume))
+                self._deferred += 1
+                if self._timer_thread is None:
+                    self._timer_thread = threading.Thread(target=self._run_timers, name="rrs-retry-timer",
+                                                          daemon=True)
+                    self._timer_thread.start()
+                self._condition.notify()
+        if closed:
+            future.set_exception(RuntimeError("The RetryScheduler was closed before the request was retried"))
+            self._finish()
+
+    def _run_timers(self) -> None:
+        """
+        The body of the timer thread: resume each deferred request when its retry is due
+        """
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                while self._timers and self._timers[0][0] <= now:
+                    _, _, resume = heapq.heappop(self._timers)
+                    resume()
+                timeout = self._timers[0][0] - now if self._timers else None
+                self._condition.wait(timeout)
+
+    def stats(self) -> RetrySchedulerStats:
+        """
+        Returns the counters
+        """
+        with self._condition:
+            return RetrySchedulerStats(submitted=self._submitted, finished=self._finished,
+                                       deferred=self._deferred, waiting=len(self._waiting))
+
+    def close(self) -> None:
+        """
+        Stop the timer thread, fail the requests waiting for their retries, and wait for the
+        requests being made to finish
+        """
+        with self._condition:
+            self._closed = True
+            waiting = list(self._waiting.values())
+            self._waiting.clear()
+            self._timers.clear()
+            timer_thread, self._timer_thread = self._timer_thread, None
+            self._condition.notify()
+        if timer_thread is not None:
+            timer_thread.join()
+        for future in waiting:
+            future.set_exception(RuntimeError("The RetryScheduler was closed before the request was retried"))
+            self._finish()
+        self._executor.shutdown(wait=True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_workers={self.max_workers})"
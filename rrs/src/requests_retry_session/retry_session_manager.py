@@ -35,24 +35,34 @@ from contextlib import (
 )
 from typing import TYPE_CHECKING
 
+from .downloads import resumable_download, DEFAULT_DOWNLOAD_CHUNK_SIZE
+from .fan_out import map_requests, session_pool_maxsize
+from .prewarm import prewarm_session, validate_prewarm_args, DEFAULT_PREWARM_CONNECTIONS
 from .requests_retry_session import (
     requests_retry_adapter,
     requests_session,
+    validate_adapter_args,
     DEFAULT_PROTOCOL,
 )
+from .retry_scheduler import RetryScheduler
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from types import TracebackType
-    from typing import Type
+    from typing import Any, Type
 
     import requests
 
+    from .adapter_registry import AdapterRegistry, SharedAdapter
+    from .downloads import DownloadOutcome, WritableBinaryFile
+    from .fan_out import RequestOutcome, RequestSpec, RequestSpecType
+    from .metrics import RetryMetrics
     from .requests_retry_session import (
         ProtocolType,
         RequestsRetryAdapterArgs,
     )
     from .timeout_http_adapter import TimeoutHTTPAdapter
-    from .typing_imports import Iterator, Self, Unpack
+    from .typing_imports import Iterable, Iterator, Self, Sequence, Unpack
 
 
 # Unfortunately Python does not currently have any supported way to accurate type
@@ -70,19 +80,38 @@ class RetrySessionManager(AbstractContextManager):  # type: ignore[type-arg]
 
     def __init__(self,
                  protocol: ProtocolType | None = None,
+                 adapter_registry: AdapterRegistry | None = None,
+                 prewarm_urls: Sequence[str] | None = None,
+                 prewarm_connections: int = DEFAULT_PREWARM_CONNECTIONS,
                  **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]) -> None:
         """
         If specified, protocols should omit the trailing "://" because it will be automatically appended later
+
+        The adapter arguments are validated here, even though the adapter itself is not created
+        until it is first needed.
+
+        If an adapter registry is specified, its shared adapter is used (and released on exit),
+        instead of creating a new adapter.
+
+        If prewarm_urls are specified, up to prewarm_connections pooled connections to each of them
+        are opened when the session is created (see prewarm_session).
         """
-        self._requests_adapter: TimeoutHTTPAdapter | None = None
+        validate_adapter_args(adapter_kwargs)
+        validate_prewarm_args(prewarm_urls, prewarm_connections)
+        self._prewarm_urls = prewarm_urls
+        self._prewarm_connections = prewarm_connections
+        self._requests_adapter: TimeoutHTTPAdapter | SharedAdapter | None = None
+        self._requests_adapter_registry = adapter_registry
         self._requests_session: requests.Session | None = None
         self._requests_protocol: ProtocolType = protocol if protocol is not None else DEFAULT_PROTOCOL
         self._requests_retry_adapter_kwargs: RequestsRetryAdapterArgs = adapter_kwargs
+        self._retry_scheduler: RetryScheduler | None = None
 
     def __exit__(  # pylint: disable=useless-return
             self, exc_type: Type[BaseException] | None,
             exc_val: BaseException | None,
             exc_tb: TracebackType | None) -> bool | None:
+        self._close_retry_scheduler()
         if self._requests_session is not None:
             self._requests_session.close()
             self._requests_session = None
@@ -103,26 +132,111 @@ class RetrySessionManager(AbstractContextManager):  # type: ignore[type-arg]
         Returns the requests retry session, after initializing it if needed
         """
         if self._requests_session is None:
-            self._requests_adapter = requests_retry_adapter(
-                **self._requests_retry_adapter_kwargs)
+            if self._requests_adapter_registry is not None:
+                self._requests_adapter = self._requests_adapter_registry.acquire(
+                    **self._requests_retry_adapter_kwargs)
+            else:
+                self._requests_adapter = requests_retry_adapter(
+                    **self._requests_retry_adapter_kwargs)
             self._requests_session = requests_session(
                 adapter=self._requests_adapter,
                 protocol=self._requests_protocol)
+            if self._prewarm_urls:
+                prewarm_session(self._requests_session, self._prewarm_urls, self._prewarm_connections)
         return self._requests_session
 
+    @property
+    def metrics(self) -> RetryMetrics | None:
+        """
+        Returns the metrics object specified in the adapter arguments, if any
+        """
+        return self._requests_retry_adapter_kwargs.get("metrics")
+
+    def map_requests(
+        self,
+        specs: Iterable[RequestSpecType],
+        *,
+        max_workers: int | None = None,
+        ordered: bool = False,
+    ) -> Iterator[RequestOutcome]:
+        """
+        Make the requests concurrently using the retry session, and yield their outcomes.
+        See fan_out.map_requests for details.
+        """
+        return map_requests(self.requests_session, specs, max_workers=max_workers, ordered=ordered)
+
+    def download(self, url: str, file: WritableBinaryFile, *, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+                 **kwargs: Any) -> DownloadOutcome:
+        """
+        Stream the body of a GET request to the URL into the file using the retry session,
+        resuming it where it left off if it is cut off. See downloads.resumable_download for details.
+        """
+        return resumable_download(self.requests_session, url, file, chunk_size=chunk_size, **kwargs)
+
+    def submit(self, method: str, url: str, **kwargs: Any) -> Future[requests.Response]:
+        """
+        Make the request (with the keyword arguments of requests.Session.request) using the retry
+        session, in a worker thread, and return a Future for its response. Its retries do not
+        park the worker thread while they wait to be due (see RetryScheduler), so a few workers
+        can keep many requests in flight. The number of workers is the pool_maxsize of the retry
+        adapter for the URL of the first request. On exit, the requests still waiting for their
+        retries fail with RuntimeError.
+        """
+        if self._retry_scheduler is None:
+            self._retry_scheduler = RetryScheduler(self._send_spec, session_pool_maxsize(self.requests_session, url))
+        return self._retry_scheduler.submit(method, url, **kwargs)
+
+    @property
+    def retry_scheduler(self) -> RetryScheduler | None:
+        """
+        Returns the scheduler making the requests passed to submit, if any have been
+        """
+        return self._retry_scheduler
+
+    def _send_spec(self, spec: RequestSpec) -> requests.Response:
+        """
+        Make a request passed to submit
+        """
+        return self.requests_session.request(spec.method, spec.url, **(spec.kwargs or {}))
+
+    def _close_retry_scheduler(self) -> None:
+        """
+        Close the scheduler making the requests passed to submit, if there is one
+        """
+        if self._retry_scheduler is not None:
+            self._retry_scheduler.close()
+            self._retry_scheduler = None
+
 
 @contextmanager
 def retry_session_manager(
     protocol: ProtocolType | None = None,
+    adapter_registry: AdapterRegistry | None = None,
+    prewarm_urls: Sequence[str] | None = None,
+    prewarm_connections: int = DEFAULT_PREWARM_CONNECTIONS,
     **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]
 ) -> Iterator[requests.Session]:
     """
     Provides a context manager that will clean up both the session and the adapter on exit
 
     If specified, protocols should omit the trailing "://" because it will be automatically appended later
+
+    If an adapter registry is specified, its shared adapter is used (and released on exit),
+    instead of creating a new adapter.
+
+    If prewarm_urls are specified, up to prewarm_connections pooled connections to each of them
+    are opened before the session is provided (see prewarm_session).
     """
+    validate_prewarm_args(prewarm_urls, prewarm_connections)
     requests_protocol = protocol if protocol is not None else DEFAULT_PROTOCOL
-    with closing(requests_retry_adapter(**adapter_kwargs)) as adapter:
+    adapter: TimeoutHTTPAdapter | SharedAdapter
+    if adapter_registry is not None:
+        adapter = adapter_registry.acquire(**adapter_kwargs)
+    else:
+        adapter = requests_retry_adapter(**adapter_kwargs)
+    with closing(adapter):
         with requests_session(adapter=adapter,
                               protocol=requests_protocol) as session:
+            if prewarm_urls:
+                prewarm_session(session, prewarm_urls, prewarm_connections)
             yield session
@@ -27,16 +27,47 @@ RetryWithLogs class
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+from contextvars import ContextVar
+from itertools import takewhile
 import logging
 from typing import TYPE_CHECKING
 
 from urllib3 import Retry
+from urllib3.exceptions import (
+    MaxRetryError,
+    NewConnectionError,
+    ReadTimeoutError,
+    ResponseError,
+    TimeoutError as Urllib3TimeoutError,
+)
+
+from .backoff import jittered_backoff, DEFAULT_BACKOFF_MAX, DEFAULT_BACKOFF_STRATEGY
+from .circuit_breaker import CircuitOpenError
+from .deadline import active_deadline, DeadlineExceededError
+from .hedging import active_hedge_cancellation, HedgeCancelledError
+from .metrics import attempt_elapsed, retry_cause, start_next_attempt, timing_attempts
+from .retry_after_pause import active_retry_after_pause
+from .retry_deferral import active_retry_deferral
+from .retry_events import RetryEvent
+from .stale_connections import active_checkout, is_stale_connection_error
+from .utils import host_key, pool_host_key
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    import random
     from types import TracebackType
+    from typing import Any
 
     from urllib3.connectionpool import ConnectionPool
 
+    from .adaptive_timeout import AdaptiveTimeout
+    from .backoff import BackoffStrategyType
+    from .bulkhead import Bulkhead
+    from .circuit_breaker import CircuitBreaker
+    from .metrics import RetryMetrics, _RequestTiming
+    from .retry_budget import RetryBudget
+    from .retry_events import RetryEventHook, RetryEventKindType
     from .typing_imports import Self
 
     try:
@@ -51,6 +82,47 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# The RetryWithLogs (with event hooks) which declined to retry the response to the current attempt
+# in this context because its retry budget was exhausted, until the denial is reported
+_BUDGET_DENIAL: ContextVar[RetryWithLogs | None] = ContextVar("budget_denial", default=None)
+
+
+def log_retry_event(event: RetryEvent, logger: logging.Logger = LOGGER) -> None:
+    """
+    The default retry event hook, which logs the event (to the specified logger, if it is
+    called directly). Nothing is formatted (not even the endpoint) unless the logger is enabled
+    for the level of the message.
+    """
+    method = event.method
+    if event.status is not None and logger.isEnabledFor(logging.WARNING):
+        logger.warning("Previous %s attempt on '%s' resulted in %s response.", method, event.endpoint, event.status)
+    if event.kind == "retry":
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Reattempting %s request for '%s'", method, event.endpoint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Backing off %.3fs before reattempting %s request for '%s'",
+                         event.sleep, method, event.endpoint)
+    elif event.kind == "exhausted":
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Retries exhausted; not reattempting %s request for '%s'", method, event.endpoint)
+    elif not logger.isEnabledFor(logging.ERROR):
+        return
+    elif event.kind == "deadline_exceeded" and event.sleep is None:
+        if event.timed_out and logger.isEnabledFor(logging.WARNING):
+            logger.warning("%s attempt on '%s' was cut short by its %ss overall deadline",
+                           method, event.endpoint, event.deadline)
+        logger.error("Overall %ss deadline for %s request on '%s' has passed; not reattempting",
+                     event.deadline, method, event.endpoint)
+    elif event.kind == "deadline_exceeded":
+        logger.error("Backoff of %.3fs before reattempting %s request on '%s' would overrun "
+                     "its %ss overall deadline; not reattempting", event.sleep, method, event.endpoint,
+                     event.deadline)
+    elif event.kind == "circuit_open":
+        logger.error("Circuit breaker for '%s' is open; not reattempting %s request for '%s'",
+                     event.host_key, method, event.endpoint)
+    else:
+        logger.error("Retry budget exhausted; not reattempting %s request for '%s'", method, event.endpoint)
+
 
 class RetryWithLogs(Retry):
     """
@@ -65,7 +137,109 @@ class RetryWithLogs(Retry):
     behavior is consistent with existing retry behavior that is expected by all of our
     API interactions, as well, gives us a more immediate sense of feedback for overall
     system instability and network congestion.
+
+    When the request has an overall deadline (see TimeoutHTTPAdapter), no further attempts
+    are made once it has passed, or if the backoff before the next attempt would overrun it.
+    Instead, MaxRetryError is raised, with a DeadlineExceededError as its reason.
+
+    If circuit_breaker is set, every failed attempt is recorded with it, and no further attempts
+    are made once the circuit for the host is open (MaxRetryError is raised, with a
+    CircuitOpenError as its reason). Attempts cut short by a deadline are not recorded.
+
+    If bulkhead is set, every timed out attempt, and every response with a status in status_forcelist,
+    is recorded with it as a sign that the host is overloaded, and every successful request as a
+    success (an adaptive bulkhead uses them to adjust its limit for the host).
+
+    If the attempt is a hedged one (see HedgingPolicy) which has been cancelled, because the other
+    attempt of its request won, it is not retried (MaxRetryError is raised, with a
+    HedgeCancelledError as its reason), and a backoff before its next attempt is cut short.
+
+    If the request is being made with a RetryAfterPause (see TimeoutHTTPAdapter), every response
+    with a Retry-After header that is respected pauses its host, so that the other requests to it
+    back off as well.
+
+    If retry_budget is set, each retry spends one of its tokens. While it has none, no further
+    attempts are made: the last response is returned (by is_retry), or MaxRetryError is raised
+    with the last error (or a ResponseError) as its reason, as when the retries are exhausted.
+    Either way, a budget_exhausted event is delivered to the event hooks.
+
+    backoff_strategy selects how the backoff between attempts is calculated (see jittered_backoff),
+    using backoff_random as the source of randomness, and backoff_max caps it.
+
+    If metrics is set, every failed attempt, retry, and exhausted request is recorded with it.
+
+    If adaptive_timeout is set, the latency of every successful attempt, and every read timeout,
+    is recorded with it (the adapter uses it to choose the read timeouts).
+
+    Every failed attempt is reported to each of the event_hooks, as a RetryEvent. By default,
+    the only hook is log_retry_event, which logs it. With no hooks, no event is created.
+
+    If the request is being made by a RetryScheduler, sleep does not sleep: it defers the retry
+    (see RetryDeferral), and the scheduler resumes the request with this Retry object once it is due.
+
+    If the request is being made with a StaleConnectionPolicy (see TimeoutHTTPAdapter), and
+    its pooled connection turns out to be stale, it is replayed without any of the above:
+    the Retry object returned by increment has the same counters, and does not sleep.
     """
+    adaptive_timeout: AdaptiveTimeout | None = None
+    bulkhead: Bulkhead | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    metrics: RetryMetrics | None = None
+    event_hooks: tuple[RetryEventHook, ...] = (log_retry_event,)
+    retry_budget: RetryBudget | None = None
+    backoff_strategy: BackoffStrategyType = DEFAULT_BACKOFF_STRATEGY
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+    backoff_random: random.Random | None = None
+    # The backoff before the attempt following this one, once calculated
+    _backoff: float | None = None
+    # The backoff before this attempt
+    previous_backoff: float = 0.0
+    # True if this attempt replays the previous one, whose pooled connection was stale
+    replayed: bool = False
+
+    def new(self, **kw: Any) -> Self:
+        # urllib3 creates a new Retry object for every retry, using the same arguments
+        # that this one was created with, so any attributes we add must be copied here
+        new_retry = super().new(**kw)
+        new_retry.adaptive_timeout = self.adaptive_timeout
+        new_retry.bulkhead = self.bulkhead
+        new_retry.circuit_breaker = self.circuit_breaker
+        new_retry.retry_budget = self.retry_budget
+        new_retry.metrics = self.metrics
+        new_retry.event_hooks = self.event_hooks
+        new_retry.backoff_strategy = self.backoff_strategy
+        new_retry.backoff_max = self.backoff_max
+        new_retry.backoff_random = self.backoff_random
+        new_retry.previous_backoff = self.get_backoff_time()
+        return new_retry
+
+    def get_backoff_time(self) -> float:
+        # Jittered backoffs are random, so the backoff is only calculated once for each
+        # Retry object, to make sure that retry_delay() and sleep() agree
+        if self._backoff is None:
+            if self.backoff_strategy == "exponential" or self.backoff_random is None:
+                self._backoff = min(super().get_backoff_time(), self.backoff_max)
+            else:
+                consecutive_errors = len(list(takewhile(lambda x: x.redirect_location is None,
+                                                        reversed(self.history))))
+                self._backoff = jittered_backoff(self.backoff_strategy, self.backoff_random,
+                                                 backoff_factor=self.backoff_factor,
+                                                 consecutive_errors=consecutive_errors,
+                                                 backoff_max=self.backoff_max,
+                                                 previous_backoff=self.previous_backoff)
+        return self._backoff
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if not super().is_retry(method, status_code, has_retry_after):
+            return False
+        if self.retry_budget is not None and not self.retry_budget.can_retry():
+            # Neither the URL nor the pool is known here, so the budget_exhausted event is delivered
+            # by whoever made the attempt (see take_budget_denial)
+            if self.event_hooks:
+                _BUDGET_DENIAL.set(self)
+            return False
+        return True
+
     def increment(self,
                   method: str | None = None,
                   url: str | None = None,
@@ -79,13 +253,209 @@ class RetryWithLogs(Retry):
             raise TypeError(f"url argument should not be None. {locals()}")
         if method is None:
             raise TypeError(f"method argument should not be None. {locals()}")
-        endpoint = f"{_pool.scheme}://{_pool.host}{url}"
-        if response is None:
-            LOGGER.info("Reattempting %s request for '%s'", method, endpoint)
-        else:
-            LOGGER.warning(
-                "Previous %s attempt on '%s' resulted in %s response.", method,
-                endpoint, response.status)
-            LOGGER.info("Reattempting %s request for '%s'", method, endpoint)
-        return super().increment(method, url, response, error, _pool,
-                                 _stacktrace)
+        cancellation = active_hedge_cancellation()
+        if cancellation is not None and cancellation.cancelled:
+            LOGGER.debug("Not reattempting cancelled hedged %s request for '%s'", method, url)
+            raise MaxRetryError(_pool, url, HedgeCancelledError(
+                f"Hedged {method} request for '{url}' was cancelled")) from error
+        if is_stale_connection_error(error) and self.replays_stale_connection(method, url, error, _pool):
+            return self._replay()
+        if self.metrics is None:
+            return self._increment(method, url, response, error, _pool, _stacktrace)
+        key = pool_host_key(_pool)
+        self.metrics.record_failed_attempt(key, method, error)
+        try:
+            new_retry = self._increment(method, url, response, error, _pool, _stacktrace)
+        except MaxRetryError:
+            self.metrics.record_exhausted(key, method)
+            raise
+        self.metrics.record_retry(key, method, retry_cause(error, response))
+        return new_retry
+
+    def replays_stale_connection(self, method: str, url: str, error: Exception | None, _pool: ConnectionPool) -> bool:
+        """
+        Returns True if a request whose pooled connection was stale (as the specified error shows)
+        should be replayed on a new connection, according to the StaleConnectionPolicy it is being
+        made with, if any
+        """
+        checkout = active_checkout()
+        if checkout is None or not self._is_method_retryable(method) or not checkout.policy.try_replay(checkout):
+            return False
+        LOGGER.info("Replaying %s request for '%s' on a new connection, since its pooled connection to '%s' "
+                    "was stale (%s)", method, url, pool_host_key(_pool), error)
+        return True
+
+    def _replay(self) -> Self:
+        """
+        Returns a Retry object for replaying the attempt, with the same counters and backoff
+        """
+        replay = self.new()
+        replay.previous_backoff = self.previous_backoff
+        replay.replayed = True
+        return replay
+
+    def _increment(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            method: str,
+            url: str,
+            response: BaseHTTPResponse | None,
+            error: Exception | None,
+            _pool: ConnectionPool,
+            _stacktrace: TracebackType | None) -> Self:
+        """
+        The body of increment, once its arguments have been checked
+        """
+        deadline = active_deadline()
+        total = None if deadline is None else deadline.total
+        if deadline is not None and deadline.expired():
+            self._emit("deadline_exceeded", method, url, response, error, _pool, deadline=total)
+            raise MaxRetryError(_pool, url, DeadlineExceededError(
+                f"Overall {deadline.total}s deadline exceeded")) from error
+        self._record_retry_after(response, _pool)
+        if self.adaptive_timeout is not None and isinstance(error, ReadTimeoutError):
+            self.adaptive_timeout.record_timeout(pool_host_key(_pool))
+        if self.bulkhead is not None and (
+                (isinstance(error, Urllib3TimeoutError) and not isinstance(error, NewConnectionError))
+                or (response is not None and response.status in (self.status_forcelist or ()))):
+            self.bulkhead.record_overload(pool_host_key(_pool))
+        if self.circuit_breaker is not None and (
+                error is not None or (response is not None and response.status in (self.status_forcelist or ()))):
+            key = pool_host_key(_pool)
+            if self.circuit_breaker.record_failure(key) == "open":
+                self._emit("circuit_open", method, url, response, error, _pool, deadline=total)
+                raise MaxRetryError(_pool, url, CircuitOpenError(
+                    f"Circuit breaker for '{key}' is open")) from error
+        try:
+            new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        except MaxRetryError:
+            self._emit("exhausted", method, url, response, error, _pool, deadline=total)
+            raise
+        delay = new_retry.retry_delay(response)
+        if deadline is not None and delay >= deadline.remaining():
+            self._emit("deadline_exceeded", method, url, response, error, _pool, sleep=delay, deadline=total)
+            raise MaxRetryError(_pool, url, DeadlineExceededError(
+                f"Backoff of {delay:.3f}s would overrun the overall {deadline.total}s deadline")) from error
+        if self.retry_budget is not None and not self.retry_budget.try_spend():
+            self._emit("budget_exhausted", method, url, response, error, _pool, deadline=total)
+            reason = error
+            if reason is None:
+                status = None if response is None else response.status
+                reason = ResponseError(ResponseError.SPECIFIC_ERROR.format(status_code=status))
+            raise MaxRetryError(_pool, url, reason) from reason
+        self._emit("retry", method, url, response, error, _pool, sleep=delay, deadline=total)
+        return new_retry
+
+    def _record_retry_after(self, response: BaseHTTPResponse | None, _pool: ConnectionPool) -> None:
+        """
+        Pause the host of the request (if it is being made with a RetryAfterPause) for as long as
+        the Retry-After header of the response asks, if it has one that is respected
+        """
+        pause = active_retry_after_pause()
+        if (pause is None or response is None or not self.respect_retry_after_header
+                or response.status not in self.RETRY_AFTER_STATUS_CODES):
+            return
+        retry_after = self.get_retry_after(response)
+        if retry_after is not None:
+            pause.pause(pool_host_key(_pool), retry_after)
+
+    def _emit(  # pylint: disable=too-many-positional-arguments
+            self,
+            kind: RetryEventKindType,
+            method: str,
+            url: str,
+            response: BaseHTTPResponse | None,
+            error: Exception | None,
+            _pool: ConnectionPool,
+            *,
+            sleep: float | None = None,
+            deadline: float | None = None) -> None:
+        """
+        Deliver a retry event for the failed attempt to the event hooks, if there are any
+        """
+        if not self.event_hooks:
+            return
+        event = RetryEvent(kind=kind, method=method, scheme=_pool.scheme or "http", host=_pool.host,
+                           port=_pool.port, url=url, status=None if response is None else response.status,
+                           error_type=None if error is None else type(error), attempt=len(self.history) + 1,
+                           elapsed=attempt_elapsed(), sleep=sleep, deadline=deadline)
+        for hook in self.event_hooks:
+            hook(event)
+
+    def emit_budget_denial(self, method: str, url: str, response: BaseHTTPResponse, _pool: ConnectionPool) -> None:
+        """
+        Deliver a budget_exhausted event to the event hooks for the response, which was not
+        retried because the retry budget was exhausted
+        """
+        deadline = active_deadline()
+        self._emit("budget_exhausted", method, url, response, None, _pool,
+                   deadline=None if deadline is None else deadline.total)
+
+    def timing_request(self, url: str, method: str,
+                       resumed: _RequestTiming | None = None) -> AbstractContextManager[object]:
+        """
+        Returns the context manager within which a request to the specified URL is made:
+        it times the request and its attempts, if they are recorded with the metrics or the
+        adaptive timeout, or reported to the event hooks. If the timing of a deferred request
+        is specified, it is resumed.
+        """
+        if self.metrics is not None:
+            return self.metrics.timing_request(host_key(url), method, resumed)
+        if self.event_hooks or self.adaptive_timeout is not None:
+            return timing_attempts(resumed)
+        return nullcontext()
+
+    def sleep(self, response: BaseHTTPResponse | None = None) -> None:
+        if not self.replayed:
+            deferral = active_retry_deferral()
+            if deferral is not None:
+                deferral.defer(self, self.retry_delay(response))
+            cancellation = active_hedge_cancellation()
+            if cancellation is not None:
+                # Stop backing off as soon as the attempt is cancelled (the connection pool then
+                # refuses to make the next attempt)
+                cancellation.wait(self.retry_delay(response))
+            else:
+                super().sleep(response)
+        start_next_attempt()
+
+    def record_success(self, url: str, status: int) -> None:
+        """
+        Record the final response to a request to the specified URL with the circuit breaker,
+        retry budget, and bulkhead, if it was successful (that is, its status is not in status_forcelist).
+        Its latency is recorded with the adaptive timeout regardless, if it is being timed.
+        """
+        if self.adaptive_timeout is not None:
+            elapsed = attempt_elapsed()
+            if elapsed is not None:
+                self.adaptive_timeout.record(host_key(url), elapsed)
+        if status in (self.status_forcelist or ()):
+            return
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(host_key(url))
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        if self.bulkhead is not None:
+            self.bulkhead.record_success(host_key(url))
+
+    def retry_delay(self, response: BaseHTTPResponse | None = None) -> float:
+        """
+        How long sleep() will wait before the next attempt: Retry-After, if the response
+        has it and it is respected, otherwise the backoff time
+        """
+        if response is not None and self.respect_retry_after_header:
+            retry_after = self.get_retry_after(response)
+            if retry_after:
+                return retry_after
+        return self.get_backoff_time()
+
+
+def take_budget_denial() -> RetryWithLogs | None:
+    """
+    Called once an attempt has returned its response: returns the RetryWithLogs (with event
+    hooks) which declined in the current context to retry the response because its retry budget
+    was exhausted, if any, so that the caller can report it (see emit_budget_denial)
+    """
+    retry = _BUDGET_DENIAL.get()
+    if retry is not None:
+        _BUDGET_DENIAL.set(None)
+    return retry
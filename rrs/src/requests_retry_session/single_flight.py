@@ -0,0 +1,183 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+SingleFlight class: coalesces concurrent identical requests into a single request
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from .deadline import active_deadline, DeadlineExceeded
+from .response_cache import decoded_headers, replay_response
+
+if TYPE_CHECKING:
+    from requests import PreparedRequest, Response
+
+    from .response_cache import SendFunctionType
+    from .typing_imports import Collection, Hashable
+
+    type FlightKeyType = tuple[str, str, tuple[tuple[str, str | bytes], ...], Hashable]
+
+
+DEFAULT_SINGLE_FLIGHT_METHODS = frozenset({"GET", "HEAD"})
+
+
+class SingleFlightStats(NamedTuple):
+    """
+    flights: The number of requests actually made
+    coalesced: The number of requests which shared the response to an identical request in flight
+    in_flight: The number of requests currently in flight
+    """
+    flights: int
+    coalesced: int
+    in_flight: int
+
+
+def _copy_error(err: Exception) -> Exception:
+    """
+    Returns a copy of the exception raised by a request in flight (with it as its cause), for a
+    request waiting on it to raise, so that each has its own exception (and traceback). If it
+    cannot be copied, returns it.
+    """
+    try:
+        error = copy.copy(err)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return err
+    error.__cause__ = err
+    return error
+
+
+@dataclass(slots=True)
+class _Flight:
+    """
+    A request in flight, and (once it is done) its outcome
+    """
+    done: threading.Event = field(default_factory=threading.Event)
+    response: Response | None = None
+    content: bytes = b""
+    error: Exception | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical requests: while a request is in flight, identical requests
+    made through the adapters it is attached to wait for its response, rather than making
+    requests of their own. Requests are identical if they have the same method, URL, and headers,
+    and are made with the same connection settings (the verify, cert, and proxies arguments of
+    the adapter), so a request never gets a response fetched with weaker server verification,
+    another client certificate, or through other proxies.
+    The request in flight makes all of its attempts (including its retries) for every request
+    waiting on it, and they all get the same outcome -- each waiting request gets its own copy of
+    the response (with its own body stream), or a copy of the exception it raised (whose cause is
+    the exception raised by the request in flight). The response is not kept
+    once the request is done, so requests made after that make a request of their own.
+
+    Only requests with the specified (idempotent) methods and no body are coalesced, and streamed
+    requests never are. The request in flight is made with its own timeouts, not those of the
+    requests waiting on it, but a request with an overall deadline (see total_timeout) waits for
+    it no longer than that, raising DeadlineExceeded once it passes.
+
+    A SingleFlight is passed to requests_retry_adapter (and the other entry points) as the
+    single_flight argument.
+    """
+
+    def __init__(self, methods: Collection[str] = DEFAULT_SINGLE_FLIGHT_METHODS) -> None:
+        self.methods = frozenset(method.upper() for method in methods)
+        self._lock = threading.Lock()
+        self._flights: dict[FlightKeyType, _Flight] = {}
+        self._num_flights = self._coalesced = 0
+
+    def applies(self, request: PreparedRequest) -> bool:
+        """
+        Returns True if the request can be coalesced
+        """
+        return request.method is not None and request.method.upper() in self.methods and request.body is None
+
+    def send(self, request: PreparedRequest, send: SendFunctionType, connection_settings: Hashable = None) -> Response:
+        """
+        Make the request with the send function, or (if an identical request, made with the same
+        connection settings, is in flight) return a copy of the response to that request
+        """
+        if not self.applies(request):
+            return send(request)
+        key: FlightKeyType = (request.method or "", request.url or "",
+                              tuple(sorted((name.lower(), value) for name, value in request.headers.items())),
+                              connection_settings)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._num_flights += 1
+            else:
+                self._coalesced += 1
+        if leader:
+            return self._fly(key, flight, request, send)
+        deadline = active_deadline()
+        if not flight.done.wait(None if deadline is None else max(deadline.remaining(), 0.0)):
+            raise DeadlineExceeded("Deadline passed while waiting for an identical request in flight",
+                                   request=request)
+        if flight.error is not None:
+            raise _copy_error(flight.error)
+        if flight.response is None:
+            # The request in flight was interrupted (e.g. by KeyboardInterrupt), so make it again
+            return send(request)
+        return replay_response(request, flight.response.status_code, flight.response.reason,
+                               decoded_headers(flight.response.headers, flight.content), flight.content,
+                               flight.response.elapsed)
+
+    def _fly(self, key: FlightKeyType, flight: _Flight, request: PreparedRequest,
+             send: SendFunctionType) -> Response:
+        """
+        Make the request for every request waiting on it, and return its response
+        """
+        try:
+            response = send(request)
+            # Read the body, so that the requests waiting on it can have copies of it
+            flight.content = response.content
+            flight.response = response
+            return response
+        except Exception as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> SingleFlightStats:
+        """
+        Returns the counters
+        """
+        with self._lock:
+            return SingleFlightStats(flights=self._num_flights, coalesced=self._coalesced,
+                                     in_flight=len(self._flights))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(methods={sorted(self.methods)})"
@@ -0,0 +1,175 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+StaleConnectionPolicy class: replays requests whose pooled connection turned out to be stale
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from urllib3.exceptions import ProtocolError
+
+from .utils import validate_int, validate_positive_number
+
+if TYPE_CHECKING:
+    from .typing_imports import Iterator
+
+
+DEFAULT_MAX_REPLAYS = 1
+
+# The errors which a request gets when the server closed (or reset) its pooled connection
+# before it could answer (http.client.RemoteDisconnected is a ConnectionResetError)
+STALE_CONNECTION_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StaleConnectionStats(NamedTuple):
+    """
+    replays: The number of requests replayed on a new connection, after their pooled connection was stale
+    idle_discards: The number of pooled connections discarded (rather than used) for being idle for too long
+    """
+    replays: int
+    idle_discards: int
+
+
+def is_stale_connection_error(error: Exception | None) -> bool:
+    """
+    Returns True if the specified urllib3 exception means that the connection was closed
+    (or reset) before any of the response was received
+    """
+    if not isinstance(error, ProtocolError) or len(error.args) < 2:
+        return False
+    return isinstance(error.args[1], STALE_CONNECTION_ERRORS)
+
+
+@dataclass(slots=True)
+class StaleConnectionCheckout:
+    """
+    The state of a request with respect to its policy: whether the connection of its current
+    attempt was reused from the pool, and how many times it has been replayed
+    """
+    policy: StaleConnectionPolicy
+    reused: bool = False
+    replays: int = 0
+
+
+_ACTIVE_CHECKOUT: ContextVar[StaleConnectionCheckout | None] = ContextVar("active_stale_connection_checkout",
+                                                                          default=None)
+
+
+def active_checkout() -> StaleConnectionCheckout | None:
+    """
+    Returns the checkout of the request being made in the current context, if any
+    """
+    return _ACTIVE_CHECKOUT.get()
+
+
+@contextmanager
+def using_stale_connection_policy(policy: StaleConnectionPolicy | None) -> Iterator[None]:
+    """
+    Make a new checkout of the specified policy the active checkout within the context
+    """
+    token = _ACTIVE_CHECKOUT.set(None if policy is None else StaleConnectionCheckout(policy))
+    try:
+        yield
+    finally:
+        _ACTIVE_CHECKOUT.reset(token)
+
+
+class StaleConnectionPolicy:
+    """
+    Distinguishes requests which failed because their pooled (keep-alive) connection was stale
+    from requests which really failed, and replays them.
+
+    A pooled connection which the server (or a proxy in between, like a service mesh sidecar)
+    has closed while it was idle is usually only found to be stale once a request is sent on
+    it, and the connection is reset, or closed without a response. If that happens to a request
+    on a reused connection, before any of the response is received, the request is replayed
+    immediately on a new connection, up to max_replays times: the replay does not use up one of
+    the retries, is not delayed by a backoff, and is not recorded as a failure (with the circuit
+    breaker, retry budget, metrics, or event hooks). As with retries of read errors, only
+    requests with the allowed_methods of the adapter are replayed.
+
+    If max_idle is set, pooled connections which have been idle for longer than max_idle
+    seconds are discarded rather than used, since a connection which has been idle for a long
+    time is likely to have been closed by the other end.
+
+    A policy is passed to requests_retry_adapter (and the other entry points) as the
+    stale_connections argument. The async session uses max_idle as the keep-alive timeout of
+    its connector (so idle connections are closed, rather than discarded when they are next
+    used, and are not counted).
+    """
+
+    def __init__(self, max_replays: int = DEFAULT_MAX_REPLAYS, max_idle: float | None = None) -> None:
+        validate_int("max_replays", max_replays)
+        if max_replays < 0:
+            raise ValueError(f"max_replays must be at least 0, not {max_replays}")
+        if max_idle is not None:
+            validate_positive_number("max_idle", max_idle)
+        self.max_replays = max_replays
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._replays = self._idle_discards = 0
+
+    def is_too_idle(self, idle_since: float | None) -> bool:
+        """
+        Returns True if a pooled connection which has been idle since the specified time
+        (a time.monotonic() value) should be discarded rather than used, and counts it
+        """
+        if self.max_idle is None or idle_since is None or time.monotonic() - idle_since <= self.max_idle:
+            return False
+        with self._lock:
+            self._idle_discards += 1
+        return True
+
+    def try_replay(self, checkout: StaleConnectionCheckout) -> bool:
+        """
+        Returns True (and counts the replay) if a request with the specified checkout, whose
+        connection was stale, should be replayed
+        """
+        if not checkout.reused or checkout.replays >= self.max_replays:
+            return False
+        checkout.replays += 1
+        with self._lock:
+            self._replays += 1
+        return True
+
+    def stats(self) -> StaleConnectionStats:
+        """
+        Returns the counters
+        """
+        with self._lock:
+            return StaleConnectionStats(replays=self._replays, idle_discards=self._idle_discards)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_replays={self.max_replays}, max_idle={self.max_idle})"
@@ -0,0 +1,282 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+ThreadSafeRetrySessionManager class
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import queue
+import threading
+from typing import TYPE_CHECKING
+import weakref
+
+from .downloads import resumable_download, DEFAULT_DOWNLOAD_CHUNK_SIZE
+from .fan_out import map_with
+from .prewarm import prewarm_session, DEFAULT_PREWARM_CONNECTIONS
+from .requests_retry_session import (
+    requests_retry_adapter,
+    requests_session,
+    DEFAULT_POOL_MAXSIZE,
+)
+from .retry_scheduler import RetryScheduler
+from .retry_session_manager import RetrySessionManager
+from .typing_imports import Literal
+from .utils import validate_positive_int
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from types import TracebackType
+    from typing import Any, Type
+
+    import requests
+
+    from .adapter_registry import AdapterRegistry, SharedAdapter
+    from .downloads import DownloadOutcome, WritableBinaryFile
+    from .fan_out import RequestOutcome, RequestSpec, RequestSpecType
+    from .requests_retry_session import (
+        ProtocolType,
+        RequestsRetryAdapterArgs,
+    )
+    from .timeout_http_adapter import TimeoutHTTPAdapter
+    from .typing_imports import Iterable, Iterator, Sequence, Unpack
+
+
+type SessionModeType = Literal["per_thread", "pool"]
+SESSION_MODES: frozenset[SessionModeType] = frozenset({"per_thread", "pool"})
+
+
+class ThreadSafeRetrySessionManager(RetrySessionManager):
+    """
+    A thread safe RetrySessionManager. All of its sessions share a single adapter (and thus a
+    single set of connection pools), which is created exactly once, no matter how many threads
+    race to use the manager first. It does not rely on the GIL, so it is also safe on
+    free-threaded Python builds.
+
+    Because requests sessions are not themselves thread safe, each thread must use its own
+    session. There are two modes for arranging this:
+
+    per_thread: The requests_session property returns a session belonging to the calling thread,
+                creating it the first time the thread uses it. The sessions of threads which
+                have exited are dropped (but not closed, since that would close the shared
+                adapter) when another thread's session is created.
+    pool:       Sessions are borrowed using the checkout context manager. At most
+                session_pool_size sessions exist, and checkout blocks while all are in use.
+                The default pool size is the pool_maxsize adapter argument, so that every
+                session can have a connection.
+
+    The checkout context manager works in both modes. If prewarm_urls are specified, the pools of
+    the shared adapter are prewarmed (see prewarm_session) when it is created, before the session
+    which created it is provided. On exit, every session and the adapter are closed. The manager
+    should only be exited once no other threads are still using it.
+    """
+
+    def __init__(self,
+                 protocol: ProtocolType | None = None,
+                 adapter_registry: AdapterRegistry | None = None,
+                 *,
+                 session_mode: SessionModeType = "per_thread",
+                 session_pool_size: int | None = None,
+                 prewarm_urls: Sequence[str] | None = None,
+                 prewarm_connections: int = DEFAULT_PREWARM_CONNECTIONS,
+                 **adapter_kwargs: Unpack[RequestsRetryAdapterArgs]) -> None:
+        """
+        If specified, protocols should omit the trailing "://" because it will be automatically appended later
+        """
+        super().__init__(protocol=protocol, adapter_registry=adapter_registry, prewarm_urls=prewarm_urls,
+                         prewarm_connections=prewarm_connections, **adapter_kwargs)
+        if session_mode not in SESSION_MODES:
+            raise ValueError(f"session_mode must be one of {sorted(SESSION_MODES)}, not {session_mode!r}")
+        if session_pool_size is None:
+            session_pool_size = adapter_kwargs.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        validate_positive_int("session_pool_size", session_pool_size)
+        self._session_mode = session_mode
+        self._session_pool_size = session_pool_size
+        self._lock = threading.Lock()
+        # Every session created since the last exit (with the thread it belongs to, in per_thread
+        # mode), so they can all be closed
+        self._sessions: list[tuple[weakref.ref[threading.Thread] | None, requests.Session]] = []
+        # Incremented on exit, so that threads know their thread-local sessions were closed
+        self._generation = 0
+        self._local = threading.local()
+        self._session_slots = threading.BoundedSemaphore(session_pool_size)
+        self._idle_sessions: queue.LifoQueue[requests.Session] = queue.LifoQueue()
+        # Set when the shared adapter is created, until its pools have been prewarmed
+        self._prewarm_pending = False
+
+    def __exit__(  # pylint: disable=useless-return
+            self, exc_type: Type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None) -> bool | None:
+        self._close_retry_scheduler()
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+            adapter, self._requests_adapter = self._requests_adapter, None
+            self._prewarm_pending = False
+            self._generation += 1
+            self._session_slots = threading.BoundedSemaphore(self._session_pool_size)
+            self._idle_sessions = queue.LifoQueue()
+        for _, session in sessions:
+            session.close()
+        if adapter is not None:
+            adapter.close()
+        return None
+
+    @property
+    def session_mode(self) -> SessionModeType:
+        """
+        Returns the session mode (per_thread or pool)
+        """
+        return self._session_mode
+
+    def _new_session(self, owner: threading.Thread | None = None) -> requests.Session:
+        """
+        Create a new session using the shared adapter (creating that first, if needed), for the
+        specified thread (in per_thread mode). Must be called with the lock held, and followed by
+        a call to _prewarm once it is released.
+        """
+        if owner is not None:
+            self._prune_sessions()
+        if self._requests_adapter is None:
+            adapter: TimeoutHTTPAdapter | SharedAdapter
+            if self._requests_adapter_registry is not None:
+                adapter = self._requests_adapter_registry.acquire(**self._requests_retry_adapter_kwargs)
+            else:
+                adapter = requests_retry_adapter(**self._requests_retry_adapter_kwargs)
+            self._requests_adapter = adapter
+            self._prewarm_pending = bool(self._prewarm_urls)
+        session = requests_session(adapter=self._requests_adapter, protocol=self._requests_protocol)
+        self._sessions.append((None if owner is None else weakref.ref(owner), session))
+        return session
+
+    def _prune_sessions(self) -> None:
+        """
+        Forget the sessions of threads which have exited. Must be called with the lock held.
+        """
+        def _owner_alive(owner: weakref.ref[threading.Thread] | None) -> bool:
+            thread = None if owner is None else owner()
+            return owner is None or (thread is not None and thread.is_alive())
+
+        self._sessions = [(owner, session) for owner, session in self._sessions if _owner_alive(owner)]
+
+    def _prewarm(self, session: requests.Session) -> None:
+        """
+        Prewarm the pools of the shared adapter with the new session, if it has just been created.
+        This is not done with the lock held, so that other threads can get sessions meanwhile.
+        """
+        with self._lock:
+            pending, self._prewarm_pending = self._prewarm_pending, False
+        if pending and self._prewarm_urls:
+            prewarm_session(session, self._prewarm_urls, self._prewarm_connections)
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """
+        Returns the calling thread's requests retry session, after initializing it if needed.
+        Raises RuntimeError in pool mode, where sessions must be borrowed using checkout.
+        """
+        if self._session_mode != "per_thread":
+            raise RuntimeError("In pool mode, use checkout() to borrow a session")
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            with self._lock:
+                local.session = self._new_session(threading.current_thread())
+                local.generation = self._generation
+            self._prewarm(local.session)
+        session: requests.Session = local.session
+        return session
+
+    @contextmanager
+    def checkout(self, timeout: float | None = None) -> Iterator[requests.Session]:
+        """
+        Borrow a session for the duration of the context. In pool mode, this blocks until a
+        session is available, raising TimeoutError if timeout seconds pass first. In per_thread
+        mode, this provides the calling thread's session.
+        """
+        if self._session_mode == "per_thread":
+            yield self.requests_session
+            return
+        with self._lock:
+            slots, idle_sessions = self._session_slots, self._idle_sessions
+        if not slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No session became available within {timeout} seconds")
+        try:
+            try:
+                session = idle_sessions.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    session = self._new_session()
+                self._prewarm(session)
+            try:
+                yield session
+            finally:
+                idle_sessions.put(session)
+        finally:
+            slots.release()
+
+    def map_requests(
+        self,
+        specs: Iterable[RequestSpecType],
+        *,
+        max_workers: int | None = None,
+        ordered: bool = False,
+    ) -> Iterator[RequestOutcome]:
+        """
+        Make the requests concurrently, and yield their outcomes. Each worker thread uses its
+        own session (in pool mode, checked out for each request). By default, the number of
+        worker threads is the session pool size. See fan_out.map_requests for details.
+        """
+        def _send(spec: RequestSpec) -> requests.Response:
+            with self.checkout() as session:
+                return session.request(spec.method, spec.url, **(spec.kwargs or {}))
+
+        return map_with(_send, specs, max_workers=max_workers or self._session_pool_size, ordered=ordered)
+
+    def download(self, url: str, file: WritableBinaryFile, *, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+                 **kwargs: Any) -> DownloadOutcome:
+        """
+        Stream the body of a GET request to the URL into the file, using the calling thread's session
+        (in pool mode, checked out for the download), resuming it where it left off if it is cut off.
+        See downloads.resumable_download for details.
+        """
+        with self.checkout() as session:
+            return resumable_download(session, url, file, chunk_size=chunk_size, **kwargs)
+
+    def submit(self, method: str, url: str, **kwargs: Any) -> Future[requests.Response]:
+        """
+        Make the request in a worker thread, and return a Future for its response. Each worker
+        thread uses its own session (in pool mode, checked out for each attempt), and there are
+        as many of them as the session pool size. See RetrySessionManager.submit for details.
+        """
+        with self._lock:
+            if self._retry_scheduler is None:
+                self._retry_scheduler = RetryScheduler(self._send_spec, self._session_pool_size)
+            scheduler = self._retry_scheduler
+        return scheduler.submit(method, url, **kwargs)
+
+    def _send_spec(self, spec: RequestSpec) -> requests.Response:
+        with self.checkout() as session:
+            return session.request(spec.method, spec.url, **(spec.kwargs or {}))
@@ -28,18 +28,65 @@ TimeoutHTTPAdapter class
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from contextvars import copy_context
+import ssl
+import threading
+import time
+from typing import TYPE_CHECKING, cast
 
+from requests import Request
 from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from .utils import NotPassed, NOT_PASSED
+from .bulkhead import BulkheadFull
+from .circuit_breaker import (
+    is_circuit_open,
+    CircuitOpen,
+)
+from .deadline import (
+    is_deadline_exceeded,
+    split_timeout,
+    using_deadline,
+    Deadline,
+    DeadlineExceeded,
+    DeadlineTimeout,
+    TotalTimeout,
+)
+from .connection_lifetime import using_connection_lifetime
+from .connection_pools import POOL_CLASSES_BY_SCHEME
+from .hedging import first_response, using_hedge_cancellation, HedgeCancellation
+from .rate_limiter import (
+    is_rate_limited,
+    using_rate_limiter,
+    RateLimited,
+)
+from .retry_after_pause import using_retry_after_pause
+from .retry_deferral import active_retry_deferral, using_retry_deferral
+from .retry_with_logs import RetryWithLogs
+from .stale_connections import using_stale_connection_policy
+from .utils import host_key, NotPassed, NOT_PASSED
 
 
 if TYPE_CHECKING:
     from requests import PreparedRequest, Response
+    from typing import Any
+
     from urllib3 import Retry
+    from urllib3.connectionpool import ConnectionPool
 
-    from .typing_imports import Mapping, TypedDict
+    from .bulkhead import Bulkhead
+    from .connection_lifetime import ConnectionLifetimePolicy
+    from .deadline import AttemptTimeoutType, RequestTimeoutType
+    from .hedging import HedgingPolicy
+    from .rate_limiter import RateLimiter
+    from .response_cache import ResponseCache
+    from .retry_after_pause import RetryAfterPause
+    from .single_flight import SingleFlight
+    from .stale_connections import StaleConnectionPolicy
+    from .metrics import RetryMetrics
+    from .typing_imports import Hashable, Iterator, Mapping, TypedDict
 
     # To simplify type hints
     type BytesOrStringType = bytes | str
@@ -69,11 +116,72 @@ if TYPE_CHECKING:
         proxies: ProxiesType
 
 
-class TimeoutHTTPAdapter(HTTPAdapter):
+def _connection_settings(verify: VerifyType | NotPassed, cert: CertType | NotPassed,
+                         proxies: ProxiesType | NotPassed) -> Hashable:
+    """
+    Returns a hashable equivalent of the connection settings of a request, so that only requests
+    made with the same ones are coalesced (see SingleFlight)
+    """
+    frozen_proxies = proxies if proxies is None or isinstance(proxies, NotPassed) else tuple(sorted(proxies.items()))
+    # requests also accepts a list for cert, although its type hints do not say so
+    frozen_cert = cert if cert is None or isinstance(cert, (str, bytes, NotPassed)) else tuple(cert)
+    return verify, frozen_cert, frozen_proxies
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):  # pylint: disable=too-many-instance-attributes
     """
     An HTTP Adapter that allows a session level timeout for both read and connect attributes.
     This prevents interruption to reads that happen as a function of time or istio resets that
     causes our applications to sit and wait forever on a half open socket.
+
+    If total_timeout is set, it is the overall deadline (in seconds) for each request, spanning
+    all of its attempts and backoff sleeps. Each attempt's timeouts are shortened to fit in the
+    time remaining, and DeadlineExceeded is raised once the deadline passes. Individual requests
+    can override this by passing a TotalTimeout as their timeout.
+
+    If max_retries is a RetryWithLogs with a circuit breaker, requests to a host whose circuit is
+    open fail immediately with CircuitOpen. Successful responses are recorded with its circuit
+    breaker and retry budget, and if it has metrics, every request is timed and recorded with them.
+    If it has an adaptive timeout, that sets the read timeout of the attempts to each host.
+
+    If rate_limiter is set, every attempt (including retries and hedges) waits for the rate limit
+    of its host, and RateLimited is raised if it would have to wait too long (see RateLimiter).
+
+    If bulkhead is set, each request (with all of its attempts) takes up one of the places for
+    concurrent requests to its host, waiting for one if they are all taken, and BulkheadFull is
+    raised if it would have to wait too long (see Bulkhead). An adaptive bulkhead adjusts its limits
+    from the attempts recorded by the RetryWithLogs in max_retries, if it has the same bulkhead
+    (as requests_retry_adapter arranges).
+
+    If retry_after_pause is set, a Retry-After header on a response which is retried pauses its
+    host, and every attempt to the host (including retries and hedges) waits for the pause to end
+    (see RetryAfterPause).
+
+    If hedging is set, requests it applies to are made in worker threads, and hedged when they
+    are slow to be answered (see HedgingPolicy). The worker threads are stopped by close().
+
+    If the request is being made by a RetryScheduler, its retries (unless it is hedged or
+    coalesced) are deferred instead of slept for, and when the scheduler resumes it, it keeps
+    the deadline and timing it had (see RetryScheduler).
+
+    If cache is set, requests which are not streamed are answered from it when possible, and
+    their responses are stored in it (see ResponseCache). If single_flight is set, concurrent
+    identical requests which are not streamed (and are not answered from the cache) are
+    coalesced into a single request (see SingleFlight).
+
+    If ssl_context is set, it is used for the HTTPS connections of requests which verify server
+    certificates with the default CA bundle (verify=True), instead of urllib3 creating a context
+    (and loading the CA bundle into it) for each new connection. Requests with a client
+    certificate (cert) do not use it, since urllib3 would load the certificate into it, for every
+    other connection made with it to present (and its TLS sessions to be resumed by requests
+    without the certificate). If it is a ResumingSSLContext,
+    the TLS sessions of earlier connections are resumed by later connections to the same servers.
+
+    The connection pools of the adapter keep track of how long their connections have been idle.
+    If stale_connections is set, requests whose pooled connection turns out to be stale are
+    replayed on a new connection, without using up a retry (see StaleConnectionPolicy). If
+    connection_lifetime is set, pooled connections which have been idle or open for too long are
+    closed (see ConnectionLifetimePolicy).
     """
 
     def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -82,8 +190,30 @@ class TimeoutHTTPAdapter(HTTPAdapter):
             pool_maxsize: int | NotPassed = NOT_PASSED,
             max_retries: Retry | int | None | NotPassed = NOT_PASSED,
             pool_block: bool | NotPassed = NOT_PASSED,
-            timeout: TimeoutType = None) -> None:
+            timeout: TimeoutType = None,
+            total_timeout: float | None = None,
+            hedging: HedgingPolicy | None = None,
+            cache: ResponseCache | None = None,
+            single_flight: SingleFlight | None = None,
+            stale_connections: StaleConnectionPolicy | None = None,
+            connection_lifetime: ConnectionLifetimePolicy | None = None,
+            ssl_context: ssl.SSLContext | None = None,
+            rate_limiter: RateLimiter | None = None,
+            bulkhead: Bulkhead | None = None,
+            retry_after_pause: RetryAfterPause | None = None) -> None:
         self.timeout: TimeoutType = timeout
+        self.total_timeout = total_timeout
+        self.hedging = hedging
+        self.cache = cache
+        self.single_flight = single_flight
+        self.stale_connections = stale_connections
+        self.connection_lifetime = connection_lifetime
+        self.ssl_context = ssl_context
+        self.rate_limiter = rate_limiter
+        self.bulkhead = bulkhead
+        self.retry_after_pause = retry_after_pause
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_executor_lock = threading.Lock()
         kwargs: _InitArgs = {}
         if not isinstance(pool_connections, NotPassed):
             kwargs["pool_connections"] = pool_connections
@@ -95,18 +225,128 @@ class TimeoutHTTPAdapter(HTTPAdapter):
             kwargs["pool_block"] = pool_block
         super().__init__(**kwargs)
 
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = POOL_CLASSES_BY_SCHEME
+
+    def connection_pool(self,
+                        url: str,
+                        verify: VerifyType | None = True,
+                        cert: CertType = None,
+                        proxies: ProxiesType = None) -> ConnectionPool:
+        """
+        Returns the urllib3 connection pool which the adapter would use for a request to the URL
+        """
+        request = Request("GET", url).prepare()
+        pool: ConnectionPool
+        if hasattr(HTTPAdapter, "get_connection_with_tls_context"):
+            # requests 2.32.2+ chooses the pool according to the TLS settings of the request
+            pool = self.get_connection_with_tls_context(request, verify, proxies,
+                                                        cast("tuple[str, str] | str | None", cert))
+        else:
+            pool = self.get_connection(url, proxies)
+        # As send() does, before making a request with the pool
+        self.cert_verify(pool, url, verify, cert)
+        return pool
+
+    def cert_verify(self, conn: Any, url: str, verify: VerifyType | None, cert: CertType) -> None:
+        super().cert_verify(conn, url, verify, cert)  # type: ignore[no-untyped-call,unused-ignore]
+        if self.ssl_context is None or not url.lower().startswith("https"):
+            return
+        # Older versions of requests use the same pool whatever the client certificate, and leave
+        # the certificate of an earlier request set on it
+        if verify is True and not cert and not getattr(conn, "cert_file", None):
+            # The CA bundle is already loaded into the SSL context, and urllib3 would load it
+            # into it again for each new connection if it were specified
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+            conn.conn_kw["ssl_context"] = self.ssl_context
+        else:
+            # urllib3 would load a client certificate into the (shared) SSL context, so that every
+            # connection made with it would present it, and its sessions could be resumed by
+            # requests without it
+            conn.conn_kw.pop("ssl_context", None)
+
+    @property
+    def pool_maxsize(self) -> int:
+        """
+        Returns the maximum number of connections kept in each connection pool
+        """
+        pool_maxsize: int = self.poolmanager.connection_pool_kw["maxsize"]
+        return pool_maxsize
+
+    @property
+    def metrics(self) -> RetryMetrics | None:
+        """
+        Returns the metrics of max_retries, if it has them
+        """
+        return self.max_retries.metrics if isinstance(self.max_retries, RetryWithLogs) else None
+
     def send(  # pylint: disable=too-many-arguments,too-many-positional-arguments
             self,
             request: PreparedRequest,
             stream: bool | NotPassed = NOT_PASSED,
-            timeout: TimeoutType = None,
+            timeout: TimeoutType | TotalTimeout = None,
             verify: VerifyType | NotPassed = NOT_PASSED,
             cert: CertType | NotPassed = NOT_PASSED,
             proxies: ProxiesType | NotPassed = NOT_PASSED) -> Response:
-        kwargs: _SendArgs = {
-            "timeout":
-            self.timeout if timeout is None else timeout
-        }
+        # The deadline starts when the request is made, so that it also bounds any wait for an
+        # identical request in flight
+        total_timeout = timeout.total if isinstance(timeout, TotalTimeout) else self.total_timeout
+        deadline = None if total_timeout is None else Deadline(total_timeout)
+
+        def send_uncached(send_request: PreparedRequest) -> Response:
+            return self._send_uncached(send_request, deadline, stream, timeout, verify, cert, proxies)
+
+        if stream is True:
+            return send_uncached(request)
+        single_flight = self.single_flight
+
+        def send_coalesced(send_request: PreparedRequest) -> Response:
+            if single_flight is None:
+                return send_uncached(send_request)
+            # The retries of coalesced requests cannot be deferred, since other requests are waiting on them
+            with using_retry_deferral(None), using_deadline(deadline):
+                return single_flight.send(send_request, send_uncached, _connection_settings(verify, cert, proxies))
+
+        if self.cache is None:
+            return send_coalesced(request)
+        return self.cache.send(request, send_coalesced)
+
+    def _send_uncached(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            request: PreparedRequest,
+            deadline: Deadline | None,
+            stream: bool | NotPassed,
+            timeout: TimeoutType | TotalTimeout,
+            verify: VerifyType | NotPassed,
+            cert: CertType | NotPassed,
+            proxies: ProxiesType | NotPassed) -> Response:
+        """
+        Make the request, with its retries (and hedging, if it applies), by the specified deadline
+        """
+        retry = self.max_retries if isinstance(self.max_retries, RetryWithLogs) else None
+        if retry is not None and retry.circuit_breaker is not None:
+            breaker_key = host_key(request.url or "")
+            if not retry.circuit_breaker.allow_request(breaker_key):
+                raise CircuitOpen(f"Circuit breaker for '{breaker_key}' is open", request=request)
+        request_timeout: RequestTimeoutType | AttemptTimeoutType
+        if isinstance(timeout, TotalTimeout):
+            request_timeout = timeout.attempt_timeout(self.timeout)
+        else:
+            request_timeout = self.timeout if timeout is None else timeout
+        if retry is not None and retry.adaptive_timeout is not None:
+            request_timeout = retry.adaptive_timeout.attempt_timeout(host_key(request.url or ""), request_timeout)
+        deferral = active_retry_deferral()
+        resumed = deferral if deferral is not None and deferral.retry is not None else None
+        if resumed is not None:
+            # A RetryScheduler is resuming the request, whose retry it deferred
+            deadline = resumed.deadline
+        if deadline is not None:
+            request_timeout = DeadlineTimeout(deadline, *split_timeout(request_timeout))
+        # requests also accepts urllib3 Timeout objects and None connect timeouts,
+        # although its type hints do not say so
+        kwargs: _SendArgs = {"timeout": cast("TimeoutType", request_timeout)}
         if not isinstance(stream, NotPassed):
             kwargs["stream"] = stream
         if not isinstance(verify, NotPassed):
@@ -115,4 +355,107 @@ class TimeoutHTTPAdapter(HTTPAdapter):
             kwargs["cert"] = cert
         if not isinstance(proxies, NotPassed):
             kwargs["proxies"] = proxies
-        return super().send(request, **kwargs)
+        timing = nullcontext() if retry is None else retry.timing_request(
+            request.url or "", request.method or "GET", None if resumed is None else resumed.timing)
+        with (using_deadline(deadline), self._bulkhead_place(request), using_rate_limiter(self.rate_limiter),
+              using_retry_after_pause(self.retry_after_pause), using_stale_connection_policy(self.stale_connections),
+              using_connection_lifetime(self.connection_lifetime), timing):
+            if self.hedging is not None and self.hedging.applies(request.method):
+                # The retries of hedged requests are made in worker threads, so they cannot be deferred
+                with using_retry_deferral(None):
+                    response = self._send_hedged(self.hedging, request, kwargs)
+            else:
+                response = self._send_attempts(request, kwargs)
+            if retry is not None:
+                retry.record_success(request.url or "", response.status_code)
+        return response
+
+    @contextmanager
+    def _bulkhead_place(self, request: PreparedRequest) -> Iterator[None]:
+        """
+        Hold a place in the bulkhead (if there is one) for the host of the request while it is made
+        """
+        if self.bulkhead is None:
+            yield
+            return
+        key = host_key(request.url or "")
+        if not self.bulkhead.acquire(key):
+            raise BulkheadFull(f"Bulkhead for '{key}' is full", request=request)
+        try:
+            yield
+        finally:
+            self.bulkhead.release(key)
+
+    def _send_attempts(self, request: PreparedRequest, kwargs: _SendArgs) -> Response:
+        """
+        Make the request, with its retries, raising DeadlineExceeded, CircuitOpen, or RateLimited
+        if that is why they stopped
+        """
+        try:
+            return super().send(request, **kwargs)
+        except RequestsConnectionError as err:
+            if is_deadline_exceeded(err):
+                raise DeadlineExceeded(*err.args, request=err.request, response=err.response) from err
+            if is_circuit_open(err):
+                raise CircuitOpen(*err.args, request=err.request, response=err.response) from err
+            if is_rate_limited(err):
+                raise RateLimited(*err.args, request=err.request, response=err.response) from err
+            raise
+
+    def _send_hedged(self, hedging: HedgingPolicy, request: PreparedRequest, kwargs: _SendArgs) -> Response:
+        """
+        Make the request in a worker thread, and hedge it if it is not answered in time
+        """
+        key = host_key(request.url or "")
+        method = request.method or "GET"
+        started = time.monotonic()
+        executor = self._hedging_executor(hedging)
+        # Each attempt runs in its own copy of the context, so it sees the deadline
+        # and the request timing of this one
+        cancellations = [HedgeCancellation()]
+        attempts = [executor.submit(copy_context().run, self._send_hedge_attempt, cancellations[0], request, kwargs)]
+        done, _ = wait(attempts, timeout=hedging.hedge_delay(key))
+        if not done and hedging.try_hedge(key, method):
+            cancellations.append(HedgeCancellation())
+            attempts.append(executor.submit(copy_context().run, self._send_hedge_attempt, cancellations[1],
+                                            request.copy(), kwargs))
+        winner = first_response(attempts, cancellations)
+        if winner is not attempts[0]:
+            # Record how long the first attempt ran until it stopped (having been cancelled), rather
+            # than how long it took its hedge to win, which would drag the hedge delay down
+            # (unless it was cancelled before it started)
+            def record_first_latency(attempt: Future[Response]) -> None:
+                if not attempt.cancelled():
+                    hedging.record_latency(key, time.monotonic() - started)
+            attempts[0].add_done_callback(record_first_latency)
+        response = winner.result()
+        if winner is attempts[0]:
+            hedging.record_latency(key, time.monotonic() - started)
+        if response.ok:
+            hedging.record_success()
+        return response
+
+    def _send_hedge_attempt(self, cancellation: HedgeCancellation, request: PreparedRequest,
+                            kwargs: _SendArgs) -> Response:
+        """
+        Make one attempt of a hedged request (with its retries), which the cancellation can stop
+        """
+        with using_hedge_cancellation(cancellation):
+            return self._send_attempts(request, kwargs)
+
+    def _hedging_executor(self, hedging: HedgingPolicy) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool for hedged requests, creating it if needed
+        """
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=hedging.max_workers,
+                                                          thread_name_prefix="rrs-hedge")
+            return self._hedge_executor
+
+    def close(self) -> None:
+        with self._hedge_executor_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
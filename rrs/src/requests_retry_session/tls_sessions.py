@@ -0,0 +1,231 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+ResumingSSLContext class: an SSLContext which can be shared by retry adapters, and which
+resumes the TLS sessions of their earlier connections to the same servers
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import ssl
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util.wait import wait_for_read
+
+if TYPE_CHECKING:
+    import socket
+
+    from .typing_imports import Self
+
+
+# How long (in seconds) to wait for the session tickets which TLS 1.3 servers send after the
+# handshake, when a connection is opened before it is needed
+SESSION_TICKET_WAIT = 0.25
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TlsSessionStats(NamedTuple):
+    """
+    handshakes: The number of TLS connections which needed a full handshake
+    resumed: The number of TLS connections which resumed an earlier session (an abbreviated handshake)
+    sessions: The number of servers with a session which can currently be resumed
+    """
+    handshakes: int
+    resumed: int
+    sessions: int
+
+
+type _SessionKey = tuple[str, int]
+
+
+def _session_key(server_hostname: str | bytes | None, sock: socket.socket) -> _SessionKey | None:
+    """
+    Returns the key of the session cache for a connection to the server, or None if it has none
+    """
+    if not server_hostname:
+        return None
+    if isinstance(server_hostname, bytes):
+        server_hostname = server_hostname.decode()
+    try:
+        port = sock.getpeername()[1]
+    except OSError:
+        return None
+    return server_hostname, port
+
+
+class ResumingSSLContext(ssl.SSLContext):
+    """
+    A client SSLContext which remembers the most recent resumable TLS session of each server
+    (by host name and port), and resumes it when it makes a new connection to that server,
+    so that the connection only needs an abbreviated handshake.
+
+    Sessions are remembered when the pooled connections of retry adapters using this context are
+    returned to their pool (by which time any TLS 1.3 session tickets have been received). The
+    context can be shared by any number of adapters and sessions, as long as they all want the
+    same TLS configuration. Retry adapters do not use it for requests with a client certificate,
+    so it never holds sessions authenticated with one, which requests without it could resume.
+    """
+
+    def __new__(cls, protocol: int = ssl.PROTOCOL_TLS_CLIENT) -> Self:
+        return super().__new__(cls, protocol)
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT) -> None:  # pylint: disable=unused-argument
+        # The protocol is used by __new__, which creates the underlying context
+        super().__init__()
+        self._sessions: dict[_SessionKey, ssl.SSLSession] = {}
+        self._handshakes = 0
+        self._resumed = 0
+        self._sessions_lock = threading.Lock()
+
+    def wrap_socket(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            self,
+            sock: socket.socket,
+            server_side: bool = False,
+            do_handshake_on_connect: bool = True,
+            suppress_ragged_eofs: bool = True,
+            server_hostname: str | bytes | None = None,
+            session: ssl.SSLSession | None = None) -> ssl.SSLSocket:
+        key = None if server_side else _session_key(server_hostname, sock)
+        if session is None and key is not None:
+            with self._sessions_lock:
+                session = self._sessions.get(key)
+        ssl_sock = super().wrap_socket(sock, server_side=server_side,
+                                       do_handshake_on_connect=do_handshake_on_connect,
+                                       suppress_ragged_eofs=suppress_ragged_eofs,
+                                       server_hostname=server_hostname, session=session)
+        if key is not None and do_handshake_on_connect:
+            with self._sessions_lock:
+                if ssl_sock.session_reused:
+                    self._resumed += 1
+                else:
+                    self._handshakes += 1
+            if session is not None and not ssl_sock.session_reused:
+                LOGGER.debug("The TLS session for %s:%d was not resumed", *key)
+        return ssl_sock
+
+    def remember_session(self, ssl_sock: ssl.SSLSocket) -> None:
+        """
+        Remember the session of the connection, if it can be resumed
+        """
+        session = ssl_sock.session
+        # A TLS 1.3 session can only be resumed once the server has sent a session ticket for it
+        if session is None or not (session.has_ticket or ssl_sock.version() != "TLSv1.3"):
+            return
+        key = _session_key(ssl_sock.server_hostname, ssl_sock)
+        if key is None:
+            return
+        with self._sessions_lock:
+            self._sessions[key] = session
+
+    def forget_sessions(self) -> None:
+        """
+        Forget all remembered sessions, so that the next connection to each server needs a full handshake
+        """
+        with self._sessions_lock:
+            self._sessions.clear()
+
+    def stats(self) -> TlsSessionStats:
+        """
+        Returns the counters
+        """
+        with self._sessions_lock:
+            return TlsSessionStats(handshakes=self._handshakes, resumed=self._resumed, sessions=len(self._sessions))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sessions={self.stats().sessions})"
+
+
+def remember_tls_session(sock: object) -> None:
+    """
+    If the socket is a TLS connection made with a ResumingSSLContext, remember its session
+    """
+    if isinstance(sock, ssl.SSLSocket) and isinstance(sock.context, ResumingSSLContext):
+        sock.context.remember_session(sock)
+
+
+def read_session_tickets(sock: object, timeout: float = SESSION_TICKET_WAIT) -> bool:
+    """
+    If the socket is a TLS 1.3 connection made with a ResumingSSLContext, wait up to timeout for
+    the session tickets which the server sends after the handshake, and process them. Otherwise,
+    an idle connection with unread session tickets looks (to urllib3) as if it had been dropped.
+    Returns False if the server has closed the connection (or sent it anything unexpected).
+    """
+    if not isinstance(sock, ssl.SSLSocket) or not isinstance(sock.context, ResumingSSLContext):
+        return True
+    if sock.version() != "TLSv1.3" or not wait_for_read(sock, timeout):
+        return True
+    previous_timeout = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        sock.recv(1)
+    except ssl.SSLWantReadError:
+        # Everything received has been processed
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(previous_timeout)
+    return False
+
+
+def create_ssl_context(ca_bundle: str | None = None) -> ResumingSSLContext:
+    """
+    Create a ResumingSSLContext which verifies servers with the CA certificates in the specified
+    bundle (a file, or a directory of hashed certificates), or by default, the one requests uses.
+    The certificates are loaded once, here, rather than for every new connection.
+
+    Its configuration otherwise matches that of the contexts urllib3 creates, except that it
+    allows TLS session tickets, so that sessions can be resumed.
+    """
+    context = ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.options |= ssl.OP_NO_COMPRESSION
+    context.post_handshake_auth = True
+    ca_bundle = ca_bundle or DEFAULT_CA_BUNDLE_PATH
+    if os.path.isdir(ca_bundle):
+        context.load_verify_locations(capath=ca_bundle)
+    else:
+        context.load_verify_locations(cafile=ca_bundle)
+    return context
+
+
+_shared_ssl_contexts: dict[str | None, ResumingSSLContext] = {}
+_shared_ssl_contexts_lock = threading.Lock()
+
+
+def shared_ssl_context(ca_bundle: str | None = None) -> ResumingSSLContext:
+    """
+    Returns the process-wide ResumingSSLContext for the specified CA bundle (see create_ssl_context),
+    creating it if needed
+    """
+    with _shared_ssl_contexts_lock:
+        context = _shared_ssl_contexts.get(ca_bundle)
+        if context is None:
+            context = _shared_ssl_contexts[ca_bundle] = create_ssl_context(ca_bundle)
+        return context
@@ -34,10 +34,12 @@ This module is also symbolically linked into the test-rrs package.
 
 # Python 3.11+
 from collections.abc import (
+    AsyncIterator,
     Callable,
     Collection,
     Container,
     Generator,
+    Hashable,
     Iterable,
     Iterator,
     Mapping,
@@ -70,10 +72,12 @@ IterableProtocol = Iterable
 
 # Explicitly re-export
 __all__ = [
+    "AsyncIterator",
     "Callable",
     "Collection",
     "Container",
     "Generator",
+    "Hashable",
     "Iterable",
     "IterableProtocol",
     "Iterator",
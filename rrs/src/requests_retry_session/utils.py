@@ -28,6 +28,15 @@ Shared general utilities
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from urllib3.connectionpool import ConnectionPool
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
 
 class NotPassed:  # pylint: disable=too-few-public-methods
     """
@@ -37,3 +46,83 @@ class NotPassed:  # pylint: disable=too-few-public-methods
 
 
 NOT_PASSED = NotPassed()
+
+
+def format_host_key(scheme: str, host: str | None, port: int | None) -> str:
+    """
+    Returns the key (scheme://host:port) used to track a host, filling in the default port
+    of the scheme if port is not specified
+    """
+    return f"{scheme}://{host}:{port or _DEFAULT_PORTS.get(scheme)}"
+
+
+def host_key(url: str) -> str:
+    """
+    Returns the key (scheme://host:port) used to track the host of the specified URL
+    """
+    parts = urlsplit(url)
+    return format_host_key(parts.scheme.lower(), parts.hostname, parts.port)
+
+
+def pool_host_key(pool: ConnectionPool) -> str:
+    """
+    Returns the key (scheme://host:port) used to track the host of the specified urllib3 pool
+    """
+    return format_host_key(pool.scheme or "http", pool.host, pool.port)
+
+
+def validate_int(name: str, value: object) -> None:
+    """
+    Raise TypeError if value is not an int (bools are rejected)
+    """
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"{name} must be an int, not {type(value).__name__}")
+
+
+def validate_positive_int(name: str, value: object) -> None:
+    """
+    Raise TypeError if value is not an int (bools are rejected), or
+    ValueError if it is less than 1
+    """
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"{name} must be an int, not {type(value).__name__}")
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1, not {value}")
+
+
+def validate_bool(name: str, value: object) -> None:
+    """
+    Raise TypeError if value is not a bool
+    """
+    if not isinstance(value, bool):
+        raise TypeError(f"{name} must be a bool, not {type(value).__name__}")
+
+
+def validate_positive_number(name: str, value: object) -> None:
+    """
+    Raise TypeError if value is not an int or float (bools are rejected), or
+    ValueError if it is not greater than 0
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number, not {type(value).__name__}")
+    if value <= 0:
+        raise ValueError(f"{name} must be greater than 0, not {value}")
+
+
+def validate_non_negative_number(name: str, value: object) -> None:
+    """
+    Raise TypeError if value is not an int or float (bools are rejected), or
+    ValueError if it is less than 0
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number, not {type(value).__name__}")
+    if value < 0:
+        raise ValueError(f"{name} must not be less than 0, not {value}")
+
+
+def validate_optional_instance(name: str, value: object, cls: type) -> None:
+    """
+    Raise TypeError if value is neither None nor an instance of cls
+    """
+    if value is not None and not isinstance(value, cls):
+        raise TypeError(f"{name} must be a {cls.__name__}, not {type(value).__name__}")
@@ -30,16 +30,16 @@ import logging
 # Because we wish to support Python versions back to 3.6, we
 # import Union rather than using |
 from typing import (
+    Any,
     FrozenSet,
     NamedTuple,
     Tuple,
 )
 
-import requests
-
 from test_rrs.typing_imports import (
     Callable,
     Literal,
+    Protocol,
     TypeAlias,
     get_args,
 )
@@ -55,7 +55,20 @@ REQUEST_VERBS: FrozenSet[RequestVerb] = frozenset(get_args(RequestVerb))
 RequestProtocol: TypeAlias = Literal['http', 'https']
 REQUEST_PROTOCOLS: FrozenSet[RequestProtocol] = frozenset(get_args(RequestProtocol))
 
-RequestMethodFunction: TypeAlias = Callable[..., requests.Response]
+
+class ResponseLike(Protocol):
+    """
+    The parts of a response that the tests use. requests.Response satisfies this,
+    as do the responses from the async session bridge.
+    """
+    status_code: int
+
+    def __enter__(self) -> Any: ...
+
+    def __exit__(self, *args: Any) -> Any: ...
+
+
+RequestMethodFunction: TypeAlias = Callable[..., ResponseLike]
 
 ReqParamId: TypeAlias = str
 ReqParamDelays: TypeAlias = Tuple[float, ...]
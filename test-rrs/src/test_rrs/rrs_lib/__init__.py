@@ -26,6 +26,7 @@
 Test definitions
 """
 
+from .async_session_bridge import AsyncSessionBridge
 from .my_rr_session_manager import MyRRSessionManager
 from .rr_adapter_args import (
     RR_STATUS_FORCELIST,
@@ -36,6 +37,7 @@ from .rr_adapter_args import (
 
 # Explicitly re-export
 __all__ = [
+    "AsyncSessionBridge",
     "MyRRSessionManager",
     "RR_STATUS_FORCELIST",
     "RR_TIMEOUT",
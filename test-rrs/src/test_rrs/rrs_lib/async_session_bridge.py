@@ -0,0 +1,104 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Synchronous wrapper around an AsyncRetrySession, so that the test suites can be run against it
+"""
+
+import asyncio
+from contextlib import AbstractContextManager
+from types import TracebackType
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Any, Type, Union
+
+import requests_retry_session as rrs
+from requests_retry_session.async_retry_session import AsyncRetrySession
+
+
+class BridgeResponse:
+    """
+    The parts of a response that the tests look at
+    """
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+    def __enter__(self) -> "BridgeResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class AsyncSessionBridge(AbstractContextManager["AsyncSessionBridge"]):
+    """
+    Runs an AsyncRetrySession on a private event loop, and provides blocking
+    get and post methods that make requests using it
+    """
+    def __init__(
+        self,
+        proto: rrs.ProtocolType,
+        adapter_args: rrs.RequestsRetryAdapterArgs
+    ) -> None:
+        self._session = AsyncRetrySession(protocol=proto, **adapter_args)
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+
+    def __enter__(self) -> "AsyncSessionBridge":
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._session.__aenter__())
+        return self
+
+    def __exit__(  # pylint: disable=useless-return
+            self, exc_type: Union[Type[BaseException], None],
+            exc_val: Union[BaseException, None],
+            exc_tb: Union[TracebackType, None]) -> Union[bool, None]:
+        loop, self._loop = self._loop, None
+        assert loop is not None
+        loop.run_until_complete(self._session.__aexit__(exc_type, exc_val, exc_tb))
+        loop.close()
+        return None
+
+    async def _async_request(self, method: str, url: str, **kwargs: Any) -> BridgeResponse:
+        """
+        Make the request, read the response, and release it
+        """
+        async with await self._session.request(method, url, **kwargs) as resp:
+            await resp.read()
+            return BridgeResponse(resp.status)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> BridgeResponse:
+        """
+        Make a request, blocking until it completes
+        """
+        assert self._loop is not None
+        return self._loop.run_until_complete(self._async_request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs: Any) -> BridgeResponse:
+        """ Make a GET request """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> BridgeResponse:
+        """ Make a POST request """
+        return self.request("POST", url, **kwargs)
@@ -0,0 +1,64 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Scenarios are tests that do not fit the request/expected status code model of
+the test suites.
+"""
+
+# We also have to import the files that define our scenarios, even though
+# we are not re-exporting any of them. This is to ensure that the classes
+# get defined (and therefore added to the metaclass registry)
+from .adaptive_timeout import *
+from .async_concurrency import *
+from .async_unsupported_args import *
+from .backoff import *
+from .bulkhead import *
+from .circuit_breaker import *
+from .connection_lifetime import *
+from .deadline import *
+from .fan_out import *
+from .hedging import *
+from .metrics import *
+from .pool_load import *
+from .prewarm import *
+from .rate_limiter import *
+from .response_cache import *
+from .resumable_download import *
+from .retry_after_pause import *
+from .retry_budget import *
+from .retry_events import *
+from .retry_log_aggregator import *
+from .retry_scheduler import *
+from .shared_adapter import *
+from .single_flight import *
+from .stale_connections import *
+from .thread_safe_session import *
+from .tls_sessions import *
+
+from .scenario_base import run_scenarios
+
+
+# Explicitly re-export
+__all__ = ["run_scenarios"]
@@ -0,0 +1,87 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Shortening the read timeouts of fast hosts with AdaptiveTimeout
+"""
+
+import logging
+
+import requests_retry_session as rrs
+from requests_retry_session.utils import host_key
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+from test_rrs.utils import random_id
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+FLOOR = 0.1
+MIN_SAMPLES = 5
+# The static read timeout, and how long the server takes to answer the first attempt of the slow request
+READ_TIMEOUT = 2.0
+SLOW_DELAY = 1.0
+
+
+class AdaptiveTimeoutScenario(metaclass=ScenarioMeta):
+    """
+    Make enough fast requests for the adaptive timeout to estimate the latency of the server,
+    and verify that the read timeout drops to its floor, so that a request whose first attempt
+    is slow is retried long before the static read timeout would have passed
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("AdaptiveTimeoutScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            key = host_key(url)
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                adaptive = rrs.AdaptiveTimeout(floor=FLOOR, min_samples=MIN_SAMPLES)
+                rr_args = rr_adapter_args()
+                rr_args["read_timeout"] = READ_TIMEOUT
+                rr_args["adaptive_timeout"] = adaptive
+                passed = True
+                for _ in range(MIN_SAMPLES):
+                    outcome, _ = timed_get(entry, url, rr_args, ok_params())
+                    passed = passed and outcome == 200
+                read_timeout = adaptive.read_timeout(key, READ_TIMEOUT)
+                logging.log(NOTICE, "AdaptiveTimeoutScenario: %s: %s; read timeout %s",
+                            entry, adaptive.estimate(key), read_timeout)
+                passed = passed and read_timeout == FLOOR
+                params = ReqParams(id=random_id(), delays=(SLOW_DELAY, 0), scs=(200, 200))
+                outcome, elapsed = timed_get(entry, url, rr_args, params)
+                estimate = adaptive.estimate(key)
+                logging.log(NOTICE, "AdaptiveTimeoutScenario: %s: slow request: %s after %.3fs; %s",
+                            entry, outcome, elapsed, estimate)
+                # The timeout and the successful retry are both observed
+                passed = (passed and outcome == 200 and FLOOR <= elapsed < SLOW_DELAY / 2
+                          and estimate is not None and estimate.samples == MIN_SAMPLES + 2)
+                record_result(test_results, passed, entry=f"AdaptiveTimeoutScenario {entry}",
+                              args=rr_args, proto="http")
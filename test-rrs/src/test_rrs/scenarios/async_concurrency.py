@@ -0,0 +1,93 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Many concurrent requests on a single event loop, using an AsyncRetrySession
+"""
+
+import asyncio
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List
+
+import requests_retry_session as rrs
+from requests_retry_session.async_retry_session import async_retry_session_manager
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+
+from .load import ok_params
+from .pool_load import LOAD_TIMEOUT
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_REQUESTS = 200
+REQUEST_DELAY = 0.1
+
+
+async def _concurrent_gets(url: str, rr_args: rrs.RequestsRetryAdapterArgs) -> List[int]:
+    """
+    Make NUM_REQUESTS concurrent GET requests, and return their status codes
+    """
+    params = ok_params(REQUEST_DELAY)._asdict()
+    async with async_retry_session_manager(protocol="http", **rr_args) as session:
+        async def _get() -> int:
+            async with await session.get(url, params=params) as resp:
+                await resp.read()
+                return resp.status
+        return await asyncio.gather(*(_get() for _ in range(NUM_REQUESTS)))
+
+
+class AsyncConcurrencyScenario(metaclass=ScenarioMeta):
+    """
+    Make many concurrent requests from one thread, and verify that they overlap,
+    rather than running one at a time
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("AsyncConcurrencyScenario: run()")
+        rr_args = rr_adapter_args()
+        rr_args["connect_timeout"] = LOAD_TIMEOUT
+        rr_args["read_timeout"] = LOAD_TIMEOUT
+        with background_server("http", concurrent=True) as url:
+            start = time.monotonic()
+            loop = asyncio.new_event_loop()
+            try:
+                status_codes = loop.run_until_complete(_concurrent_gets(url, rr_args))
+            finally:
+                loop.close()
+            elapsed = time.monotonic() - start
+        serial_time = NUM_REQUESTS * REQUEST_DELAY
+        logging.log(NOTICE, "AsyncConcurrencyScenario: %d requests in %.2fs (%.2fs if made serially)",
+                    NUM_REQUESTS, elapsed, serial_time)
+        passed = status_codes == [200] * NUM_REQUESTS and elapsed < serial_time / 4
+        record_result(test_results, passed, entry="AsyncConcurrencyScenario", args=rr_args, proto="http")
@@ -0,0 +1,83 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Adapter arguments which async sessions do not support
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Dict, Union
+
+import requests_retry_session as rrs
+from requests_retry_session.async_retry_session import AsyncRetrySession
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+
+from .scenario_base import ScenarioMeta, record_result
+
+
+def _unsupported_args() -> Dict[str, rrs.RequestsRetryAdapterArgs]:
+    """
+    Returns the unsupported arguments to try, each named by the argument (or setting) that is
+    not supported
+    """
+    return {
+        "cache": {"cache": rrs.ResponseCache()},
+        "single_flight": {"single_flight": rrs.SingleFlight()},
+        "bulkhead": {"bulkhead": rrs.Bulkhead()},
+        "pool_connections": {"pool_connections": 1},
+        "connection_lifetime max_lifetime": {"connection_lifetime": rrs.ConnectionLifetimePolicy(max_lifetime=60)},
+        "connection_lifetime reap_interval": {
+            "connection_lifetime": rrs.ConnectionLifetimePolicy(max_idle=60, reap_interval=1)},
+    }
+
+
+class AsyncUnsupportedArgsScenario(metaclass=ScenarioMeta):
+    """
+    Create async sessions with adapter arguments that they do not support, and verify that
+    ValueError is raised, rather than the arguments being silently ignored
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("AsyncUnsupportedArgsScenario: run()")
+        for case, unsupported_args in _unsupported_args().items():
+            rr_args = rr_adapter_args()
+            rr_args.update(unsupported_args)
+            outcome: Union[str, None] = None
+            try:
+                AsyncRetrySession(protocol="http", **rr_args)
+            except ValueError as err:
+                outcome = str(err)
+            logging.log(NOTICE, "AsyncUnsupportedArgsScenario: %s: %s", case, outcome)
+            passed = outcome is not None and outcome.startswith(f"{case} is not supported")
+            record_result(test_results, passed, entry=f"AsyncUnsupportedArgsScenario {case}", args=rr_args,
+                          proto="http")
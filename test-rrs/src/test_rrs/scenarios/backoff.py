@@ -0,0 +1,107 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Backoff strategies, made repeatable with a seed
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List, Tuple
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server
+from test_rrs.utils import random_id, LogCounter
+
+from .load import timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_RETRIES = 5
+BACKOFF_FACTOR = 0.01
+BACKOFF_MAX = 0.05
+SEED = 12345
+STRATEGIES: Tuple[rrs.BackoffStrategyType, ...] = (
+    "exponential", "full_jitter", "equal_jitter", "decorrelated_jitter")
+# The urllib3 backoffs for the above settings
+EXPONENTIAL_BACKOFFS = [0.0, 0.02, 0.04, BACKOFF_MAX, BACKOFF_MAX]
+
+RETRY_LOGGER = "requests_retry_session.retry_with_logs"
+BACKOFF_TEXT = "Backing off"
+
+
+def _backoffs(entry: str, url: str, rr_args: rrs.RequestsRetryAdapterArgs) -> Tuple[List[float], float]:
+    """
+    Make a request (in a new session) which fails until its retries are exhausted,
+    and return the backoffs that were logged, and how long the request took
+    """
+    params = ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1),
+                       scs=(RR_STATUS_FORCELIST[0],) * (NUM_RETRIES + 1))
+    with LogCounter(RETRY_LOGGER, BACKOFF_TEXT) as logged:
+        outcome, elapsed = timed_get(entry, url, rr_args, params)
+    assert outcome == "RetryError", outcome
+    # The messages look like: Backing off 0.020s before reattempting ...
+    return [float(msg.split()[2].rstrip("s")) for msg in logged.messages], elapsed
+
+
+class BackoffScenario(metaclass=ScenarioMeta):
+    """
+    For each backoff strategy, verify that the backoffs are capped, that they are
+    repeatable with the same seed, and that the jittered ones vary with the seed
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("BackoffScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                for strategy in STRATEGIES:
+                    rr_args = rr_adapter_args()
+                    rr_args["retries"] = NUM_RETRIES
+                    rr_args["backoff_factor"] = BACKOFF_FACTOR
+                    rr_args["backoff_max"] = BACKOFF_MAX
+                    rr_args["backoff_strategy"] = strategy
+                    rr_args["backoff_seed"] = SEED
+                    first, elapsed = _backoffs(entry, url, rr_args)
+                    second, _ = _backoffs(entry, url, rr_args)
+                    rr_args["backoff_seed"] = SEED + 1
+                    reseeded, _ = _backoffs(entry, url, rr_args)
+                    logging.log(NOTICE, "BackoffScenario: %s %s: %s (%.3fs) / %s / %s",
+                                entry, strategy, first, elapsed, second, reseeded)
+                    passed = len(first) == NUM_RETRIES and first == second and \
+                        all(0 <= backoff <= BACKOFF_MAX for backoff in first) and elapsed >= sum(first)
+                    if strategy == "exponential":
+                        passed = passed and first == EXPONENTIAL_BACKOFFS == reseeded
+                    else:
+                        passed = passed and first not in (EXPONENTIAL_BACKOFFS, reseeded)
+                    record_result(test_results, passed, entry=f"BackoffScenario {entry} {strategy}",
+                                  args=rr_args, proto="http")
@@ -0,0 +1,120 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Limiting the number of concurrent requests to a host with a (fixed or adaptive) Bulkhead
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server
+from test_rrs.utils import random_id
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+ENTRY = "rrs.requests_retry_session"
+MAX_CONCURRENT = 2
+NUM_REQUESTS = 6
+# How long the server takes to answer each of the concurrent requests
+SLOW_DELAY = 0.2
+# The read timeout has to allow for the slow requests
+READ_TIMEOUT = 1.0
+# A request failing fast should take less than this many seconds
+FAIL_FAST_TIME = 0.05
+
+
+class BulkheadScenario(metaclass=ScenarioMeta):
+    """
+    Make concurrent slow requests (in new sessions, sharing one bulkhead), and verify that only
+    MAX_CONCURRENT of them were made at a time, with the others waiting their turn. Then verify
+    that with a max_wait of 0, a request which would have to wait fails fast with BulkheadFull.
+    Finally, verify that the limit of an adaptive bulkhead is cut by the retryable responses of
+    a request, and raised again by successful requests.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("BulkheadScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            bulkhead = rrs.Bulkhead(MAX_CONCURRENT)
+            rr_args = rr_adapter_args()
+            rr_args["read_timeout"] = READ_TIMEOUT
+            rr_args["bulkhead"] = bulkhead
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=NUM_REQUESTS) as executor:
+                futures = [executor.submit(timed_get, ENTRY, url, rr_args, ok_params(SLOW_DELAY))
+                           for _ in range(NUM_REQUESTS)]
+                outcomes = [future.result()[0] for future in futures]
+            elapsed = time.monotonic() - start
+            stats = bulkhead.stats()
+            logging.log(NOTICE, "BulkheadScenario: %s: %s after %.3fs; %s", bulkhead, outcomes, elapsed, stats)
+            rounds = NUM_REQUESTS // MAX_CONCURRENT
+            passed = outcomes == [200] * NUM_REQUESTS and elapsed >= rounds * SLOW_DELAY * 0.9
+            passed = passed and stats.admitted == NUM_REQUESTS and stats.rejected == 0
+            passed = passed and stats.queued == NUM_REQUESTS - MAX_CONCURRENT and stats.longest_wait > 0
+            passed = passed and all(host.in_flight == 0 for host in bulkhead.snapshot().values())
+            record_result(test_results, passed, entry="BulkheadScenario", args=rr_args, proto="http")
+
+            bulkhead = rrs.Bulkhead(1, max_wait=0)
+            rr_args = rr_adapter_args()
+            rr_args["read_timeout"] = READ_TIMEOUT
+            rr_args["bulkhead"] = bulkhead
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                slow = executor.submit(timed_get, ENTRY, url, rr_args, ok_params(SLOW_DELAY))
+                while not any(host.in_flight for host in bulkhead.snapshot().values()):
+                    time.sleep(0.01)
+                second, elapsed = timed_get(ENTRY, url, rr_args, ok_params())
+                first = slow.result()[0]
+            stats = bulkhead.stats()
+            logging.log(NOTICE, "BulkheadScenario: %s: %s, and %s after %.3fs; %s",
+                        bulkhead, first, second, elapsed, stats)
+            passed = first == 200 and second == "BulkheadFull" and elapsed < FAIL_FAST_TIME
+            passed = passed and stats.admitted == 1 and stats.rejected == 1
+            record_result(test_results, passed, entry="BulkheadScenario max_wait=0", args=rr_args, proto="http")
+
+            bulkhead = rrs.Bulkhead(4, adaptive=True)
+            rr_args = rr_adapter_args()
+            rr_args["bulkhead"] = bulkhead
+            sc = RR_STATUS_FORCELIST[0]
+            retried = ReqParams(id=random_id(), delays=(0, 0, 0), scs=(sc, sc, 200))
+            outcome, _ = timed_get(ENTRY, url, rr_args, retried)
+            # Two retryable responses cut the limit from 4 to 1, and the success raised it to 2
+            limits = [limit for limit, _, _ in bulkhead.snapshot().values()]
+            for _ in range(3):
+                timed_get(ENTRY, url, rr_args, ok_params())
+            # Then 2 + 1/2 + 1/2.5 + 1/2.9 raised it to 3
+            limits.extend(limit for limit, _, _ in bulkhead.snapshot().values())
+            logging.log(NOTICE, "BulkheadScenario: %s: %s, with limits %s", bulkhead, outcome, limits)
+            passed = outcome == 200 and limits == [2, 3]
+            record_result(test_results, passed, entry="BulkheadScenario adaptive", args=rr_args, proto="http")
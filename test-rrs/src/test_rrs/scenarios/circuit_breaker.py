@@ -0,0 +1,93 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Failing fast through a shared per-host circuit breaker
+"""
+
+import logging
+import time
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server
+from test_rrs.utils import random_id
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+FAILURE_THRESHOLD = 3
+RECOVERY_TIMEOUT = 0.5
+# Without the breaker, a request to a failing endpoint would make this many retries
+NUM_RETRIES = 10
+# A request failing fast should take less than this many seconds
+FAIL_FAST_TIME = 0.05
+
+
+class CircuitBreakerScenario(metaclass=ScenarioMeta):
+    """
+    Verify that a circuit breaker shared between sessions opens after repeated failures
+    (cutting the retries short), fails fast while open, and closes after a successful
+    trial request once the recovery timeout has passed
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("CircuitBreakerScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                breaker = rrs.CircuitBreaker(failure_threshold=FAILURE_THRESHOLD,
+                                             recovery_timeout=RECOVERY_TIMEOUT)
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = NUM_RETRIES
+                rr_args["circuit_breaker"] = breaker
+                failing = ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1),
+                                    scs=(RR_STATUS_FORCELIST[0],) * (NUM_RETRIES + 1))
+
+                outcome, elapsed = timed_get(entry, url, rr_args, failing)
+                status = breaker.snapshot()
+                logging.log(NOTICE, "CircuitBreakerScenario: %s: failing endpoint: %s after %.3fs; %s",
+                            entry, outcome, elapsed, status)
+                passed = outcome == "CircuitOpen" and breaker.state(url) == "open" and \
+                    [s.failures for s in status.values()] == [FAILURE_THRESHOLD]
+
+                # While open, even a healthy endpoint on the same host should fail fast
+                outcome, elapsed = timed_get(entry, url, rr_args, ok_params())
+                logging.log(NOTICE, "CircuitBreakerScenario: %s: open circuit: %s after %.3fs",
+                            entry, outcome, elapsed)
+                passed = passed and outcome == "CircuitOpen" and elapsed < FAIL_FAST_TIME
+
+                time.sleep(RECOVERY_TIMEOUT)
+                outcome, elapsed = timed_get(entry, url, rr_args, ok_params())
+                logging.log(NOTICE, "CircuitBreakerScenario: %s: after recovery timeout: %s after %.3fs",
+                            entry, outcome, elapsed)
+                passed = passed and outcome == 200 and breaker.state(url) == "closed" and not breaker.snapshot()
+                record_result(test_results, passed, entry=f"CircuitBreakerScenario {entry}",
+                              args=rr_args, proto="http")
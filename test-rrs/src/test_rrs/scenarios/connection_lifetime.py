@@ -0,0 +1,105 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Closing idle and expired pooled connections with ConnectionLifetimePolicy
+"""
+
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List, Tuple
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+
+from .load import ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+EXPIRY = 0.2
+REAP_INTERVAL = 0.05
+
+
+def _get_twice(url: str, policy: rrs.ConnectionLifetimePolicy) -> Tuple[List[int], rrs.ConnectionPoolStats]:
+    """
+    Make a request, wait until its connection has expired (or been reaped) according to the
+    policy, and make another request in the same session. Return their status codes, and the
+    policy stats from in between them.
+    """
+    rr_args = rr_adapter_args()
+    rr_args["connection_lifetime"] = policy
+    with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+        with session.get(url, params=ok_params()._asdict()) as resp:
+            first = resp.status_code
+        time.sleep(EXPIRY * 2)
+        stats = policy.stats()
+        with session.get(url, params=ok_params()._asdict()) as resp:
+            second = resp.status_code
+    return [first, second], stats
+
+
+class ConnectionLifetimeScenario(metaclass=ScenarioMeta):
+    """
+    Make requests through a session with a connection lifetime policy, waiting between them for
+    long enough that the connection of the first request expires, and verify that it is closed
+    when the second request takes it from its pool (for a max_lifetime policy and a max_idle
+    policy), or (for a max_idle policy with a reap_interval) that it is closed before that, by
+    the reaper thread.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("ConnectionLifetimeScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            cases = [
+                (rrs.ConnectionLifetimePolicy(max_lifetime=EXPIRY),
+                 rrs.ConnectionPoolStats(pools=1, idle_connections=1, reaped_idle=0, reaped_expired=0),
+                 rrs.ConnectionPoolStats(pools=1, idle_connections=1, reaped_idle=0, reaped_expired=1)),
+                (rrs.ConnectionLifetimePolicy(max_idle=EXPIRY),
+                 rrs.ConnectionPoolStats(pools=1, idle_connections=1, reaped_idle=0, reaped_expired=0),
+                 rrs.ConnectionPoolStats(pools=1, idle_connections=1, reaped_idle=1, reaped_expired=0)),
+                (rrs.ConnectionLifetimePolicy(max_idle=EXPIRY, reap_interval=REAP_INTERVAL),
+                 rrs.ConnectionPoolStats(pools=1, idle_connections=0, reaped_idle=1, reaped_expired=0),
+                 rrs.ConnectionPoolStats(pools=1, idle_connections=1, reaped_idle=1, reaped_expired=0)),
+            ]
+            for policy, expected_between, expected_after in cases:
+                statuses, stats_between = _get_twice(url, policy)
+                stats_after = policy.stats()
+                policy.close()
+                logging.log(NOTICE, "ConnectionLifetimeScenario: %s: %s; between requests: %s; after: %s",
+                            policy, statuses, stats_between, stats_after)
+                passed = statuses == [200, 200] and stats_between == expected_between
+                # The session has been closed, and its pools with it
+                passed = passed and stats_after == expected_after._replace(pools=0, idle_connections=0)
+                record_result(test_results, passed, entry=f"ConnectionLifetimeScenario {policy}",
+                              args={"connection_lifetime": policy}, proto="http")
@@ -0,0 +1,154 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Overall request deadlines, spanning all attempts and backoff sleeps
+"""
+
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Union,
+)
+
+import requests
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, AsyncSessionBridge, RR_STATUS_FORCELIST
+from test_rrs.server import background_server
+from test_rrs.utils import random_id, LogCounter
+
+from .load import ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+# The overall deadline used by the scenario, in seconds
+TOTAL_TIMEOUT = 0.5
+# How much later than the deadline a request may fail
+DEADLINE_SLACK = 0.3
+# Without a deadline, these would take much longer than TOTAL_TIMEOUT
+NUM_RETRIES = 10
+BACKOFF_FACTOR = 0.1
+SLOW_DELAY = 3.0
+
+RETRY_LOGGER = "requests_retry_session.retry_with_logs"
+CUT_SHORT_TEXT = "was cut short by its"
+OVERRUN_TEXT = "would overrun its"
+
+
+class _DeadlineCase(NamedTuple):
+    """
+    name: Describes the case in the log
+    adapter_total: The total_timeout adapter argument
+    request_total: If not None, the total of the TotalTimeout passed with the request
+    params: The request parameters
+    log_text: The text logged by RetryWithLogs, if the deadline should be exceeded
+    """
+    name: str
+    adapter_total: Union[float, None]
+    request_total: Union[float, None]
+    params: ReqParams
+    log_text: Union[str, None]
+
+
+def _cases() -> List[_DeadlineCase]:
+    """
+    Return the cases to test (each needs its own request IDs)
+    """
+    always_retry = ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1),
+                             scs=(RR_STATUS_FORCELIST[0],) * (NUM_RETRIES + 1))
+    slow = ReqParams(id=random_id(), delays=(SLOW_DELAY,), scs=(200,))
+    return [
+        _DeadlineCase("backoff overrun", TOTAL_TIMEOUT, None, always_retry, OVERRUN_TEXT),
+        _DeadlineCase("attempt cut short", None, TOTAL_TIMEOUT, slow, CUT_SHORT_TEXT),
+        _DeadlineCase("request override", 10 * SLOW_DELAY, TOTAL_TIMEOUT,
+                      slow._replace(id=random_id()), CUT_SHORT_TEXT),
+        _DeadlineCase("within deadline", TOTAL_TIMEOUT, None, ok_params(), None),
+    ]
+
+
+class DeadlineScenario(metaclass=ScenarioMeta):
+    """
+    Verify that requests fail with DeadlineExceeded once their overall deadline has passed
+    (with RetryWithLogs reporting why), and succeed normally within it
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("DeadlineScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                for case in _cases():
+                    rr_args = rr_adapter_args()
+                    rr_args["retries"] = NUM_RETRIES
+                    rr_args["backoff_factor"] = BACKOFF_FACTOR
+                    rr_args["read_timeout"] = 2 * SLOW_DELAY
+                    rr_args["total_timeout"] = case.adapter_total
+                    passed = cls._run_case(entry, url, rr_args, case)
+                    record_result(test_results, passed, entry=f"DeadlineScenario {entry} {case.name}",
+                                  args=rr_args, proto="http")
+
+    @classmethod
+    def _run_case(cls, entry: str, url: str, rr_args: rrs.RequestsRetryAdapterArgs,
+                  case: _DeadlineCase) -> bool:
+        """
+        Make the request for a single case, and return True if it behaved as expected
+        """
+        kwargs: Dict[str, Any] = {"params": case.params._asdict()}
+        if case.request_total is not None:
+            kwargs["timeout"] = rrs.TotalTimeout(case.request_total)
+        outcome: Union[int, str]
+        with LogCounter(RETRY_LOGGER, case.log_text or CUT_SHORT_TEXT) as logged:
+            start = time.monotonic()
+            try:
+                if entry == "rrs.AsyncRetrySession":
+                    with AsyncSessionBridge("http", rr_args) as bridge:
+                        with bridge.get(url, **kwargs) as bridge_resp:
+                            outcome = bridge_resp.status_code
+                else:
+                    with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                        with session.get(url, **kwargs) as resp:
+                            outcome = resp.status_code
+            except requests.RequestException as err:
+                outcome = type(err).__name__
+            elapsed = time.monotonic() - start
+        logging.log(NOTICE, "DeadlineScenario: %s %s: %s after %.3fs (%d deadline log messages)",
+                    entry, case.name, outcome, elapsed, logged.count)
+        if case.log_text is None:
+            return outcome == 200 and logged.count == 0
+        total = case.request_total if case.request_total is not None else case.adapter_total
+        assert total is not None
+        return outcome == "DeadlineExceeded" and elapsed < total + DEADLINE_SLACK and logged.count == 1
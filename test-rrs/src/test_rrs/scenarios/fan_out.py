@@ -0,0 +1,184 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Concurrent fan-out of a batch of requests over one retry session
+"""
+
+import logging
+import threading
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Any, List, Set
+
+import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RetryError as RequestsRetryError
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import RR_STATUS_FORCELIST, rr_adapter_args
+from test_rrs.server import background_server, DROP_SC
+from test_rrs.utils import random_id
+
+from .load import ok_params
+from .pool_load import LOAD_TIMEOUT
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_REQUESTS = 60
+REQUEST_DELAY = 0.05
+MAX_WORKERS = 20
+# Every FAILURE_INTERVAL-th request fails (alternating between exhausting its
+# retries and having its connection dropped)
+FAILURE_INTERVAL = 10
+# How long the first request of the batch whose outcomes are held for ordering takes
+HEAD_DELAY = 0.5
+BOUNDED_WORKERS = 4
+
+
+def batch_specs(url: str) -> List[rrs.RequestSpec]:
+    """
+    Return the batch of requests to make
+    """
+    specs: List[rrs.RequestSpec] = []
+    for i in range(NUM_REQUESTS):
+        if i % FAILURE_INTERVAL == 0:
+            sc = RR_STATUS_FORCELIST[0] if i % (2 * FAILURE_INTERVAL) == 0 else DROP_SC
+            params = ReqParams(id=random_id(), delays=(0,), scs=(sc,))
+        else:
+            params = ok_params(REQUEST_DELAY)
+        specs.append(rrs.RequestSpec("GET", url, {"params": params._asdict()}))
+    return specs
+
+
+def outcomes_ok(outcomes: List[rrs.RequestOutcome], ordered: bool) -> bool:
+    """
+    Verify that every request has exactly one outcome, that the failing requests
+    failed with the expected exceptions, and that the others succeeded
+    """
+    positions = [outcome.position for outcome in outcomes]
+    if sorted(positions) != list(range(NUM_REQUESTS)):
+        return False
+    if ordered and positions != list(range(NUM_REQUESTS)):
+        return False
+    for outcome in outcomes:
+        if outcome.position % FAILURE_INTERVAL != 0:
+            if outcome.response is None or outcome.response.status_code != 200:
+                return False
+            continue
+        expected_error = (RequestsRetryError if outcome.position % (2 * FAILURE_INTERVAL) == 0
+                          else RequestsConnectionError)
+        if not isinstance(outcome.error, expected_error):
+            return False
+    return True
+
+
+class _HeldResponses:
+    """
+    Counts the responses which have arrived (using a response hook), but have not been yielded,
+    and records the adapters which sent them
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.arrived = 0
+        self.yielded = 0
+        self.max_held = 0
+        self.adapter_ids: Set[int] = set()
+
+    def hook(self, response: requests.Response, *_args: Any, **_kwargs: Any) -> requests.Response:
+        """
+        Response hook, which counts the response as arrived
+        """
+        with self._lock:
+            self.arrived += 1
+            self.max_held = max(self.max_held, self.arrived - self.yielded)
+            self.adapter_ids.add(id(getattr(response, "connection", None)))
+        return response
+
+    def yielded_one(self) -> None:
+        """
+        Count a yielded outcome
+        """
+        with self._lock:
+            self.yielded += 1
+
+
+def _bounded_ordered_batch(url: str, rr_args: rrs.RequestsRetryAdapterArgs) -> bool:
+    """
+    Map a batch whose first request is slow in input order, with few workers, and verify that
+    no more responses than there are workers were held at once, waiting for the first one.
+    Also verify that the workers, which each have their own session, all used the adapter of
+    the manager's session.
+    """
+    specs = [rrs.RequestSpec("GET", url, {"params": ok_params(HEAD_DELAY if i == 0 else 0)._asdict()})
+             for i in range(NUM_REQUESTS)]
+    held = _HeldResponses()
+    with rrs.RetrySessionManager(protocol="http", **rr_args) as mgr:
+        mgr.requests_session.hooks["response"].append(held.hook)
+        adapter_id = id(mgr.requests_session.get_adapter(url))
+        positions: List[int] = []
+        for outcome in mgr.map_requests(specs, max_workers=BOUNDED_WORKERS, ordered=True):
+            held.yielded_one()
+            positions.append(outcome.position)
+            if outcome.response is not None:
+                outcome.response.close()
+    logging.log(NOTICE, "FanOutScenario: bounded ordered batch: at most %d responses held", held.max_held)
+    return (positions == list(range(NUM_REQUESTS)) and held.max_held <= BOUNDED_WORKERS
+            and held.adapter_ids == {adapter_id})
+
+
+class FanOutScenario(metaclass=ScenarioMeta):
+    """
+    Map a batch of requests (some of which fail) over a retry session, in both
+    completion and input order, and verify that failures are isolated and that
+    the requests ran in parallel. Then verify that in input order, a slow request does not
+    cause an unbounded number of later responses to be held until it completes.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("FanOutScenario: run()")
+        rr_args = rr_adapter_args()
+        rr_args["read_timeout"] = LOAD_TIMEOUT
+        rr_args["pool_maxsize"] = MAX_WORKERS
+        serial_time = NUM_REQUESTS * REQUEST_DELAY
+        with background_server("http", concurrent=True) as url:
+            for ordered in (False, True):
+                with rrs.RetrySessionManager(protocol="http", **rr_args) as mgr:
+                    start = time.monotonic()
+                    outcomes = list(mgr.map_requests(batch_specs(url), ordered=ordered))
+                    elapsed = time.monotonic() - start
+                logging.log(NOTICE, "FanOutScenario: ordered=%s: %d requests in %.2fs (%.2fs if made serially)",
+                            ordered, len(outcomes), elapsed, serial_time)
+                passed = outcomes_ok(outcomes, ordered) and elapsed < serial_time / 2
+                record_result(test_results, passed, entry=f"FanOutScenario ordered={ordered}",
+                              args=rr_args, proto="http")
+            record_result(test_results, _bounded_ordered_batch(url, rr_args), entry="FanOutScenario bounded ordered",
+                          args=rr_args, proto="http")
@@ -0,0 +1,152 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Hedging slow requests with HedgingPolicy
+"""
+
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List
+
+import requests_retry_session as rrs
+from requests_retry_session.utils import host_key
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+from test_rrs.utils import random_id
+
+from .load import timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+HEDGE_DELAY = 0.1
+# How long the server takes to answer the first attempt of each request
+SLOW_DELAY = 1.0
+# The read timeout for the losing attempts, which would time out (and be retried) after this long
+# if they were not cancelled
+LOSER_READ_TIMEOUT = 0.3
+# How long to wait for a cancelled attempt to stop
+CANCELLED_STOP_WAIT = 0.2
+
+
+def _slow_params() -> ReqParams:
+    """
+    Return request parameters for a request whose first attempt is slow to be answered,
+    and whose later attempts are answered immediately
+    """
+    return ReqParams(id=random_id(), delays=(SLOW_DELAY, 0), scs=(200, 200))
+
+
+class HedgingScenario(metaclass=ScenarioMeta):
+    """
+    Make requests whose first attempts are slow, with a hedging policy whose budget allows one
+    hedge, and verify that the first is answered by its hedge, and the second (which the budget
+    does not allow to be hedged) is answered by its first attempt
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("HedgingScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                budget = rrs.RetryBudget(max_tokens=1, retry_ratio=0.1)
+                rr_args = rr_adapter_args()
+                rr_args["read_timeout"] = SLOW_DELAY * 2
+                rr_args["hedging"] = rrs.HedgingPolicy(delay=HEDGE_DELAY, budget=budget)
+                outcome, elapsed = timed_get(entry, url, rr_args, _slow_params())
+                logging.log(NOTICE, "HedgingScenario: %s: hedged request: %s after %.3fs", entry, outcome, elapsed)
+                passed = outcome == 200 and HEDGE_DELAY <= elapsed < SLOW_DELAY / 2
+                outcome, elapsed = timed_get(entry, url, rr_args, _slow_params())
+                stats = budget.stats()
+                logging.log(NOTICE, "HedgingScenario: %s: unhedged request: %s after %.3fs; %s",
+                            entry, outcome, elapsed, stats)
+                passed = (passed and outcome == 200 and elapsed >= SLOW_DELAY
+                          and stats.retries == 1 and stats.denied == 1)
+                record_result(test_results, passed, entry=f"HedgingScenario {entry}", args=rr_args, proto="http")
+
+
+class HedgeCancellationScenario(metaclass=ScenarioMeta):
+    """
+    Make a request whose first attempt is slow (slower than the read timeout), with a hedging
+    policy, and verify that it is answered by its hedge, and that the first attempt is cancelled
+    rather than left to time out and be retried in the background: no retry events are reported,
+    even after its read timeout has passed.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("HedgeCancellationScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            entry = "rrs.requests_retry_session"
+            events: List[rrs.RetryEvent] = []
+            rr_args = rr_adapter_args()
+            rr_args["read_timeout"] = LOSER_READ_TIMEOUT
+            rr_args["hedging"] = rrs.HedgingPolicy(delay=HEDGE_DELAY)
+            rr_args["event_hooks"] = [events.append]
+            outcome, elapsed = timed_get(entry, url, rr_args, _slow_params())
+            # Give the losing attempt time to time out and be retried, if it was not cancelled
+            time.sleep(LOSER_READ_TIMEOUT * 2)
+            kinds = [event.kind for event in events]
+            logging.log(NOTICE, "HedgeCancellationScenario: %s after %.3fs; events: %s", outcome, elapsed, kinds)
+            passed = outcome == 200 and elapsed < LOSER_READ_TIMEOUT and not kinds
+            record_result(test_results, passed, entry=f"HedgeCancellationScenario {entry}", args=rr_args, proto="http")
+
+
+class HedgeLatencyScenario(metaclass=ScenarioMeta):
+    """
+    Make a request whose first attempt is slow, with a hedging policy whose delay adapts to the
+    latencies of the host, and verify that the latency recorded when its hedge wins is that of the
+    first attempt (how long it ran until it was cancelled), so that the hedge delay does not drop
+    below the delay after which the request was hedged.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("HedgeLatencyScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                hedging = rrs.HedgingPolicy(initial_delay=HEDGE_DELAY, min_samples=1)
+                rr_args = rr_adapter_args()
+                rr_args["read_timeout"] = SLOW_DELAY * 2
+                rr_args["hedging"] = hedging
+                outcome, elapsed = timed_get(entry, url, rr_args, _slow_params())
+                # The latency of the first attempt is recorded once it has stopped
+                time.sleep(CANCELLED_STOP_WAIT)
+                hedge_delay = hedging.hedge_delay(host_key(url))
+                logging.log(NOTICE, "HedgeLatencyScenario: %s: %s after %.3fs; hedge delay %.3fs",
+                            entry, outcome, elapsed, hedge_delay)
+                passed = outcome == 200 and elapsed < SLOW_DELAY / 2 and hedge_delay >= HEDGE_DELAY
+                record_result(test_results, passed, entry=f"HedgeLatencyScenario {entry}", args=rr_args, proto="http")
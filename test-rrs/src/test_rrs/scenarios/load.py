@@ -0,0 +1,135 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Helpers for generating concurrent load in scenarios
+"""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import (
+    Counter as CounterType,
+    NamedTuple,
+    Tuple,
+    Union,
+)
+
+import requests
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import ReqParams
+from test_rrs.rrs_lib import AsyncSessionBridge
+from test_rrs.utils import random_id, suppress_ssl_warnings
+
+
+class LoadResults(NamedTuple):
+    """
+    elapsed: Wall clock time taken by the whole load, in seconds
+    outcomes: How many times each status code (or exception type name) was seen
+    """
+    elapsed: float
+    outcomes: "CounterType[Union[int, str]]"
+
+    @property
+    def total(self) -> int:
+        """ Total number of requests made """
+        return sum(self.outcomes.values())
+
+    @property
+    def throughput(self) -> float:
+        """ Requests per second """
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+
+def ok_params(delay: float = 0) -> ReqParams:
+    """
+    Return request parameters for an endpoint which always returns 200,
+    after the specified delay
+    """
+    return ReqParams(id=random_id(), delays=(delay,), scs=(200,))
+
+
+def concurrent_gets(
+    session: requests.Session,
+    url: str,
+    *,
+    params: ReqParams,
+    workers: int,
+    requests_per_worker: int,
+) -> LoadResults:
+    """
+    Make requests_per_worker GET requests in each of the specified number of
+    worker threads, all using the same session
+    """
+    def _worker() -> "CounterType[Union[int, str]]":
+        outcomes: "CounterType[Union[int, str]]" = Counter()
+        for _ in range(requests_per_worker):
+            try:
+                with session.get(url, params=params._asdict(), verify=False) as resp:
+                    outcomes[resp.status_code] += 1
+            except requests.RequestException as err:
+                outcomes[type(err).__name__] += 1
+        return outcomes
+
+    outcomes: "CounterType[Union[int, str]]" = Counter()
+    with suppress_ssl_warnings():
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_worker) for _ in range(workers)]
+            for future in futures:
+                outcomes.update(future.result())
+        elapsed = time.monotonic() - start
+    return LoadResults(elapsed=elapsed, outcomes=outcomes)
+
+
+def timed_get(
+    entry: str,
+    url: str,
+    rr_args: rrs.RequestsRetryAdapterArgs,
+    params: ReqParams,
+) -> Tuple[Union[int, str], float]:
+    """
+    Make a GET request in a new HTTP session (an AsyncRetrySession if entry is
+    "rrs.AsyncRetrySession", otherwise a requests_retry_session), and return its
+    status code (or exception type name) and how long it took
+    """
+    outcome: Union[int, str]
+    start = time.monotonic()
+    try:
+        if entry == "rrs.AsyncRetrySession":
+            with AsyncSessionBridge("http", rr_args) as bridge:
+                with bridge.get(url, params=params._asdict()) as bridge_resp:
+                    outcome = bridge_resp.status_code
+        else:
+            with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                with session.get(url, params=params._asdict()) as resp:
+                    outcome = resp.status_code
+    except requests.RequestException as err:
+        outcome = type(err).__name__
+    return outcome, time.monotonic() - start
@@ -0,0 +1,102 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Counting and timing requests and their retries with RetryMetrics
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List, Tuple, Union
+
+import requests_retry_session as rrs
+from requests_retry_session.utils import host_key
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST, RR_TIMEOUT
+from test_rrs.server import background_server, DROP_SC
+from test_rrs.utils import random_id
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_RETRIES = 2
+
+
+def _steps() -> List[Tuple[str, ReqParams, Union[int, str]]]:
+    """
+    Return the names, request parameters, and expected outcomes of the requests to make
+    """
+    sc = RR_STATUS_FORCELIST[0]
+    return [
+        ("successful request", ok_params(), 200),
+        ("retried status codes", ReqParams(id=random_id(), delays=(0, 0, 0), scs=(sc, sc, 200)), 200),
+        ("dropped connection", ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1),
+                                         scs=(DROP_SC,) * (NUM_RETRIES + 1)), "ConnectionError"),
+        ("read timeout", ReqParams(id=random_id(), delays=(RR_TIMEOUT * 4, 0), scs=(200, 200)), 200),
+    ]
+
+
+class MetricsScenario(metaclass=ScenarioMeta):
+    """
+    Make a successful request, a request which succeeds after retrying bad status codes,
+    a request whose connection is always dropped, and a request which succeeds after
+    timing out, all sharing one RetryMetrics object, and verify its counters and histograms
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("MetricsScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                metrics = rrs.RetryMetrics()
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = NUM_RETRIES
+                rr_args["metrics"] = metrics
+                steps = _steps()
+                passed = True
+                for name, params, expected in steps:
+                    outcome, elapsed = timed_get(entry, url, rr_args, params)
+                    logging.log(NOTICE, "MetricsScenario: %s: %s: %s after %.3fs", entry, name, outcome, elapsed)
+                    passed = passed and outcome == expected
+                snapshot = metrics.snapshot()
+                logging.log(NOTICE, "MetricsScenario: %s: %s", entry, snapshot)
+                endpoint = snapshot.get((host_key(url), "GET"))
+                if endpoint is None or len(snapshot) != 1:
+                    passed = False
+                else:
+                    num_attempts = 1 + 3 + (NUM_RETRIES + 1) + 2
+                    passed = (passed and endpoint.requests == len(steps) and endpoint.attempts == num_attempts
+                              and endpoint.retries == {str(RR_STATUS_FORCELIST[0]): 2, "read": NUM_RETRIES + 1}
+                              and endpoint.exhausted == 1 and endpoint.timeouts == 1
+                              and endpoint.attempt_latency.samples == num_attempts
+                              and endpoint.request_latency.samples == len(steps)
+                              and endpoint.attempt_latency.quantile(1.0) >= RR_TIMEOUT)
+                record_result(test_results, passed, entry=f"MetricsScenario {entry}", args=rr_args, proto="http")
@@ -0,0 +1,106 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Connection pool sizing under concurrent load
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List
+
+from requests.adapters import DEFAULT_POOLSIZE
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+from test_rrs.utils import LogCounter
+
+from .load import concurrent_gets, ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+# More worker threads than the default pool size of 10
+LOAD_WORKERS = 20
+LOAD_REQUESTS_PER_WORKER = 10
+LOAD_DELAY = 0.01
+# Under load, the test server needs more time than our usual test timeout
+LOAD_TIMEOUT = 5.0
+
+URLLIB3_POOL_LOGGER = "urllib3.connectionpool"
+NEW_CONNECTION_TEXT = "Starting new HTTP"
+POOL_FULL_TEXT = "Connection pool is full"
+
+
+def load_adapter_args() -> List[rrs.RequestsRetryAdapterArgs]:
+    """
+    The adapter args to compare: the default pool, a pool big enough for every
+    worker, and a small blocking pool
+    """
+    base = rr_adapter_args()
+    base["connect_timeout"] = LOAD_TIMEOUT
+    base["read_timeout"] = LOAD_TIMEOUT
+    big_pool = base.copy()
+    big_pool["pool_maxsize"] = LOAD_WORKERS
+    blocking_pool = base.copy()
+    blocking_pool["pool_maxsize"] = LOAD_WORKERS // 4
+    blocking_pool["pool_block"] = True
+    return [base, big_pool, blocking_pool]
+
+
+class PoolSizeScenario(metaclass=ScenarioMeta):
+    """
+    Compare throughput and connection churn for different pool sizes, with more
+    threads sharing the session than the default pool size
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("PoolSizeScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for rr_args in load_adapter_args():
+                with rrs.retry_session_manager(protocol="http", **rr_args) as session:
+                    with LogCounter(URLLIB3_POOL_LOGGER, NEW_CONNECTION_TEXT) as new_conns:
+                        with LogCounter(URLLIB3_POOL_LOGGER, POOL_FULL_TEXT) as discards:
+                            results = concurrent_gets(session, url,
+                                                      params=ok_params(LOAD_DELAY),
+                                                      workers=LOAD_WORKERS,
+                                                      requests_per_worker=LOAD_REQUESTS_PER_WORKER)
+                logging.log(NOTICE, "PoolSizeScenario: args=%s: %d requests in %.2fs (%.1f req/s), "
+                            "%d new connections, %d discarded connections, outcomes=%s",
+                            rr_args, results.total, results.elapsed, results.throughput,
+                            new_conns.count, discards.count, dict(results.outcomes))
+                passed = results.outcomes[200] == results.total
+                pool_maxsize = rr_args.get("pool_maxsize", DEFAULT_POOLSIZE)
+                if rr_args.get("pool_block") or pool_maxsize >= LOAD_WORKERS:
+                    # A pool that is big enough (or that blocks) should never discard
+                    # connections, and so should never need more than its maximum size
+                    passed = passed and discards.count == 0 and new_conns.count <= pool_maxsize
+                record_result(test_results, passed, entry="PoolSizeScenario", args=rr_args, proto="http")
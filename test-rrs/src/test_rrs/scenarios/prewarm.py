@@ -0,0 +1,110 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Opening pooled connections ahead of the first request, with prewarm_session
+"""
+
+import logging
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+
+from .load import ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+CONNECTIONS = 3
+# Nothing listens on port 1, so connecting to it is refused
+UNREACHABLE_URL = "http://127.0.0.1:1"
+
+
+class PrewarmScenario(metaclass=ScenarioMeta):
+    """
+    Prewarm a session's connections to the test server, and verify that the requested number of
+    connections are waiting in its pool before its first request (which then succeeds), both for
+    a retry_session_manager and for a ThreadSafeRetrySessionManager (in each session mode). Also
+    prewarm connections to an unreachable URL alongside it, and verify that the failure is
+    reported in its outcome, rather than raised.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("PrewarmScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            # The lifetime policy is only there to count the idle connections in the pool
+            policy = rrs.ConnectionLifetimePolicy()
+            rr_args = rr_adapter_args()
+            rr_args["connection_lifetime"] = policy
+            with rrs.retry_session_manager(protocol="http", prewarm_urls=[url],
+                                           prewarm_connections=CONNECTIONS, **rr_args) as session:
+                stats = policy.stats()
+                with session.get(url, params=ok_params()._asdict()) as resp:
+                    status = resp.status_code
+            policy.close()
+            logging.log(NOTICE, "PrewarmScenario: pool stats after prewarming: %s; first request: %d",
+                        stats, status)
+            passed = stats.idle_connections == CONNECTIONS and status == 200
+            record_result(test_results, passed, entry="PrewarmScenario warm pool",
+                          args=rr_args, proto="http")
+
+            for mode in ("per_thread", "pool"):
+                record_result(test_results, cls._thread_safe_warm_pool(url, mode),
+                              entry=f"PrewarmScenario ThreadSafeRetrySessionManager {mode}",
+                              args=rr_adapter_args(), proto="http")
+
+            rr_args = rr_adapter_args()
+            with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                outcomes = rrs.prewarm_session(session, [url, UNREACHABLE_URL], connections=CONNECTIONS)
+            logging.log(NOTICE, "PrewarmScenario: outcomes: %s", outcomes)
+            reachable, unreachable = outcomes
+            passed = reachable.ok and reachable.connected == CONNECTIONS
+            passed = passed and not unreachable.ok and unreachable.connected == 0
+            record_result(test_results, passed, entry="PrewarmScenario unreachable URL",
+                          args=rr_args, proto="http")
+
+    @classmethod
+    def _thread_safe_warm_pool(cls, url: str, mode: rrs.SessionModeType) -> bool:
+        """
+        Verify that the pool of the shared adapter of a ThreadSafeRetrySessionManager is prewarmed
+        when its first session is created
+        """
+        policy = rrs.ConnectionLifetimePolicy()
+        rr_args = rr_adapter_args()
+        rr_args["connection_lifetime"] = policy
+        with rrs.ThreadSafeRetrySessionManager(protocol="http", session_mode=mode, prewarm_urls=[url],
+                                               prewarm_connections=CONNECTIONS, **rr_args) as mgr:
+            with mgr.checkout() as session:
+                stats = policy.stats()
+                with session.get(url, params=ok_params()._asdict()) as resp:
+                    status = resp.status_code
+        policy.close()
+        logging.log(NOTICE, "PrewarmScenario: %s: pool stats after prewarming: %s; first request: %d",
+                    mode, stats, status)
+        return stats.idle_connections == CONNECTIONS and status == 200
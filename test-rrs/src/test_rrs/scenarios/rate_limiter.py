@@ -0,0 +1,93 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Spreading out attempts to a host with a shared per-host rate limiter
+"""
+
+import logging
+import time
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server
+from test_rrs.utils import random_id
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+# Attempts per second
+RATE = 10.0
+NUM_REQUESTS = 4
+# A request failing fast should take less than this many seconds
+FAIL_FAST_TIME = 0.05
+
+
+class RateLimiterScenario(metaclass=ScenarioMeta):
+    """
+    Make a series of requests (in new sessions, sharing one rate limiter), the first of which is
+    retried once, and verify that every attempt (including the retry) took a token, and that
+    all but the first had to wait for one, so that they were spread out at the rate of the limiter.
+    Then verify that with a max_wait of 0, a request which would have to wait fails fast.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("RateLimiterScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                limiter = rrs.RateLimiter(rate=RATE)
+                rr_args = rr_adapter_args()
+                rr_args["rate_limiter"] = limiter
+                retried = ReqParams(id=random_id(), delays=(0, 0), scs=(RR_STATUS_FORCELIST[0], 200))
+                start = time.monotonic()
+                outcomes = [timed_get(entry, url, rr_args, retried)[0]]
+                outcomes.extend(timed_get(entry, url, rr_args, ok_params())[0] for _ in range(NUM_REQUESTS - 1))
+                elapsed = time.monotonic() - start
+                stats = limiter.stats()
+                logging.log(NOTICE, "RateLimiterScenario: %s: %s: %s after %.3fs; %s",
+                            entry, limiter, outcomes, elapsed, stats)
+                attempts = NUM_REQUESTS + 1
+                passed = outcomes == [200] * NUM_REQUESTS and elapsed >= (attempts - 1) / RATE * 0.9
+                passed = passed and stats.acquired == attempts and stats.delayed == attempts - 1
+                passed = passed and stats.rejected == 0 and stats.longest_wait <= 1 / RATE
+                record_result(test_results, passed, entry=f"RateLimiterScenario {entry}",
+                              args=rr_args, proto="http")
+
+                limiter = rrs.RateLimiter(rate=RATE, max_wait=0)
+                rr_args["rate_limiter"] = limiter
+                first, _ = timed_get(entry, url, rr_args, ok_params())
+                second, elapsed = timed_get(entry, url, rr_args, ok_params())
+                stats = limiter.stats()
+                logging.log(NOTICE, "RateLimiterScenario: %s: %s: %s, then %s after %.3fs; %s",
+                            entry, limiter, first, second, elapsed, stats)
+                passed = first == 200 and second == "RateLimited" and elapsed < FAIL_FAST_TIME
+                passed = passed and stats.acquired == 1 and stats.rejected == 1
+                record_result(test_results, passed, entry=f"RateLimiterScenario {entry} max_wait=0",
+                              args=rr_args, proto="http")
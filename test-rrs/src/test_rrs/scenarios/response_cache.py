@@ -0,0 +1,182 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Serving and revalidating responses with ResponseCache
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Dict, List, Tuple, Union
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server, CACHE_PATH
+from test_rrs.utils import random_id
+
+from .scenario_base import ScenarioMeta, record_result
+
+
+class ResponseCacheScenario(metaclass=ScenarioMeta):
+    """
+    Make requests to a fresh and a stale (max-age=0) cacheable response through a session with a
+    response cache, and verify that the fresh one is served from the cache, the stale one is
+    revalidated (and served from the cache after a 304), a no-cache request revalidates the fresh
+    one, and a POST evicts it. The test server sends a body naming the method and path, and a
+    304 response when the request has its ETag in If-None-Match.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("ResponseCacheScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            cache = rrs.ResponseCache()
+            rr_args = rr_adapter_args()
+            rr_args["cache"] = cache
+            fresh_url = f"{url}{CACHE_PATH}?id={random_id()}&max_age=60"
+            stale_url = f"{url}{CACHE_PATH}?id={random_id()}&max_age=0"
+            # The name, method, URL, and request headers of each request, and the expected stats after it
+            steps: List[Tuple[str, str, str, Dict[str, str], rrs.CacheStats]] = [
+                ("fresh miss", "GET", fresh_url, {}, rrs.CacheStats(0, 1, 0, 1, 0, 1, 0)),
+                ("fresh hit", "GET", fresh_url, {}, rrs.CacheStats(1, 1, 0, 1, 0, 1, 0)),
+                ("stale miss", "GET", stale_url, {}, rrs.CacheStats(1, 2, 0, 2, 0, 2, 0)),
+                ("stale revalidation", "GET", stale_url, {}, rrs.CacheStats(1, 2, 1, 2, 0, 2, 0)),
+                ("no-cache revalidation", "GET", fresh_url, {"Cache-Control": "no-cache"},
+                 rrs.CacheStats(1, 2, 2, 2, 0, 2, 0)),
+                ("POST", "POST", fresh_url, {}, rrs.CacheStats(1, 2, 2, 2, 0, 1, 0)),
+            ]
+            passed = True
+            with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                for name, method, step_url, headers, expected in steps:
+                    with session.request(method, step_url, headers=headers) as resp:
+                        body = resp.text
+                        status = resp.status_code
+                    # The size of the stored bodies is not known in advance
+                    stats = cache.stats()._replace(size=0)
+                    logging.log(NOTICE, "ResponseCacheScenario: %s: %d %r; %s", name, status, body, stats)
+                    expected_body = f"OK: {method} {step_url[len(url):]}"
+                    passed = passed and status == 200 and body == expected_body and stats == expected
+            record_result(test_results, passed, entry="ResponseCacheScenario rrs.requests_retry_session",
+                          args=rr_args, proto="http")
+
+
+# The credentials of the two sessions
+CREDENTIALS: List[Dict[str, str]] = [
+    {"Authorization": "Bearer alice"},
+    {"Authorization": "Bearer bob", "Cookie": "user=bob"},
+]
+NO_CREDENTIALS: List[Dict[str, str]] = [{}, {}]
+# The Cache-Control directives (other than max-age) of the responses, the credentials of the
+# sessions, and whether the response to one session should be served from the cache to the other
+CREDENTIALED_CASES: List[Tuple[Union[str, None], List[Dict[str, str]], bool]] = [
+    (None, CREDENTIALS, False),
+    ("private", CREDENTIALS, False),
+    ("private", NO_CREDENTIALS, False),
+    ("public", CREDENTIALS, True),
+    ("must-revalidate", CREDENTIALS, True),
+]
+
+
+class CredentialedResponseCacheScenario(metaclass=ScenarioMeta):
+    """
+    Make requests for the same fresh cacheable response from two sessions with different
+    credentials which share a response cache, and verify that the response to the first session
+    is only served to the second if it is marked as shareable (and is never stored if it is
+    marked private, even without credentials), so that each otherwise gets a response to its own
+    credentials.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("CredentialedResponseCacheScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for cache_control, case_credentials, shared in CREDENTIALED_CASES:
+                cache = rrs.ResponseCache()
+                rr_args = rr_adapter_args()
+                rr_args["cache"] = cache
+                path = f"{CACHE_PATH}?id={random_id()}&max_age=60"
+                if cache_control is not None:
+                    path = f"{path}&cache_control={cache_control}"
+                bodies: List[str] = []
+                for credentials in case_credentials:
+                    with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                        session.headers.update(credentials)
+                        with session.get(f"{url}{path}") as resp:
+                            bodies.append(resp.text)
+                stats = cache.stats()
+                logging.log(NOTICE, "CredentialedResponseCacheScenario: %s: %r; %s", cache_control, bodies, stats)
+                expected = [f"OK: GET {path}" + "".join(f" {name}: {value}" for name, value in credentials.items())
+                            for credentials in case_credentials]
+                if shared:
+                    passed = bodies == [expected[0], expected[0]] and stats.hits == 1 and stats.entries == 1
+                else:
+                    passed = bodies == expected and stats.hits == 0 and stats.entries == 0
+                with_credentials = "with" if case_credentials[0] else "without"
+                record_result(test_results, passed,
+                              entry=f"CredentialedResponseCacheScenario {cache_control} {with_credentials} credentials",
+                              args=rr_args, proto="http")
+
+
+class EncodedResponseCacheScenario(metaclass=ScenarioMeta):
+    """
+    Make requests to a fresh and a stale (max-age=0) cacheable response whose body is
+    gzip-encoded, through a session with a response cache, and verify that the responses served
+    from the cache (after a hit, or a 304 revalidation) have the decoded body, and headers which
+    describe it: no Content-Encoding, and the Content-Length of the decoded body.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("EncodedResponseCacheScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for max_age in (60, 0):
+                rr_args = rr_adapter_args()
+                rr_args["cache"] = rrs.ResponseCache()
+                path = f"{CACHE_PATH}?id={random_id()}&max_age={max_age}&gzip=1"
+                with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                    with session.get(f"{url}{path}") as resp:
+                        live_encoding = resp.headers.get("Content-Encoding")
+                    with session.get(f"{url}{path}") as resp:
+                        body = resp.text
+                        encoding = resp.headers.get("Content-Encoding")
+                        length = resp.headers.get("Content-Length")
+                        content_length = len(resp.content)
+                logging.log(NOTICE, "EncodedResponseCacheScenario: max-age=%d: %r; Content-Encoding %s (live %s); "
+                            "Content-Length %s (%d bytes)", max_age, body, encoding, live_encoding, length,
+                            content_length)
+                passed = (body == f"OK: GET {path}" and live_encoding == "gzip" and encoding is None
+                          and length == str(content_length))
+                record_result(test_results, passed, entry=f"EncodedResponseCacheScenario max-age={max_age}",
+                              args=rr_args, proto="http")
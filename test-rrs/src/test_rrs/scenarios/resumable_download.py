@@ -0,0 +1,109 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Streaming downloads which are cut off, and resumed with Range requests where they left off
+"""
+
+import io
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Dict, Tuple, Union
+
+import requests
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server, download_body, DOWNLOAD_PATH
+
+from .scenario_base import ScenarioMeta, record_result
+
+
+SIZE = 50000
+# Longer than the read timeout of the adapter, so that a stalled response times out
+STALL = 0.2
+# Enough retries to resume the downloads which are cut off every BREAK_AFTER bytes, but not
+# those cut off every SHORT_BREAK_AFTER bytes
+NUM_RETRIES = 3
+BREAK_AFTER = 20000
+SHORT_BREAK_AFTER = 5000
+# Older versions of urllib3 discard the part of a chunk which was received before a read timed
+# out, so the breaks must come between chunks for the stalled downloads to make any progress
+CHUNK_SIZE = 1000
+
+# For each case, the download query parameters, and the expected outcome: the minimum number of
+# resumes, or the name of the exception raised
+CASES: Dict[str, Tuple[Dict[str, Union[int, float]], Union[int, str]]] = {
+    "complete": ({"size": SIZE}, 0),
+    "reset": ({"size": SIZE, "break_after": BREAK_AFTER}, 2),
+    "stalled": ({"size": SIZE, "break_after": BREAK_AFTER, "stall": STALL}, 1),
+    "no validators": ({"size": SIZE, "break_after": BREAK_AFTER, "validators": 0}, "ChunkedEncodingError"),
+    "retries exhausted": ({"size": SIZE, "break_after": SHORT_BREAK_AFTER}, "ConnectionError"),
+}
+
+
+class ResumableDownloadScenario(metaclass=ScenarioMeta):
+    """
+    Download files using the retry session managers, from responses which are reset, or stall
+    until the read times out, part way through, and verify that the downloads are resumed where
+    they left off, and that the files are complete and correct. Then verify that a download is not
+    resumed if the server gives no validator for If-Range, or once the retries are exhausted.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("ResumableDownloadScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for mode in ("RetrySessionManager", "ThreadSafeRetrySessionManager"):
+                for case, (params, expected) in CASES.items():
+                    rr_args = rr_adapter_args()
+                    rr_args["retries"] = NUM_RETRIES
+                    manager: rrs.RetrySessionManager
+                    if mode == "RetrySessionManager":
+                        manager = rrs.RetrySessionManager(protocol="http", **rr_args)
+                    else:
+                        manager = rrs.ThreadSafeRetrySessionManager(protocol="http", session_mode="pool", **rr_args)
+                    file = io.BytesIO()
+                    outcome: Union[rrs.DownloadOutcome, str]
+                    with manager:
+                        try:
+                            outcome = manager.download(f"{url}{DOWNLOAD_PATH}", file, chunk_size=CHUNK_SIZE,
+                                                       params=params)
+                        except requests.RequestException as err:
+                            outcome = type(err).__name__
+                    logging.log(NOTICE, "ResumableDownloadScenario: %s: %s: %s", mode, case, outcome)
+                    if isinstance(expected, str) or isinstance(outcome, str):
+                        passed = outcome == expected
+                    else:
+                        passed = outcome.received == SIZE and outcome.length == SIZE and outcome.resumes >= expected
+                        passed = passed and file.getvalue() == download_body(SIZE)
+                    record_result(test_results, passed, entry=f"ResumableDownloadScenario {mode} {case}",
+                                  args=rr_args, proto="http")
@@ -0,0 +1,107 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Coordinating the backoff of concurrent requests to a host which asks for a pause with Retry-After
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server, RETRY_AFTER_PATH
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+# The Retry-After (in seconds) of the first response (it must be a whole number)
+RETRY_AFTER = 1
+NUM_OTHERS = 4
+# The Retry-After of the responses which would outlast the deadline of their requests
+LONG_RETRY_AFTER = 5
+TOTAL_TIMEOUT = 1.0
+MAX_PAUSE = 0.3
+# A request failing fast should take less than this many seconds
+FAIL_FAST_TIME = 0.05
+
+
+class RetryAfterPauseScenario(metaclass=ScenarioMeta):
+    """
+    Make a request (in a new session, sharing one RetryAfterPause with the others) which is
+    answered with 503 and a Retry-After header, and then concurrent requests to the same host,
+    and verify that they were all held back until the Retry-After had passed. Then verify that a
+    request which could not wait for the pause to end within its deadline fails fast with
+    DeadlineExceeded, and that with a max_pause, it only waits that long.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("RetryAfterPauseScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                pause = rrs.RetryAfterPause()
+                rr_args = rr_adapter_args()
+                rr_args["retry_after_pause"] = pause
+                paused_url = f"{url}{RETRY_AFTER_PATH}?retry_after={RETRY_AFTER}"
+                with ThreadPoolExecutor(max_workers=NUM_OTHERS + 1) as executor:
+                    first = executor.submit(timed_get, entry, paused_url, rr_args, ok_params())
+                    while not pause.snapshot() and not first.done():
+                        time.sleep(0.01)
+                    others = [executor.submit(timed_get, entry, url, rr_args, ok_params()) for _ in range(NUM_OTHERS)]
+                    results = [first.result()] + [other.result() for other in others]
+                stats = pause.stats()
+                logging.log(NOTICE, "RetryAfterPauseScenario: %s: %s: %s; %s", entry, pause, results, stats)
+                passed = all(outcome == 200 and elapsed >= RETRY_AFTER * 0.8 for outcome, elapsed in results)
+                passed = passed and stats.pauses == 1 and stats.held >= NUM_OTHERS and stats.rejected == 0
+                record_result(test_results, passed, entry=f"RetryAfterPauseScenario {entry}",
+                              args=rr_args, proto="http")
+
+                for max_pause in (None, MAX_PAUSE):
+                    pause = rrs.RetryAfterPause() if max_pause is None else rrs.RetryAfterPause(max_pause)
+                    rr_args = rr_adapter_args()
+                    rr_args["retry_after_pause"] = pause
+                    rr_args["total_timeout"] = TOTAL_TIMEOUT
+                    paused_url = f"{url}{RETRY_AFTER_PATH}?retry_after={LONG_RETRY_AFTER}"
+                    first_outcome, first_elapsed = timed_get(entry, paused_url, rr_args, ok_params())
+                    outcome, elapsed = timed_get(entry, url, rr_args, ok_params())
+                    stats = pause.stats()
+                    logging.log(NOTICE, "RetryAfterPauseScenario: %s: %s: %s after %.3fs, then %s after %.3fs; %s",
+                                entry, pause, first_outcome, first_elapsed, outcome, elapsed, stats)
+                    # The backoff of the first request would overrun its deadline, so it fails fast
+                    passed = first_outcome == "DeadlineExceeded" and first_elapsed < TOTAL_TIMEOUT
+                    if max_pause is None:
+                        passed = passed and outcome == "DeadlineExceeded" and elapsed < FAIL_FAST_TIME
+                        passed = passed and stats.rejected == 1
+                    else:
+                        passed = passed and outcome == 200 and max_pause * 0.8 <= elapsed < TOTAL_TIMEOUT
+                        passed = passed and stats.held == 1
+                    record_result(test_results, passed, entry=f"RetryAfterPauseScenario {entry} max_pause={max_pause}",
+                                  args=rr_args, proto="http")
@@ -0,0 +1,99 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Limiting retries across adapters with a shared retry budget
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List, Tuple, Union
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server, DROP_SC
+from test_rrs.utils import random_id
+
+from .load import ok_params, timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+MAX_TOKENS = 3
+RETRY_RATIO = 0.5
+# Without the budget, a request to a failing endpoint would make this many retries
+NUM_RETRIES = 10
+
+
+def _failing_params(sc: int) -> ReqParams:
+    """
+    Return request parameters for an endpoint which always fails with the specified status code
+    """
+    return ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1), scs=(sc,) * (NUM_RETRIES + 1))
+
+
+class RetryBudgetScenario(metaclass=ScenarioMeta):
+    """
+    Make requests through separate sessions (and so separate adapters) sharing one retry budget,
+    and verify that retries stop when it is exhausted, surfacing the last response or error,
+    and resume once successful requests have deposited enough tokens
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("RetryBudgetScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                budget = rrs.RetryBudget(max_tokens=MAX_TOKENS, retry_ratio=RETRY_RATIO)
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = NUM_RETRIES
+                rr_args["retry_budget"] = budget
+                # The first request spends the whole budget, and the second gets no retries,
+                # so both return the status code of their last attempt
+                steps: List[Tuple[str, ReqParams, Union[int, str], Union[rrs.RetryBudgetStats, None]]] = [
+                    ("failing request", _failing_params(RR_STATUS_FORCELIST[0]), RR_STATUS_FORCELIST[0],
+                     rrs.RetryBudgetStats(tokens=0, deposits=0, retries=MAX_TOKENS, denied=1)),
+                    ("exhausted budget", _failing_params(RR_STATUS_FORCELIST[0]), RR_STATUS_FORCELIST[0],
+                     rrs.RetryBudgetStats(tokens=0, deposits=0, retries=MAX_TOKENS, denied=2)),
+                ]
+                # Two successes deposit a token, which allows one retry of the dropped connection
+                for _ in range(int(1 / RETRY_RATIO)):
+                    steps.append(("successful request", ok_params(), 200, None))
+                steps.append(("dropped connection", _failing_params(DROP_SC), "ConnectionError",
+                              rrs.RetryBudgetStats(tokens=0, deposits=2, retries=MAX_TOKENS + 1, denied=3)))
+                passed = True
+                for name, params, expected, expected_stats in steps:
+                    outcome, elapsed = timed_get(entry, url, rr_args, params)
+                    stats = budget.stats()
+                    logging.log(NOTICE, "RetryBudgetScenario: %s: %s: %s after %.3fs; %s",
+                                entry, name, outcome, elapsed, stats)
+                    passed = passed and outcome == expected and expected_stats in (None, stats)
+                record_result(test_results, passed, entry=f"RetryBudgetScenario {entry}",
+                              args=rr_args, proto="http")
@@ -0,0 +1,182 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Receiving structured retry events through event hooks, instead of (or as well as) the retry logs
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import ClassVar, List, Tuple, Union
+
+import requests_retry_session as rrs
+from requests_retry_session.utils import host_key
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server, DROP_SC
+from test_rrs.utils import random_id, LogCounter
+
+from .load import timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_RETRIES = 2
+RETRY_LOGGER = "requests_retry_session.retry_with_logs"
+REATTEMPT_TEXT = "Reattempting"
+BUDGET_EXHAUSTED_TEXT = "Retry budget exhausted"
+
+# The expected kind, status code (if any), and attempt number of each event
+ExpectedEvents = List[Tuple[str, Union[int, None], int]]
+
+
+def _steps() -> List[Tuple[str, ReqParams, Union[int, str], ExpectedEvents]]:
+    """
+    Return the names, request parameters, expected outcomes, and expected events of the requests to make
+    """
+    sc = RR_STATUS_FORCELIST[0]
+    return [
+        ("retried status codes", ReqParams(id=random_id(), delays=(0, 0, 0), scs=(sc, sc, 200)), 200,
+         [("retry", sc, 1), ("retry", sc, 2)]),
+        ("dropped connection", ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1),
+                                         scs=(DROP_SC,) * (NUM_RETRIES + 1)), "ConnectionError",
+         [("retry", None, 1), ("retry", None, 2), ("exhausted", None, 3)]),
+    ]
+
+
+def _budget_denial(entry: str, url: str, hooked: bool) -> bool:
+    """
+    Make a request whose retried response is not retried again, because the retry budget (with
+    a single token) is exhausted, with an event hook or with no hooks, and return True if the
+    hook received the denial (and nothing was logged), or nothing was logged at all
+    """
+    sc = RR_STATUS_FORCELIST[0]
+    events: List[rrs.RetryEvent] = []
+    rr_args = rr_adapter_args()
+    rr_args["retries"] = NUM_RETRIES
+    rr_args["retry_budget"] = rrs.RetryBudget(max_tokens=1)
+    rr_args["event_hooks"] = [events.append] if hooked else []
+    params = ReqParams(id=random_id(), delays=(0, 0, 0), scs=(sc, sc, 200))
+    with LogCounter(RETRY_LOGGER, BUDGET_EXHAUSTED_TEXT) as logged:
+        outcome, elapsed = timed_get(entry, url, rr_args, params)
+    logging.log(NOTICE, "RetryEventsScenario: %s: exhausted budget (hooked=%s): %s after %.3fs; %d logged; %s",
+                entry, hooked, outcome, elapsed, logged.count, events)
+    expected_events = [("retry", sc, 1), ("budget_exhausted", sc, 2)] if hooked else []
+    return (outcome == sc and logged.count == 0
+            and [(event.kind, event.status, event.attempt) for event in events] == expected_events)
+
+
+class _CountingRetryEvent(rrs.RetryEvent):
+    """
+    A RetryEvent which counts how many times its endpoint is built
+    """
+    endpoints_built: ClassVar[int] = 0
+
+    @property
+    def endpoint(self) -> str:
+        type(self).endpoints_built += 1
+        return super().endpoint
+
+
+def _lazy_default_hook() -> bool:
+    """
+    Pass retry events (of every kind, with and without a status code) to the default hook with
+    a logger which is only enabled for errors, and return True if it built the endpoint of only
+    those whose messages are logged at that level
+    """
+    logger = logging.getLogger(f"{RETRY_LOGGER}.lazy")
+    logger.setLevel(logging.ERROR)
+    _CountingRetryEvent.endpoints_built = 0
+    expected = 0
+    for kind in ("retry", "exhausted", "deadline_exceeded", "circuit_open", "budget_exhausted"):
+        for status in (None, RR_STATUS_FORCELIST[0]):
+            event = _CountingRetryEvent(kind=kind, method="GET", scheme="http", host="localhost", port=None,
+                                        url="/", status=status, error_type=None, attempt=1)
+            rrs.log_retry_event(event, logger)
+            if kind not in ("retry", "exhausted"):
+                expected += 1
+    logging.log(NOTICE, "RetryEventsScenario: lazy default hook: %d endpoints built (%d expected)",
+                _CountingRetryEvent.endpoints_built, expected)
+    return _CountingRetryEvent.endpoints_built == expected
+
+
+class RetryEventsScenario(metaclass=ScenarioMeta):
+    """
+    Make requests which are retried with an event hook in place of the default one, and verify
+    the events it receives and that nothing is logged, then make them with the default hook,
+    and verify that the retries are logged. Also verify that a response which is not retried
+    because the retry budget is exhausted is reported to the event hook, and that with no
+    hooks, it is not logged.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("RetryEventsScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                events: List[rrs.RetryEvent] = []
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = NUM_RETRIES
+                rr_args["event_hooks"] = [events.append]
+                passed = True
+                for name, params, expected, expected_events in _steps():
+                    events.clear()
+                    with LogCounter(RETRY_LOGGER, REATTEMPT_TEXT) as logged:
+                        outcome, elapsed = timed_get(entry, url, rr_args, params)
+                    logging.log(NOTICE, "RetryEventsScenario: %s: %s: %s after %.3fs; %s",
+                                entry, name, outcome, elapsed, events)
+                    passed = (passed and outcome == expected and logged.count == 0
+                              and [(event.kind, event.status, event.attempt) for event in events] == expected_events
+                              and all(event.method == "GET" and event.host_key == host_key(url)
+                                      and (event.status is None) == (event.error_type is not None)
+                                      and (event.sleep is not None) == (event.kind == "retry")
+                                      for event in events))
+                record_result(test_results, passed, entry=f"RetryEventsScenario {entry} event hook",
+                              args=rr_args, proto="http")
+
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = NUM_RETRIES
+                passed = True
+                for name, params, expected, expected_events in _steps():
+                    with LogCounter(RETRY_LOGGER, REATTEMPT_TEXT) as logged:
+                        outcome, elapsed = timed_get(entry, url, rr_args, params)
+                    logging.log(NOTICE, "RetryEventsScenario: %s: %s with default hook: %s after %.3fs",
+                                entry, name, outcome, elapsed)
+                    num_retries = sum(1 for kind, _, _ in expected_events if kind == "retry")
+                    passed = passed and outcome == expected and logged.count == num_retries
+                record_result(test_results, passed, entry=f"RetryEventsScenario {entry} default hook",
+                              args=rr_args, proto="http")
+
+                for hooked in (True, False):
+                    record_result(test_results, _budget_denial(entry, url, hooked),
+                                  entry=f"RetryEventsScenario {entry} budget denial hooked={hooked}",
+                                  args=rr_adapter_args(), proto="http")
+
+        record_result(test_results, _lazy_default_hook(), entry="RetryEventsScenario lazy default hook",
+                      args=rr_adapter_args(), proto="http")
@@ -0,0 +1,134 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Coalescing retry log lines with RetryLogAggregator
+"""
+
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, RR_STATUS_FORCELIST
+from test_rrs.server import background_server
+from test_rrs.utils import random_id, LogCounter
+
+from .load import timed_get
+from .scenario_base import ScenarioMeta, record_result
+
+
+AGGREGATOR_LOGGER = "requests_retry_session.retry_log_aggregator"
+RETRY_LOGGER = "requests_retry_session.retry_with_logs"
+REATTEMPT_TEXT = "Reattempting"
+SUMMARY_TEXT = "more GET attempts"
+NUM_REQUESTS = 3
+NUM_RETRIES = 3
+# The window of the aggregator whose summaries are logged by its flush thread
+SHORT_WINDOW = 0.3
+
+
+def _retried_params(sc: int) -> ReqParams:
+    """
+    Return request parameters for a request which succeeds after NUM_RETRIES responses with the specified status code
+    """
+    return ReqParams(id=random_id(), delays=(0,) * (NUM_RETRIES + 1), scs=(sc,) * NUM_RETRIES + (200,))
+
+
+def _get_all(entry: str, url: str, rr_args: rrs.RequestsRetryAdapterArgs, scs: List[int]) -> bool:
+    """
+    Make a retried request for each of the specified status codes, and return True if they all succeed
+    """
+    passed = True
+    for sc in scs:
+        outcome, elapsed = timed_get(entry, url, rr_args, _retried_params(sc))
+        logging.log(NOTICE, "RetryLogAggregatorScenario: %s: %d retries: %s after %.3fs", entry, sc, outcome, elapsed)
+        passed = passed and outcome == 200
+    return passed
+
+
+class RetryLogAggregatorScenario(metaclass=ScenarioMeta):
+    """
+    Make several requests which are retried with the same status code, and verify that only
+    the first retry is logged, and the rest are logged as one summary line when the aggregator
+    is flushed. Then verify that lines beyond the rate limit are not logged, and that (with a
+    short window) the summary is logged once the window ends, without the aggregator being
+    flushed or receiving any more events.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("RetryLogAggregatorScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                aggregator = rrs.RetryLogAggregator(window=60)
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = NUM_RETRIES
+                rr_args["event_hooks"] = [aggregator]
+                with LogCounter(AGGREGATOR_LOGGER, REATTEMPT_TEXT) as reattempts, \
+                        LogCounter(AGGREGATOR_LOGGER, SUMMARY_TEXT) as summaries, \
+                        LogCounter(RETRY_LOGGER, REATTEMPT_TEXT) as retry_logs:
+                    passed = _get_all(entry, url, rr_args, [RR_STATUS_FORCELIST[0]] * NUM_REQUESTS)
+                    passed = passed and reattempts.count == 1 and summaries.count == 0
+                    aggregator.flush()
+                aggregator.close()
+                logging.log(NOTICE, "RetryLogAggregatorScenario: %s: summaries: %s", entry, summaries.messages)
+                passed = (passed and retry_logs.count == 0 and summaries.count == 1
+                          and summaries.messages[0].startswith(f"{NUM_REQUESTS * NUM_RETRIES - 1} more"))
+                record_result(test_results, passed, entry=f"RetryLogAggregatorScenario {entry}",
+                              args=rr_args, proto="http")
+
+                # With a rate limit of one line every 10 seconds, only the first retry is logged
+                aggregator = rrs.RetryLogAggregator(window=60, max_lines_per_second=0.1)
+                rr_args["event_hooks"] = [aggregator]
+                with LogCounter(AGGREGATOR_LOGGER, REATTEMPT_TEXT) as reattempts, \
+                        LogCounter(AGGREGATOR_LOGGER, SUMMARY_TEXT) as summaries:
+                    passed = _get_all(entry, url, rr_args, list(RR_STATUS_FORCELIST))
+                    aggregator.flush()
+                aggregator.close()
+                passed = passed and reattempts.count == 1 and summaries.count == 0
+                record_result(test_results, passed, entry=f"RetryLogAggregatorScenario {entry} rate limit",
+                              args=rr_args, proto="http")
+
+                aggregator = rrs.RetryLogAggregator(window=SHORT_WINDOW)
+                rr_args["event_hooks"] = [aggregator]
+                with LogCounter(AGGREGATOR_LOGGER, SUMMARY_TEXT) as summaries:
+                    passed = _get_all(entry, url, rr_args, [RR_STATUS_FORCELIST[0]])
+                    passed = passed and summaries.count == 0
+                    time.sleep(SHORT_WINDOW * 3)
+                    logging.log(NOTICE, "RetryLogAggregatorScenario: %s: flush thread summaries: %s",
+                                entry, summaries.messages)
+                    passed = (passed and summaries.count == 1
+                              and summaries.messages[0].startswith(f"{NUM_RETRIES - 1} more"))
+                aggregator.close()
+                record_result(test_results, passed, entry=f"RetryLogAggregatorScenario {entry} flush thread",
+                              args=rr_args, proto="http")
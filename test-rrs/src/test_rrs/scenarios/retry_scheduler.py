@@ -0,0 +1,102 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Submitting requests whose retries wait for a timer thread, rather than in their worker threads
+"""
+
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List, Union
+
+import requests
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server, RETRY_AFTER_PATH
+
+from .load import ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+# The Retry-After (in seconds) of the first response to each request (it must be a whole number)
+RETRY_AFTER = 1
+NUM_WORKERS = 2
+NUM_REQUESTS = 8
+
+
+class RetrySchedulerScenario(metaclass=ScenarioMeta):
+    """
+    Submit more requests than there are worker threads, each of which is answered with 503 and
+    a Retry-After header the first time, and verify that they all succeeded after about one
+    Retry-After (rather than one for every NUM_WORKERS of them, as would be the case if the
+    workers slept until their retries were due), that each of their retries was deferred, and
+    that the metrics counted each request once, with both of its attempts.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("RetrySchedulerScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for mode in ("RetrySessionManager", "ThreadSafeRetrySessionManager"):
+                metrics = rrs.RetryMetrics()
+                rr_args = rr_adapter_args()
+                rr_args["pool_maxsize"] = NUM_WORKERS
+                rr_args["metrics"] = metrics
+                manager: rrs.RetrySessionManager
+                if mode == "RetrySessionManager":
+                    manager = rrs.RetrySessionManager(protocol="http", **rr_args)
+                else:
+                    manager = rrs.ThreadSafeRetrySessionManager(protocol="http", session_mode="pool", **rr_args)
+                paused_url = f"{url}{RETRY_AFTER_PATH}?retry_after={RETRY_AFTER}"
+                start = time.monotonic()
+                with manager:
+                    futures = [manager.submit("GET", paused_url, params=ok_params()._asdict())
+                               for _ in range(NUM_REQUESTS)]
+                    outcomes: List[Union[int, str]] = []
+                    for future in futures:
+                        try:
+                            outcomes.append(future.result().status_code)
+                        except requests.RequestException as err:
+                            outcomes.append(type(err).__name__)
+                    elapsed = time.monotonic() - start
+                    scheduler = manager.retry_scheduler
+                    stats = None if scheduler is None else scheduler.stats()
+                endpoints = list(metrics.snapshot().values())
+                logging.log(NOTICE, "RetrySchedulerScenario: %s: %s after %.3fs; %s; %s",
+                            mode, outcomes, elapsed, stats, endpoints)
+                passed = outcomes == [200] * NUM_REQUESTS and RETRY_AFTER * 0.9 <= elapsed < RETRY_AFTER * 2
+                passed = passed and stats == rrs.RetrySchedulerStats(submitted=NUM_REQUESTS, finished=NUM_REQUESTS,
+                                                                     deferred=NUM_REQUESTS, waiting=0)
+                passed = passed and len(endpoints) == 1
+                passed = passed and endpoints[0].requests == NUM_REQUESTS and endpoints[0].attempts == 2 * NUM_REQUESTS
+                passed = passed and endpoints[0].request_latency.mean >= RETRY_AFTER * 0.9
+                record_result(test_results, passed, entry=f"RetrySchedulerScenario {mode}", args=rr_args, proto="http")
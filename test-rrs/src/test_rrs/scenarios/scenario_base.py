@@ -0,0 +1,107 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Scenarios are tests that do not fit the request/expected status code model of
+the test suites -- for example, tests that exercise a session under concurrent load.
+"""
+
+import logging
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Tuple,
+)
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import RequestProtocol, RequestVerb
+from test_rrs.results import (
+    RequestTestOptions,
+    RRTestOptions,
+    TestRecord,
+    TestResults,
+)
+from test_rrs.typing_imports import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class Scenario(Protocol):
+    """
+    Defines what a scenario class needs to look like
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """ Execute the scenario, recording its results in test_results """
+
+
+class ScenarioMeta(type):
+    """
+    Record every scenario that we define, so we don't
+    have to do it manually
+    """
+    scenarios: "ClassVar[List[Scenario]]" = []
+
+    def __init__(
+        cls,
+        name: str,
+        bases: Tuple[type, ...],
+        namespace: Dict[str, Any]
+    ):
+        super().__init__(name, bases, namespace)
+        if issubclass(cls, Scenario):
+            ScenarioMeta.scenarios.append(cls)
+
+
+def record_result(
+    test_results: TestResults,
+    passed: bool,
+    *,
+    entry: str,
+    args: rrs.RequestsRetryAdapterArgs,
+    proto: RequestProtocol,
+    verb: RequestVerb = "GET",
+) -> None:
+    """
+    Add a scenario subtest result to test_results
+    """
+    tr = TestRecord(req=RequestTestOptions(verb=verb, proto=proto),
+                    rr=RRTestOptions(args=args, proto=(proto,), entry=entry))
+    if passed:
+        test_results.passed.append(tr)
+    else:
+        logging.error("Scenario subtest failed: %s", tr)
+        test_results.failed.append(tr)
+
+
+def run_scenarios(test_results: TestResults) -> None:
+    """ Run every defined scenario """
+    logging.debug("run_scenarios: %s", ScenarioMeta.scenarios)
+    for scenario in ScenarioMeta.scenarios:
+        scenario.run(test_results=test_results)
@@ -0,0 +1,109 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Connection reuse across sessions through a shared adapter registry
+"""
+
+import logging
+import threading
+import time
+
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+from test_rrs.utils import LogCounter
+
+from .load import ok_params
+from .pool_load import NEW_CONNECTION_TEXT, URLLIB3_POOL_LOGGER
+from .scenario_base import ScenarioMeta, record_result
+
+
+# How many short-lived sessions to create
+NUM_SESSIONS = 5
+# The idle timeout and reap interval of the registry whose idle adapter is evicted by its reaper thread
+REAPER_IDLE_TIMEOUT = 0.2
+REAPER_INTERVAL = 0.1
+
+
+class SharedAdapterScenario(metaclass=ScenarioMeta):
+    """
+    Create a series of short-lived sessions, each making one request, and verify
+    that with an adapter registry they all reuse a single connection. Then verify that the
+    reaper thread of a registry evicts its idle adapter without the registry being used again,
+    and stops when the registry is closed.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("SharedAdapterScenario: run()")
+        rr_args = rr_adapter_args()
+        params = ok_params()._asdict()
+        with background_server("http", concurrent=True) as url:
+            for registry in (None, rrs.AdapterRegistry()):
+                passed = True
+                with LogCounter(URLLIB3_POOL_LOGGER, NEW_CONNECTION_TEXT) as new_conns:
+                    for _ in range(NUM_SESSIONS):
+                        with rrs.retry_session_manager(protocol="http", adapter_registry=registry,
+                                                       **rr_args) as session:
+                            with session.get(url, params=params) as resp:
+                                passed = passed and resp.status_code == 200
+                logging.log(NOTICE, "SharedAdapterScenario: registry=%s: %d sessions made %d new connections",
+                            registry, NUM_SESSIONS, new_conns.count)
+                if registry is None:
+                    passed = passed and new_conns.count == NUM_SESSIONS
+                else:
+                    # Every session should have shared the first connection, and the adapter
+                    # should still be held (idle) by the registry, until it is evicted
+                    passed = passed and new_conns.count == 1 and len(registry) == 1
+                    registry.idle_timeout = 0
+                    passed = passed and registry.evict_idle() == 1 and len(registry) == 0
+                record_result(test_results, passed, entry="SharedAdapterScenario",
+                              args=rr_args, proto="http")
+            record_result(test_results, cls._reaper_evicts(url, rr_args), entry="SharedAdapterScenario reaper",
+                          args=rr_args, proto="http")
+
+    @classmethod
+    def _reaper_evicts(cls, url: str, rr_args: rrs.RequestsRetryAdapterArgs) -> bool:
+        """
+        Make a request through a registry with a reaper thread, then leave the registry alone until
+        its adapter should have been evicted, and return True if it was
+        """
+        registry = rrs.AdapterRegistry(idle_timeout=REAPER_IDLE_TIMEOUT, reap_interval=REAPER_INTERVAL)
+        with rrs.retry_session_manager(protocol="http", adapter_registry=registry, **rr_args) as session:
+            with session.get(url, params=ok_params()._asdict()) as resp:
+                status = resp.status_code
+        held = len(registry)
+        time.sleep(REAPER_IDLE_TIMEOUT + 3 * REAPER_INTERVAL)
+        evicted = len(registry) == 0
+        registry.close()
+        reaper_running = any(thread.name == "AdapterRegistry reaper" for thread in threading.enumerate())
+        logging.log(NOTICE, "SharedAdapterScenario: reaper: status %d; held %d; evicted=%s; still running=%s",
+                    status, held, evicted, reaper_running)
+        return status == 200 and held == 1 and evicted and not reaper_running
@@ -0,0 +1,247 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Coalescing concurrent identical requests with SingleFlight
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server, DROP_SC
+from test_rrs.utils import random_id, suppress_ssl_warnings
+
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_REQUESTS = 5
+# How long the server takes to answer the first attempt of the request
+SLOW_DELAY = 0.5
+# The overall deadline of the request which waits on a slow request in flight
+WAITER_TOTAL_TIMEOUT = 0.3
+# The TLS handshakes make requests slower than the test timeouts allow for
+TLS_TIMEOUT = 2.0
+
+
+class SingleFlightScenario(metaclass=ScenarioMeta):
+    """
+    Make concurrent identical requests through a session with a SingleFlight, whose first attempt
+    is slow to be answered with a retryable status code, and verify that they share a single
+    request (so that they all get the response to its retry, after the slow first attempt), and
+    each gets its own copy of the response. Then make the request again, and verify that it is
+    not answered with the response of the finished request.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("SingleFlightScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            single_flight = rrs.SingleFlight()
+            rr_args = rr_adapter_args()
+            rr_args["read_timeout"] = SLOW_DELAY * 2
+            rr_args["pool_maxsize"] = NUM_REQUESTS
+            rr_args["single_flight"] = single_flight
+            params = ReqParams(id=random_id(), delays=(SLOW_DELAY, 0, 0), scs=(522, 200, 203))
+            barrier = threading.Barrier(NUM_REQUESTS)
+
+            with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+                def _get() -> Tuple[int, str, Any]:
+                    barrier.wait()
+                    with session.get(url, params=params._asdict()) as resp:
+                        return resp.status_code, resp.text, resp.raw
+
+                with ThreadPoolExecutor(max_workers=NUM_REQUESTS) as executor:
+                    results = list(executor.map(lambda _: _get(), range(NUM_REQUESTS)))
+                coalesced_stats = single_flight.stats()
+                # The request has been answered, so this makes the third request to the server
+                with session.get(url, params=params._asdict()) as resp:
+                    next_status = resp.status_code
+                next_stats = single_flight.stats()
+            # Each response has its own body stream
+            raws = {id(raw) for _, _, raw in results}
+            logging.log(NOTICE, "SingleFlightScenario: coalesced requests: %s; %s; next request: %d; %s",
+                        [status for status, _, _ in results], coalesced_stats, next_status, next_stats)
+            passed = (all(status == 200 and text == "OK" for status, text, _ in results)
+                      and len(raws) == NUM_REQUESTS
+                      and coalesced_stats == rrs.SingleFlightStats(flights=1, coalesced=NUM_REQUESTS - 1, in_flight=0)
+                      and next_status == 203
+                      and next_stats.flights == 2)
+            record_result(test_results, passed, entry="SingleFlightScenario rrs.requests_retry_session",
+                          args=rr_args, proto="http")
+
+
+def _failed_flight_errors(url: str, rr_args: rrs.RequestsRetryAdapterArgs) -> List[Exception]:
+    """
+    Make concurrent identical requests whose connections are always dropped, and return the
+    exceptions they raised
+    """
+    params = ReqParams(id=random_id(), delays=(SLOW_DELAY, 0), scs=(DROP_SC, DROP_SC))
+    barrier = threading.Barrier(NUM_REQUESTS)
+    with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+        def _get() -> Exception:
+            barrier.wait()
+            try:
+                session.get(url, params=params._asdict()).close()
+            except requests.exceptions.RequestException as err:
+                return err
+            return RuntimeError("The request did not fail")
+
+        with ThreadPoolExecutor(max_workers=NUM_REQUESTS) as executor:
+            return list(executor.map(lambda _: _get(), range(NUM_REQUESTS)))
+
+
+def _waiter_outcome(url: str, rr_args: rrs.RequestsRetryAdapterArgs,
+                    single_flight: rrs.SingleFlight) -> Tuple[Optional[Exception], float]:
+    """
+    While a slow request is in flight, make an identical request with a shorter overall deadline,
+    and return the exception it raised and how long it took
+    """
+    params = ReqParams(id=random_id(), delays=(SLOW_DELAY * 2,), scs=(200,))
+    with rrs.requests_retry_session(protocol="http", **rr_args) as session:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(lambda: session.get(url, params=params._asdict()).close())
+            while single_flight.stats().in_flight == 0 and not leader.done():
+                time.sleep(0.01)
+            start = time.monotonic()
+            error: Optional[Exception] = None
+            kwargs: Dict[str, Any] = {"params": params._asdict(), "timeout": rrs.TotalTimeout(WAITER_TOTAL_TIMEOUT)}
+            try:
+                session.get(url, **kwargs).close()
+            except requests.exceptions.RequestException as err:
+                error = err
+            elapsed = time.monotonic() - start
+            leader.result()
+    return error, elapsed
+
+
+class SingleFlightFailureScenario(metaclass=ScenarioMeta):
+    """
+    Make concurrent identical requests through a session with a SingleFlight, which all fail, and
+    verify that each raises its own copy of the exception raised by the request in flight. Then
+    make a request with an overall deadline while an identical slow request is in flight, and
+    verify that it stops waiting (raising DeadlineExceeded) once its deadline passes.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("SingleFlightFailureScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            single_flight = rrs.SingleFlight()
+            rr_args = rr_adapter_args()
+            rr_args["read_timeout"] = SLOW_DELAY * 4
+            rr_args["pool_maxsize"] = NUM_REQUESTS
+            rr_args["single_flight"] = single_flight
+            errors = _failed_flight_errors(url, rr_args)
+            logging.log(NOTICE, "SingleFlightFailureScenario: errors: %s; %s",
+                        [type(err).__name__ for err in errors], single_flight.stats())
+            # The copies raised by the waiting requests have the exception of the request in flight as their cause
+            leaders = [err for err in errors if not any(err.__cause__ is other for other in errors)]
+            passed = (all(isinstance(err, requests.exceptions.ConnectionError) for err in errors)
+                      and len({id(err) for err in errors}) == NUM_REQUESTS
+                      and len(leaders) == 1
+                      and all(err.__cause__ is leaders[0] for err in errors if err is not leaders[0]))
+            record_result(test_results, passed, entry="SingleFlightFailureScenario errors",
+                          args=rr_args, proto="http")
+
+            error, elapsed = _waiter_outcome(url, rr_args, single_flight)
+            logging.log(NOTICE, "SingleFlightFailureScenario: waiter raised %r after %.2fs", error, elapsed)
+            passed = isinstance(error, rrs.DeadlineExceeded) and elapsed < SLOW_DELAY * 2
+            record_result(test_results, passed, entry="SingleFlightFailureScenario waiter deadline",
+                          args=rr_args, proto="http")
+
+
+def _settings_flights(url: str, rr_args: rrs.RequestsRetryAdapterArgs, single_flight: rrs.SingleFlight,
+                      settings: List[Dict[str, Any]]) -> Tuple[List[int], rrs.SingleFlightStats]:
+    """
+    Make concurrent identical requests, except for their connection settings (one for each of
+    the specified ones), and return their status codes, and the counters of the SingleFlight
+    """
+    params = ReqParams(id=random_id(), delays=(SLOW_DELAY,), scs=(200,))
+    barrier = threading.Barrier(len(settings))
+    before = single_flight.stats()
+    with rrs.requests_retry_session(protocol="https", **rr_args) as session:
+        # Otherwise, requests replaces verify=True with REQUESTS_CA_BUNDLE, if it is set
+        session.trust_env = False
+
+        def _get(kwargs: Dict[str, Any]) -> int:
+            barrier.wait()
+            with session.get(url, params=params._asdict(), **kwargs) as resp:
+                return resp.status_code
+
+        with suppress_ssl_warnings(), ThreadPoolExecutor(max_workers=len(settings)) as executor:
+            statuses = list(executor.map(_get, settings))
+    after = single_flight.stats()
+    return statuses, rrs.SingleFlightStats(flights=after.flights - before.flights,
+                                           coalesced=after.coalesced - before.coalesced,
+                                           in_flight=after.in_flight)
+
+
+class SingleFlightSettingsScenario(metaclass=ScenarioMeta):
+    """
+    Make concurrent requests to the HTTPS server through a session with a SingleFlight, which
+    are identical except that one verifies the server certificate and the other does not, and
+    verify that they are not coalesced. Then do the same for requests which are identical
+    except that one presents a client certificate.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("SingleFlightSettingsScenario: run()")
+        server = background_server("https", concurrent=True)
+        with server as url:
+            single_flight = rrs.SingleFlight()
+            rr_args = rr_adapter_args()
+            rr_args["connect_timeout"] = rr_args["read_timeout"] = TLS_TIMEOUT
+            rr_args["single_flight"] = single_flight
+            # The self-signed server certificate is its own CA
+            cases: Dict[str, List[Dict[str, Any]]] = {
+                "verify": [{"verify": server.cert_file}, {"verify": False}],
+                "cert": [{"verify": server.cert_file},
+                         {"verify": server.cert_file, "cert": (server.cert_file, server.key_file)}],
+            }
+            for name, settings in cases.items():
+                statuses, stats = _settings_flights(url, rr_args, single_flight, settings)
+                logging.log(NOTICE, "SingleFlightSettingsScenario: requests differing in %s: %s; %s",
+                            name, statuses, stats)
+                passed = statuses == [200] * len(settings) and stats.flights == len(settings) and not stats.coalesced
+                record_result(test_results, passed, entry=f"SingleFlightSettingsScenario {name}",
+                              args=rr_args, proto="https")
@@ -0,0 +1,124 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Replaying requests on stale pooled connections with StaleConnectionPolicy
+"""
+
+from contextlib import AbstractContextManager
+import logging
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Any, List, Tuple, Union
+
+import requests
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE, ReqParams
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, AsyncSessionBridge
+from test_rrs.server import background_server, DROP_SC
+from test_rrs.utils import random_id
+
+from .load import ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+MAX_IDLE = 0.2
+
+
+def _dropped_params() -> ReqParams:
+    """
+    Return request parameters for a request whose first attempt is dropped by the server
+    (after it reads the request), and whose later attempts are answered immediately
+    """
+    return ReqParams(id=random_id(), delays=(0, 0), scs=(DROP_SC, 200))
+
+
+def _session_gets(
+    entry: str,
+    url: str,
+    rr_args: rrs.RequestsRetryAdapterArgs,
+    steps: List[Tuple[float, ReqParams]],
+) -> List[Union[int, str]]:
+    """
+    Make GET requests in a single new HTTP session (an AsyncRetrySession if entry is
+    "rrs.AsyncRetrySession", otherwise a requests_retry_session), each after sleeping for the
+    specified time, and return their status codes (or exception type names)
+    """
+    session: AbstractContextManager[Any]
+    if entry == "rrs.AsyncRetrySession":
+        session = AsyncSessionBridge("http", rr_args)
+    else:
+        session = rrs.requests_retry_session(protocol="http", **rr_args)
+    outcomes: List[Union[int, str]] = []
+    with session as sess:
+        for delay, params in steps:
+            time.sleep(delay)
+            try:
+                with sess.get(url, params=params._asdict()) as resp:
+                    outcomes.append(resp.status_code)
+            except requests.RequestException as err:
+                outcomes.append(type(err).__name__)
+    return outcomes
+
+
+class StaleConnectionsScenario(metaclass=ScenarioMeta):
+    """
+    With no retries, make a request on a pooled connection which the server closes after reading
+    the request (as if it had closed the connection while it was idle), and verify that it is
+    replayed on a new connection (and succeeds), without being reported as a failed attempt.
+    Verify that the same request on a new connection is not replayed, and (for the requests
+    adapter) that a pooled connection which has been idle for longer than max_idle is discarded.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("StaleConnectionsScenario: run()")
+        with background_server("http", concurrent=True) as url:
+            for entry in ("rrs.requests_retry_session", "rrs.AsyncRetrySession"):
+                policy = rrs.StaleConnectionPolicy(max_idle=MAX_IDLE)
+                events: List[rrs.RetryEvent] = []
+                rr_args = rr_adapter_args()
+                rr_args["retries"] = 0
+                rr_args["read_timeout"] = 1.0
+                rr_args["stale_connections"] = policy
+                rr_args["event_hooks"] = [events.append]
+                stale = _session_gets(entry, url, rr_args, [(0, ok_params()), (0, _dropped_params())])
+                fresh = _session_gets(entry, url, rr_args, [(0, _dropped_params())])
+                idle = _session_gets(entry, url, rr_args, [(0, ok_params()), (MAX_IDLE * 2, ok_params())])
+                stats = policy.stats()
+                logging.log(NOTICE, "StaleConnectionsScenario: %s: stale: %s; fresh: %s; idle: %s; events: %s; %s",
+                            entry, stale, fresh, idle, [event.kind for event in events], stats)
+                # The async session closes idle connections itself, rather than discarding them
+                expected_discards = 0 if entry == "rrs.AsyncRetrySession" else 1
+                passed = (stale == [200, 200] and fresh == ["ConnectionError"] and idle == [200, 200]
+                          and [event.kind for event in events] == ["exhausted"]
+                          and stats == rrs.StaleConnectionStats(replays=1, idle_discards=expected_discards))
+                record_result(test_results, passed, entry=f"StaleConnectionsScenario {entry}", args=rr_args,
+                              proto="http")
@@ -0,0 +1,160 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Sharing a ThreadSafeRetrySessionManager between worker threads
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import logging
+import threading
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import (
+    Any,
+    Dict,
+    List,
+    Set,
+    Tuple,
+)
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args
+from test_rrs.server import background_server
+
+from .load import ok_params
+from .pool_load import LOAD_TIMEOUT
+from .scenario_base import ScenarioMeta, record_result
+
+
+NUM_WORKERS = 8
+REQUESTS_PER_WORKER = 5
+SESSION_POOL_SIZE = 3
+
+# (thread id, session, status code) for each request
+RequestRecord = Tuple[int, requests.Session, int]
+
+
+def _run_workers(
+    mgr: rrs.ThreadSafeRetrySessionManager,
+    url: str,
+    params: Dict[str, Any],
+) -> List[RequestRecord]:
+    """
+    Have NUM_WORKERS threads each make REQUESTS_PER_WORKER requests, using sessions
+    checked out of the specified manager
+    """
+    records: List[RequestRecord] = []
+    records_lock = threading.Lock()
+
+    def _worker() -> None:
+        for _ in range(REQUESTS_PER_WORKER):
+            with mgr.checkout() as session:
+                with session.get(url, params=params) as resp:
+                    with records_lock:
+                        records.append((threading.get_ident(), session, resp.status_code))
+
+    with ThreadPoolExecutor(max_workers=NUM_WORKERS) as pool:
+        for future in [pool.submit(_worker) for _ in range(NUM_WORKERS)]:
+            future.result()
+    return records
+
+
+class ThreadSafeSessionScenario(metaclass=ScenarioMeta):
+    """
+    Use a ThreadSafeRetrySessionManager from multiple threads in each session mode,
+    and verify how many sessions were created, that they all shared one adapter, and
+    that everything was closed on exit. Also verify that in per_thread mode, the sessions of
+    threads which have exited are dropped once another thread's session is created.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("ThreadSafeSessionScenario: run()")
+        rr_args = rr_adapter_args()
+        rr_args["read_timeout"] = LOAD_TIMEOUT
+        params = ok_params()._asdict()
+        with background_server("http", concurrent=True) as url:
+            for mode in ("per_thread", "pool"):
+                with rrs.ThreadSafeRetrySessionManager(protocol="http", session_mode=mode,
+                                                       session_pool_size=SESSION_POOL_SIZE, **rr_args) as mgr:
+                    records = _run_workers(mgr, url, params)
+                threads: Set[int] = {r[0] for r in records}
+                sessions = {id(r[1]): r[1] for r in records}
+                adapters = {id(s.get_adapter(url)): s.get_adapter(url) for s in sessions.values()}
+                logging.log(NOTICE, "ThreadSafeSessionScenario: mode=%s: %d requests from %d threads "
+                            "used %d sessions and %d adapters", mode, len(records), len(threads),
+                            len(sessions), len(adapters))
+                passed = (len(records) == NUM_WORKERS * REQUESTS_PER_WORKER
+                          and all(r[2] == 200 for r in records)
+                          and len(adapters) == 1)
+                if mode == "per_thread":
+                    passed = passed and len(sessions) == len(threads)
+                else:
+                    passed = passed and len(sessions) <= SESSION_POOL_SIZE
+                # Closing the adapter clears its pools
+                passed = passed and all(isinstance(a, HTTPAdapter) and not a.poolmanager.pools
+                                        for a in adapters.values())
+                record_result(test_results, passed, entry=f"ThreadSafeSessionScenario {mode}",
+                              args=rr_args, proto="http")
+            record_result(test_results, cls._exited_threads_pruned(url, params, rr_args),
+                          entry="ThreadSafeSessionScenario exited threads", args=rr_args, proto="http")
+
+    @classmethod
+    def _exited_threads_pruned(cls, url: str, params: Dict[str, Any], rr_args: rrs.RequestsRetryAdapterArgs) -> bool:
+        """
+        Have short-lived threads each make a request with their own session, then create another
+        session, and return True if the sessions of the exited threads are no longer referenced
+        """
+        session_refs: List["weakref.ReferenceType[requests.Session]"] = []
+        statuses: List[int] = []
+
+        def _worker() -> None:
+            session = mgr.requests_session
+            with session.get(url, params=params) as resp:
+                statuses.append(resp.status_code)
+            session_refs.append(weakref.ref(session))
+
+        with rrs.ThreadSafeRetrySessionManager(protocol="http", **rr_args) as mgr:
+            for _ in range(NUM_WORKERS):
+                thread = threading.Thread(target=_worker)
+                thread.start()
+                thread.join()
+            with mgr.requests_session.get(url, params=params) as resp:
+                statuses.append(resp.status_code)
+            gc.collect()
+            live_sessions = sum(ref() is not None for ref in session_refs)
+        logging.log(NOTICE, "ThreadSafeSessionScenario: %d exited threads: %d of their sessions still referenced",
+                    NUM_WORKERS, live_sessions)
+        return statuses == [200] * (NUM_WORKERS + 1) and live_sessions == 0
@@ -0,0 +1,186 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+"""
+Benchmark of the TLS handshakes saved by sharing a ResumingSSLContext between short-lived sessions
+"""
+
+import logging
+import statistics
+import time
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import Any, List, Tuple, Union
+
+import requests
+import requests_retry_session as rrs
+
+from test_rrs.defs import NOTICE_LOG_LEVEL as NOTICE
+from test_rrs.results import TestResults
+from test_rrs.rrs_lib import rr_adapter_args, AsyncSessionBridge
+from test_rrs.server import background_server
+
+from .load import ok_params
+from .scenario_base import ScenarioMeta, record_result
+
+
+# How many short-lived sessions to create (each making one request, on a new connection)
+NUM_SESSIONS = 20
+# The TLS handshakes make requests slower than the test timeouts allow for
+TLS_TIMEOUT = 2.0
+
+
+def _time_sessions(url: str, rr_args: rrs.RequestsRetryAdapterArgs,
+                   verify: Union[bool, str]) -> Tuple[List[int], List[float]]:
+    """
+    Make one request in each of NUM_SESSIONS new sessions, and return their status codes, and
+    how long it took (in seconds) to open the connection of each one (including its handshake),
+    which is done by prewarming it. If a connection cannot be prewarmed, its status code is 0.
+    """
+    statuses: List[int] = []
+    durations: List[float] = []
+    for _ in range(NUM_SESSIONS):
+        with rrs.retry_session_manager(protocol="https", **rr_args) as session:
+            # Otherwise, requests replaces verify=True with REQUESTS_CA_BUNDLE, if it is set
+            session.trust_env = False
+            session.verify = verify
+            started = time.perf_counter()
+            outcome, = rrs.prewarm_session(session, [url])
+            durations.append(time.perf_counter() - started)
+            if not outcome.ok or outcome.connected != 1:
+                statuses.append(0)
+                continue
+            with session.get(url, params=ok_params()._asdict()) as resp:
+                statuses.append(resp.status_code)
+    return statuses, durations
+
+
+class TlsSessionScenario(metaclass=ScenarioMeta):
+    """
+    Make requests through a series of short-lived sessions to the HTTPS server, first with the
+    default TLS setup (so each new connection loads the CA bundle and makes a full handshake),
+    and then with a shared ResumingSSLContext. Log the request times of both, and verify that
+    with the shared context only the first connection made a full handshake, and all of the
+    others resumed its TLS session. Also verify that an async session uses the shared context.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("TlsSessionScenario: run()")
+        rr_args = rr_adapter_args()
+        rr_args["connect_timeout"] = rr_args["read_timeout"] = TLS_TIMEOUT
+        server = background_server("https", concurrent=True)
+        with server as url:
+            # The self-signed server certificate is its own CA
+            statuses, default_durations = _time_sessions(url, rr_args, verify=server.cert_file)
+            passed = statuses == [200] * NUM_SESSIONS
+            record_result(test_results, passed, entry="TlsSessionScenario default context",
+                          args=rr_args, proto="https")
+
+            context = rrs.create_ssl_context(server.cert_file)
+            rr_args["ssl_context"] = context
+            statuses, shared_durations = _time_sessions(url, rr_args, verify=True)
+            stats = context.stats()
+            logging.log(NOTICE, "TlsSessionScenario: %d sessions: median connection time %.2f ms with the default "
+                        "context, %.2f ms with a shared context (%s)", NUM_SESSIONS,
+                        statistics.median(default_durations) * 1000, statistics.median(shared_durations) * 1000,
+                        stats)
+            passed = statuses == [200] * NUM_SESSIONS
+            passed = passed and stats == rrs.TlsSessionStats(handshakes=1, resumed=NUM_SESSIONS - 1, sessions=1)
+            record_result(test_results, passed, entry="TlsSessionScenario shared context",
+                          args=rr_args, proto="https")
+
+            with AsyncSessionBridge("https", rr_args) as async_session:
+                status = async_session.get(url, params=ok_params()._asdict()).status_code
+            logging.log(NOTICE, "TlsSessionScenario: async session with a shared context: %d", status)
+            record_result(test_results, status == 200, entry="TlsSessionScenario async shared context",
+                          args=rr_args, proto="https")
+
+
+class _CertChainLoads:
+    """
+    Records the client certificates loaded into an SSL context
+    """
+    def __init__(self, context: rrs.ResumingSSLContext) -> None:
+        self._load_cert_chain = context.load_cert_chain
+        self.certfiles: List[Any] = []
+        # urllib3 calls this on the context it is given, when a request has a client certificate
+        setattr(context, "load_cert_chain", self.load_cert_chain)
+
+    def load_cert_chain(self, certfile: Any, *args: Any, **kwargs: Any) -> None:
+        """
+        Record the certificate, and load it
+        """
+        self.certfiles.append(certfile)
+        self._load_cert_chain(certfile, *args, **kwargs)
+
+
+class TlsClientCertScenario(metaclass=ScenarioMeta):
+    """
+    Make a request with a client certificate through a session with a shared ResumingSSLContext,
+    and verify that the certificate is not loaded into the shared context (where every other
+    connection made with it would present it), and that the context is not used for it (so that
+    none of its TLS sessions are authenticated with the certificate). The request itself does
+    not use the context, so it fails to verify the self-signed server certificate against the
+    default CA bundle. Then verify that a request without a client certificate, in another session
+    sharing the context, still uses it.
+    """
+    @classmethod
+    def run(cls, *, test_results: TestResults) -> None:
+        """
+        Run the scenario
+        """
+        logging.debug("TlsClientCertScenario: run()")
+        rr_args = rr_adapter_args()
+        rr_args["connect_timeout"] = rr_args["read_timeout"] = TLS_TIMEOUT
+        rr_args["retries"] = 0
+        server = background_server("https", concurrent=True)
+        with server as url:
+            context = rrs.create_ssl_context(server.cert_file)
+            loads = _CertChainLoads(context)
+            rr_args["ssl_context"] = context
+            with rrs.retry_session_manager(protocol="https", **rr_args) as session:
+                # Otherwise, requests replaces verify=True with REQUESTS_CA_BUNDLE, if it is set
+                session.trust_env = False
+                cert_outcome: Union[int, str]
+                try:
+                    with session.get(url, params=ok_params()._asdict(),
+                                     cert=(server.cert_file, server.key_file)) as resp:
+                        cert_outcome = resp.status_code
+                except requests.exceptions.RequestException as err:
+                    cert_outcome = type(err).__name__
+            cert_stats = context.stats()
+            with rrs.retry_session_manager(protocol="https", **rr_args) as session:
+                session.trust_env = False
+                with session.get(url, params=ok_params()._asdict()) as resp:
+                    status = resp.status_code
+            stats = context.stats()
+        logging.log(NOTICE, "TlsClientCertScenario: request with a client certificate: %s (%s); without: %d (%s); "
+                    "certificates loaded into the shared context: %s", cert_outcome, cert_stats, status, stats,
+                    loads.certfiles)
+        passed = (not loads.certfiles and cert_stats == rrs.TlsSessionStats(handshakes=0, resumed=0, sessions=0)
+                  and status == 200 and stats.handshakes == 1)
+        record_result(test_results, passed, entry="TlsClientCertScenario", args=rr_args, proto="https")
@@ -27,11 +27,15 @@ Minimal RRS module test, mainly to ensure that it is not completely broken.
 """
 
 from .server import background_server
-from .test_http_handler import DROP_SC
+from .test_http_handler import download_body, CACHE_PATH, DOWNLOAD_PATH, DROP_SC, RETRY_AFTER_PATH
 
 
 # Explicitly re-export
 __all__ = [
     "background_server",
+    "download_body",
+    "CACHE_PATH",
+    "DOWNLOAD_PATH",
     "DROP_SC",
+    "RETRY_AFTER_PATH",
 ]
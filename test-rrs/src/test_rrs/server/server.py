@@ -33,6 +33,7 @@ import logging
 import multiprocessing
 from multiprocessing.synchronize import Event
 import socket
+from socketserver import ThreadingMixIn
 import ssl
 import time
 from types import TracebackType
@@ -49,7 +50,17 @@ from test_rrs.typing_imports import Literal
 
 from .certs import CertFiles
 from .defs import CertFilePaths, SERVER_HOSTNAME
-from .test_http_handler import TestHttpHandler
+from .test_http_handler import ConcurrentHttpHandler, TestHttpHandler
+
+
+class ConcurrentHTTPServer(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server which handles each connection in its own thread.
+    (http.server.ThreadingHTTPServer does not exist in Python 3.6)
+    """
+    daemon_threads = True
+    # Allow for bursts of simultaneous connection attempts
+    request_queue_size = 128
 
 
 def get_free_port() -> int:
@@ -66,11 +77,21 @@ def get_free_port() -> int:
 def run_server(
     stop_event: Event,
     port: int,
-    certs: Union[CertFilePaths, None]
+    certs: Union[CertFilePaths, None],
+    concurrent: bool = False
 ) -> None:
-    """Run a simple HTTP server until stop_event is set."""
+    """
+    Run a simple HTTP server until stop_event is set.
+    By default the server handles one request at a time, and closes the connection
+    after each response. If concurrent is True, then the server handles every connection
+    in its own thread, and supports persistent connections.
+    """
     proto = 'http' if certs is None else 'https'
-    httpd = HTTPServer((SERVER_HOSTNAME, port), TestHttpHandler)
+    httpd: HTTPServer
+    if concurrent:
+        httpd = ConcurrentHTTPServer((SERVER_HOSTNAME, port), ConcurrentHttpHandler)
+    else:
+        httpd = HTTPServer((SERVER_HOSTNAME, port), TestHttpHandler)
     httpd.timeout = 1  # allows periodic checks of stop_event
     if certs is not None:
         # Create an ad-hoc self-signed certificate automatically
@@ -90,7 +111,8 @@ class BackgroundServerBase(AbstractContextManager[str], ABC):
     """
     Base class for context manager for a background HTTP/HTTPS server process
     """
-    def __init__(self) -> None:
+    def __init__(self, concurrent: bool = False) -> None:
+        self._concurrent = concurrent
         self._stop_event: Union[Event, None] = None
         self._server_process: Union[multiprocessing.Process, None] = None
         self._port: Union[int, None] = None
@@ -126,7 +148,8 @@ class BackgroundServerBase(AbstractContextManager[str], ABC):
                                 kwargs={
                                     "stop_event": self._stop_event,
                                     "port": self._port,
-                                    "certs": self._certs()}
+                                    "certs": self._certs(),
+                                    "concurrent": self._concurrent}
         )
         self._server_process.start()
 
@@ -171,8 +194,8 @@ class HttpsBackgroundServer(BackgroundServerBase):
     """
     Context manager for the background HTTPS server process
     """
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, concurrent: bool = False) -> None:
+        super().__init__(concurrent=concurrent)
         self._cert_files: Union[CertFilePaths, None] = None
         self._stack: ExitStack = ExitStack()
 
@@ -189,6 +212,24 @@ class HttpsBackgroundServer(BackgroundServerBase):
         """
         return self._cert_files
 
+    @property
+    def cert_file(self) -> str:
+        """
+        Return the path of the (self-signed) server certificate, which clients
+        can use as their CA bundle to verify the server
+        """
+        assert self._cert_files is not None
+        return self._cert_files.cert_file
+
+    @property
+    def key_file(self) -> str:
+        """
+        Return the path of the private key of the server certificate, which clients
+        can use (with cert_file) as a client certificate
+        """
+        assert self._cert_files is not None
+        return self._cert_files.key_file
+
     def __enter__(self) -> str:
         self._stack.__enter__()
         self._cert_files = self._stack.enter_context(CertFiles())
@@ -204,21 +245,24 @@ class HttpsBackgroundServer(BackgroundServerBase):
 
 
 @overload
-def background_server(protocol: Literal['http']) -> HttpBackgroundServer: ...
+def background_server(protocol: Literal['http'], concurrent: bool = False) -> HttpBackgroundServer: ...
 
 
 @overload
-def background_server(protocol: Literal['https']) -> HttpsBackgroundServer: ...
+def background_server(protocol: Literal['https'], concurrent: bool = False) -> HttpsBackgroundServer: ...
 
 
 def background_server(
-    protocol: RequestProtocol
+    protocol: RequestProtocol,
+    concurrent: bool = False
 ) -> Union[HttpBackgroundServer, HttpsBackgroundServer]:
     """
     Return an HttpBackgroundServer or HttpsBackgroundServer,
-    based on the specified protocol
+    based on the specified protocol.
+    If concurrent is True, the server will handle connections in parallel,
+    and will support persistent connections.
     """
     assert protocol in {'http', 'https'}
     if protocol == 'http':
-        return HttpBackgroundServer()
-    return HttpsBackgroundServer()
+        return HttpBackgroundServer(concurrent=concurrent)
+    return HttpsBackgroundServer(concurrent=concurrent)
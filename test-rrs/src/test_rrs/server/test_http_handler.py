@@ -27,14 +27,19 @@ Minimal RRS module test, mainly to ensure that it is not completely broken.
 """
 
 from collections import defaultdict
+import gzip
 from http.server import BaseHTTPRequestHandler
 import logging
+import re
+import threading
 import time
 # Because we wish to support Python versions back to 3.6, we
 # import Union, rather than using |
 from typing import (
     ClassVar,
     DefaultDict,
+    Dict,
+    Set,
     Tuple,
     Union,
 )
@@ -56,6 +61,31 @@ ReqCountDict: TypeAlias = DefaultDict[ReqCountKey, int]
 # DROP_SC is the SC that tells the server to just disconnect without response
 DROP_SC = 0
 
+# Requests to CACHE_PATH get cacheable responses, with a max-age set by their max_age
+# parameter, and any other Cache-Control directives set by their cache_control parameter
+# (see _do_cache_method), rather than the responses set by their ReqParams. Their bodies are
+# gzip-encoded if their gzip parameter is not 0.
+CACHE_PATH = "/cache"
+CACHE_ETAG = '"v1"'
+
+# The first request to RETRY_AFTER_PATH with each id gets a 503 response, with a Retry-After
+# header set by its retry_after parameter (see _do_retry_after_method); the rest get 200
+RETRY_AFTER_PATH = "/retry-after"
+
+# Requests to DOWNLOAD_PATH get a download_body of the size set by their size parameter. Each
+# response is cut off after break_after bytes (after a pause of stall seconds), and Range requests
+# are honoured if their If-Range header matches DOWNLOAD_ETAG (see _do_download_method)
+DOWNLOAD_PATH = "/download"
+DOWNLOAD_ETAG = '"download-v1"'
+_BYTE_RANGE = re.compile(r"^bytes=(\d+)-$")
+
+
+def download_body(size: int) -> bytes:
+    """
+    Return the body of a download of the specified size
+    """
+    return bytes(i % 251 for i in range(size))
+
 
 class TestHttpHandler(BaseHTTPRequestHandler):
     """
@@ -64,6 +94,10 @@ class TestHttpHandler(BaseHTTPRequestHandler):
     # Using int as the factory function means that all values will
     # default to 0
     _req_count: ClassVar[ReqCountDict] = defaultdict(int)
+    # Only needed when the handler is used by a threaded server
+    _req_count_lock: ClassVar[threading.Lock] = threading.Lock()
+    # The ids of the requests to RETRY_AFTER_PATH which have been answered with 503
+    _retry_after_ids: ClassVar[Set[str]] = set()
 
     def _extract_params_from_query(self) -> Union[None, ReqParams]:
         """
@@ -119,9 +153,11 @@ class TestHttpHandler(BaseHTTPRequestHandler):
             # path is to stop and return None
             return None  # pylint: disable=useless-return
 
-    def _send(self, sc: int, msg: Union[str, None] = None) -> None:
+    def _send(self, sc: int, msg: Union[str, None] = None, headers: Union[Dict[str, str], None] = None,
+              compress: bool = False) -> None:
         """
-        Send a response with the specified status code and (optional) message
+        Send a response with the specified status code, (optional) message, and (optional) headers.
+        304 responses have no body. If compress is True, the body is gzip-encoded.
         """
         try:
             self.send_response(sc)
@@ -129,12 +165,6 @@ class TestHttpHandler(BaseHTTPRequestHandler):
             logging.debug("%s in send_response(%d) (likely client disconnect): %s",
                           type(err).__name__, sc, err)
             return
-        try:
-            self.end_headers()
-        except (BrokenPipeError, ConnectionResetError) as err:
-            logging.debug("%s in end_headers() (likely client disconnect): %s",
-                          type(err).__name__, err)
-            return
         if sc == 200:
             prefix = "OK"
         else:
@@ -143,8 +173,23 @@ class TestHttpHandler(BaseHTTPRequestHandler):
             msg = prefix
         else:
             msg = f"{prefix}: {msg}"
+        body = b"" if sc == 304 else msg.encode()
+        if compress and body:
+            body = gzip.compress(body)
+            headers = dict(headers or {}, **{"Content-Encoding": "gzip"})
+        try:
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            # The content length is required for clients to reuse the connection,
+            # if the server is using persistent connections
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+        except (BrokenPipeError, ConnectionResetError) as err:
+            logging.debug("%s in end_headers() (likely client disconnect): %s",
+                          type(err).__name__, err)
+            return
         try:
-            self.wfile.write(msg.encode())
+            self.wfile.write(body)
         except (BrokenPipeError, ConnectionResetError) as err:
             logging.debug("%s in wfile.write(%s) (likely client disconnect): %s",
                           type(err).__name__, msg, err)
@@ -154,8 +199,9 @@ class TestHttpHandler(BaseHTTPRequestHandler):
         Parse the parameters and respond as appropriate
         """
         req_key: ReqCountKey = (method, params)
-        current_count: int = min(self._req_count[req_key], len(params.scs)-1)
-        self._req_count[req_key] += 1
+        with self._req_count_lock:
+            current_count: int = min(self._req_count[req_key], len(params.scs)-1)
+            self._req_count[req_key] += 1
 
         sc = params.scs[current_count]
         delay = params.delays[current_count]
@@ -170,13 +216,90 @@ class TestHttpHandler(BaseHTTPRequestHandler):
         # Only send a response if sc is not DROP_SC
         if sc != DROP_SC:
             self._send(sc)
+        else:
+            # Make sure the connection is dropped, even if it is a persistent one
+            self.close_connection = True
+
+    def _do_cache_method(self, method: RequestVerb) -> None:
+        """
+        Respond with a cacheable response, or (if a GET request revalidates it) with 304.
+        The body names the method and path, and the credentials of the request, if it has any.
+        """
+        query = parse_qs(urlparse(self.path).query)
+        cache_control = ", ".join([f"max-age={query.get('max_age', ['0'])[0]}"] + query.get("cache_control", []))
+        headers = {"ETag": CACHE_ETAG, "Cache-Control": cache_control}
+        if method == "GET" and self.headers.get("If-None-Match") == CACHE_ETAG:
+            self._send(304, headers=headers)
+            return
+        msg = f"{method} {self.path}"
+        for name in ("Authorization", "Cookie"):
+            if name in self.headers:
+                msg = f"{msg} {name}: {self.headers[name]}"
+        self._send(200, msg, headers, compress=query.get("gzip", ["0"])[0] != "0")
+
+    def _do_retry_after_method(self) -> None:
+        """
+        Respond with 503 and a Retry-After header, if this is the first request with its id,
+        otherwise with 200
+        """
+        query = parse_qs(urlparse(self.path).query)
+        req_id = query.get("id", [""])[0]
+        with self._req_count_lock:
+            first = req_id not in self._retry_after_ids
+            self._retry_after_ids.add(req_id)
+        if first:
+            self._send(503, headers={"Retry-After": query.get("retry_after", ["1"])[0]})
+        else:
+            self._send(200)
+
+    def _do_download_method(self) -> None:
+        """
+        Respond with (the rest of) the download body, cut off after break_after bytes (if it is not 0),
+        after sleeping for stall seconds. The ETag header is only sent if validators is not 0.
+        """
+        query = parse_qs(urlparse(self.path).query)
+        body = download_body(int(query.get("size", ["0"])[0]))
+        break_after = int(query.get("break_after", ["0"])[0])
+        stall = float(query.get("stall", ["0"])[0])
+        validators = query.get("validators", ["1"])[0] != "0"
+        start = 0
+        byte_range = _BYTE_RANGE.match(self.headers.get("Range", ""))
+        if byte_range is not None and validators and self.headers.get("If-Range") == DOWNLOAD_ETAG:
+            start = min(int(byte_range.group(1)), len(body))
+        try:
+            self.send_response(206 if start else 200)
+            if validators:
+                self.send_header("ETag", DOWNLOAD_ETAG)
+            if start:
+                self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            self.send_header("Content-Length", str(len(body) - start))
+            self.end_headers()
+            end = min(start + break_after, len(body)) if break_after else len(body)
+            self.wfile.write(body[start:end])
+            if end < len(body):
+                self.wfile.flush()
+                if stall:
+                    time.sleep(stall)
+                self.close_connection = True
+        except (BrokenPipeError, ConnectionResetError) as err:
+            logging.debug("%s in _do_download_method (likely client disconnect): %s",
+                          type(err).__name__, err)
+            self.close_connection = True
 
     def _do_method(self, method: RequestVerb) -> None:
         """
-        The method of handling _req_count is not thread-safe, but this is okay,
-        because the current implementation of the web server handles requests
-        serially.
+        Handle a request with the specified method
         """
+        path = urlparse(self.path).path
+        if path == CACHE_PATH:
+            self._do_cache_method(method)
+            return
+        if path == RETRY_AFTER_PATH:
+            self._do_retry_after_method()
+            return
+        if path == DOWNLOAD_PATH:
+            self._do_download_method()
+            return
         params = self._extract_params_from_query()
         if params is not None:
             self._actually_do_method(method, params)
@@ -192,3 +315,11 @@ class TestHttpHandler(BaseHTTPRequestHandler):
         POST request handler
         """
         self._do_method("POST")
+
+
+class ConcurrentHttpHandler(TestHttpHandler):
+    """
+    Request handler for the concurrent (threaded) test server. It uses HTTP/1.1,
+    so that clients can keep their connections open and reuse them.
+    """
+    protocol_version = "HTTP/1.1"
@@ -32,7 +32,7 @@ import logging
 # Because we wish to support Python versions back to 3.6, we
 # import things from typing that are not necessary in newer
 # Python versions
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import requests
 import requests_retry_session as rrs
@@ -52,7 +52,8 @@ from test_rrs.results import (
     RRTestOptions,
     TestResults,
 )
-from test_rrs.rrs_lib import MyRRSessionManager, rr_adapter_args
+from test_rrs.rrs_lib import AsyncSessionBridge, MyRRSessionManager, rr_adapter_args
+from test_rrs.scenarios import run_scenarios
 from test_rrs.server import background_server
 from test_rrs.test_suites import test_suites
 
@@ -106,7 +107,7 @@ def run_tests_with_method(
 
 
 def run_tests_with_session(
-    rr_session: requests.Session,
+    rr_session: Union[requests.Session, AsyncSessionBridge],
     rr_test_options: RRTestOptions,
     *,
     test_results: TestResults
@@ -137,6 +138,7 @@ def run_tests_with_rr_options(
     - The retry_session_manager function
     - The RetrySessionManager class
     - The requests_retry_session function
+    - The AsyncRetrySession class
     """
     base_rr_test_options = RRTestOptions(args=rr_args, proto=rr_proto)
     with rrs.retry_session_manager(protocol=rr_proto, **rr_args) as session:
@@ -160,6 +162,13 @@ def run_tests_with_rr_options(
             test_results=test_results,
         )
 
+    with AsyncSessionBridge(rr_proto, rr_args) as bridge:
+        run_tests_with_session(
+            bridge,
+            base_rr_test_options._replace(entry="rrs.AsyncRetrySession"),
+            test_results=test_results,
+        )
+
 
 def run_all_tests() -> TestResults:
     """
@@ -178,4 +187,6 @@ def run_all_tests() -> TestResults:
     for rr_args, rr_proto in itertools.product(rr_arg_list, rr_proto_list):
         run_tests_with_rr_options(rr_args, rr_proto, test_results)
 
+    run_scenarios(test_results)
+
     return test_results
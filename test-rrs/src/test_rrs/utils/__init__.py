@@ -26,12 +26,14 @@
 Test utility functions
 """
 
+from .log_counter import LogCounter
 from .random_id import random_id
 from .suppress_ssl_warnings import suppress_ssl_warnings
 
 
 # Explicitly re-export
 __all__ = [
+    "LogCounter",
     "random_id",
     "suppress_ssl_warnings",
 ]
@@ -0,0 +1,70 @@
+#
+# MIT License
+#
+# (C) Copyright 2026 Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+
+"""
+Test utility functions
+"""
+
+import logging
+from types import TracebackType
+# Because we wish to support Python versions back to 3.6, we
+# import things from typing that are not necessary in newer
+# Python versions
+from typing import List, Type, Union
+
+
+class LogCounter(logging.Handler):
+    """
+    Context manager which counts (and keeps) the records logged by the specified
+    logger whose messages contain the specified text. While active, the logger level is
+    lowered to DEBUG (if needed), so that the count does not depend on the
+    logging configuration.
+    """
+    def __init__(self, logger_name: str, text: str) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.count = 0
+        self.messages: List[str] = []
+        self._logger = logging.getLogger(logger_name)
+        self._text = text
+        self._saved_level = logging.NOTSET
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if self._text in message:
+            self.count += 1
+            self.messages.append(message)
+
+    def __enter__(self) -> "LogCounter":
+        self._saved_level = self._logger.level
+        self._logger.setLevel(logging.DEBUG)
+        self._logger.addHandler(self)
+        return self
+
+    def __exit__(  # pylint: disable=useless-return
+            self, exc_type: Union[Type[BaseException], None],
+            exc_val: Union[BaseException, None],
+            exc_tb: Union[TracebackType, None]) -> Union[bool, None]:
+        self._logger.removeHandler(self)
+        self._logger.setLevel(self._saved_level)
+        return None